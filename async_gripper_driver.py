@@ -0,0 +1,419 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import asyncio
+import logging
+import time
+from collections import deque
+from telemetry import TelemetryBuffer, parse_telemetry_line
+import gcl
+from gripper_driver import GripperState, parse_query_response, parse_sequence_response, build_move_command, build_grip_command, build_release_command
+from gripper_logging import LazyJoin
+from deadlines import DeadlineEstimator
+from calibration_cache import CalibrationCache
+
+logger = logging.getLogger("gripper.async_driver")
+
+
+class AsyncGripperDriver:
+    '''
+        AsyncGripperDriver is the asyncio counterpart of GripperDriver.
+
+        It exposes the same GCL command set as coroutines on top of asyncio streams, so a single
+        event loop can drive a gripper (or many of them) without dedicating a thread to each
+        blocking socket. One reader task frames the 'END'-terminated responses and resolves
+        the future of the command that is waiting for it, in the order the commands were sent.
+
+        Features:
+            - Awaitable commands (move_to, grip, release, get_pos, ...) sharing the validation of GripperDriver
+            - Single reader task per connection, no thread per gripper
+            - Pipelined link: up to max_inflight commands are in flight, responses are matched in order
+            - Reconnects on the next command after the connection was lost
+            - Per-command response deadlines learned from observed latencies (see deadlines.py)
+
+        Attributes:
+            - host (str): IP address of the gripper
+            - port (int): Port number for TCP connection
+            - timeout (int): Timeout for establishing the connection
+            - max_inflight (int): Number of commands allowed on the link at the same time
+            - deadlines (DeadlineEstimator): Response deadline policy; RESPONSE_TIMEOUT is its default timeout
+            - calibration_cache (CalibrationCache): Calibrations persisted per gripper address; False disables it
+    '''
+
+    def __init__(self, host='127.0.0.1', port=8000, timeout=5, max_inflight=32, deadlines=None, calibration_cache=None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.RESPONSE_TIMEOUT = 10.0
+        self.deadlines = deadlines if deadlines is not None else DeadlineEstimator(default_timeout=self.RESPONSE_TIMEOUT)
+        self.calibration_cache = CalibrationCache() if calibration_cache is None else calibration_cache
+        self.state = GripperState()
+        self.connected = False
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._pending = deque()
+        self.telemetry = None
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._connect_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect(self):
+        '''
+            Establish the TCP connection, start the reader task and initialize the gripper state.
+        '''
+
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            try:
+                logger.info("[INFO] Connecting to gripper at %s:%s...", self.host, self.port)
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout)
+            except (asyncio.TimeoutError, ConnectionRefusedError, OSError) as e:
+                logger.error("[E_NOT_INITIALIZED] Connection failed: %s", e)
+                return False
+            logger.info("[E_SUCCESS] Connection established.")
+            self.connected = True
+            self._reader_task = asyncio.create_task(self._read_loop(self._reader))
+
+        await self._initialize_gripperstate()
+        await self._check_calibration()
+        return True
+
+    async def _check_calibration(self):
+        '''
+            Calibrates the gripper after connecting unless it is known to be calibrated (see GripperDriver).
+        '''
+
+        if self.state.is_calibrated and self.state.max_width > self.state.min_width:
+            return
+        address = f"{self.host}:{self.port}"
+        cache = self.calibration_cache
+        if cache and cache.is_valid(address, self.state.min_width, self.state.max_width):
+            logger.info("[INFO] Using cached calibration of %s.", address)
+            self.state.is_calibrated = True
+            return
+        logger.warning("[WARNING] Gripper not calibrated. Calibrating...")
+        response = await self.calibrate()
+        self.state.is_calibrated = True
+        if response and "FIN CALIBRATE" in response:
+            await self.refresh()
+            if cache:
+                cache.store(address, self.state.min_width, self.state.max_width)
+
+    async def close(self):
+        '''
+            Closes the connection without announcing it to the gripper.
+        '''
+
+        self.connected = False
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+
+    async def _initialize_gripperstate(self):
+        '''
+            Initializes the state of the gripper.
+        '''
+
+        response = await self._request("STATUS")
+        try:
+            logger.info("[INFO] Default values of Width, Speed, Torque, Min Width and Max Width are read.")
+            self.state.update_from_status(response[0])
+        except Exception:
+            logger.error("[E_CMD_FAILED]. Try reconnecting...")
+
+    async def _read_loop(self, reader):
+        '''
+            Reads lines until 'END' and hands the collected lines to the oldest pending command.
+        '''
+
+        response_lines = []
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", errors="replace").strip()
+                if line.startswith("TELEMETRY "):
+                    self._store_telemetry(line)
+                elif line == "END":
+                    if self._pending:
+                        future = self._pending.popleft()
+                        if not future.done():
+                            future.set_result(response_lines)
+                    response_lines = []
+                elif line:
+                    response_lines.append(line)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._connection_lost()
+
+    def _store_telemetry(self, line):
+        '''
+            Appends one AUTOSEND telemetry line to the ring buffer; malformed lines are logged and skipped.
+        '''
+
+        if self.telemetry is None:
+            return
+        try:
+            sample = parse_telemetry_line(line)
+        except ValueError:
+            logger.warning("[WARNING] Skipping malformed telemetry line: %s", line)
+            return
+        self.telemetry.append(time.monotonic(), *sample)
+
+    def _connection_lost(self):
+        '''
+            Marks the link as down and fails every command still waiting for a response.
+        '''
+
+        if self.connected:
+            logger.error("[E_NOT_INITIALIZED] Lost connection to gripper.")
+        self.connected = False
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(ConnectionError("Connection to gripper lost"))
+
+    async def _request(self, cmd):
+        '''
+            Sends a command and waits until its deadline for the complete response.
+            Returns the response lines, or None on timeout or connection loss. The gripper answers
+            the commands of a connection in order, so the deadline only starts once the command
+            ahead of this one completed or missed its own deadline.
+        '''
+
+        if not self.connected and not await self.connect():
+            return None
+        deadline = self.deadlines.estimate(cmd, self.state)
+        async with self._inflight:
+            future = asyncio.get_running_loop().create_future()
+            previous = self._pending[-1] if self._pending else None
+            self._pending.append(future)
+            self.state.invalidate_for(cmd)
+            sent_at = time.monotonic()
+            try:
+                self._writer.write(f"{cmd}\n".encode("utf-8"))
+                await self._writer.drain()
+                logger.debug("[COMMAND] Sent: %s", cmd, extra={"command": cmd})
+            except (ConnectionError, OSError):
+                logger.error("[E_NOT_INITIALIZED] Lost connection while sending.", extra={"command": cmd})
+                self._connection_lost()
+                return None
+            started = sent_at
+            if previous is not None and not previous.done():
+                try:
+                    await asyncio.wait([previous])  # a timed-out command's future is cancelled, which also ends this wait
+                except asyncio.CancelledError:
+                    future.cancel()  # so commands queued behind this one do not wait for it
+                    raise
+                started = time.monotonic()
+            try:
+                response_lines = await asyncio.wait_for(future, deadline.timeout)
+            except asyncio.TimeoutError:
+                logger.warning("[E_TIMEOUT] No complete response to %s within %.3g s", cmd, deadline.timeout, extra={"command": cmd})
+                return None
+            except ConnectionError:
+                return None
+        if not (response_lines and response_lines[-1].startswith(("ABORT", "ERROR"))):
+            self.deadlines.observe(deadline, time.monotonic() - started)
+        logger.debug("[E_SUCCESS] Received: %s", LazyJoin(response_lines), extra={"command": cmd})
+        return response_lines
+
+    async def _query(self, cmd, field, max_age=None):
+        '''
+            Sends a query command (e.g. POS?) and caches the returned value in the state.
+            If the cached value is not older than `max_age` seconds, no command is sent.
+        '''
+
+        if self.state.is_fresh(field, max_age):
+            return self.state.cached_response(cmd[:-1], field)
+        since = {field: self.state.generation[field]}
+        response = await self._request(cmd)
+        if not response:
+            return None
+        try:
+            value = parse_query_response(response[0])
+            text = {field: response[0].split("=", 1)[1].strip()}
+            self.state.update(since=since, text=text, **{field: int(value) if field == "gripstate" else value})
+        except (IndexError, ValueError):
+            pass
+        return response[0]
+
+    async def refresh(self):
+        '''
+            Refreshes every field of the state with a single STATUS round trip.
+        '''
+
+        since = dict(self.state.generation)
+        response = await self._request("STATUS")
+        if response:
+            try:
+                self.state.update_from_status(response[0], since)
+            except (IndexError, ValueError):
+                logger.error("[E_CMD_FAILED] Unexpected response to STATUS: %s", LazyJoin(response), extra={"command": "STATUS"})
+        return self.state
+
+    async def start_telemetry(self, rate_hz, capacity=4096):
+        '''
+            Subscribes to position, speed and force pushed by the gripper at `rate_hz` into `self.telemetry`.
+        '''
+
+        if self.telemetry is None or self.telemetry.capacity != capacity:
+            self.telemetry = TelemetryBuffer(capacity)
+        return await self._request(f"AUTOSEND({rate_hz})")
+
+    async def stop_telemetry(self):
+        '''
+            Stops the telemetry stream. Samples already received stay in `self.telemetry`.
+        '''
+
+        return await self._request("AUTOSEND(0)")
+
+    async def command(self, cmd):
+        '''
+            Sends a raw GCL command (e.g. 'CALIBRATE' or 'MOVE(20.0,500.0)') and returns its response lines.
+        '''
+
+        return await self._request(cmd)
+
+    async def disconnect(self):
+        '''
+            Disconnects the client from the gripper.
+        '''
+
+        if self.connected:
+            await self._request("BYE")
+            await self.close()
+            logger.info("[E_SUCCESS] Disconnected from gripper")
+
+    async def stop(self):
+        '''
+            Returns the gripper to the IDLE state.
+        '''
+
+        response = await self._request("STOP")
+        if response is not None:
+            logger.info("[E_SUCCESS] Returned to IDLE state.", extra={"gripstate": 0})
+        return response
+
+    async def move_to(self, command):
+        '''
+            Command the gripper to move to a specified width and speed.
+        '''
+
+        gcl_command = build_move_command(command, self.state)
+        if gcl_command is None:
+            return None
+        response = await self._request(gcl_command)
+        if response and response[-1] == "FIN MOVE":
+            # the fingers stopped at the target, so the next move's deadline can use it
+            self.state.update(width_mm=gcl.parse(gcl_command).args.width)
+        return response
+
+    async def grip(self, command):
+        '''
+            Executes grip action at the current gripper position.
+        '''
+
+        gcl_command = build_grip_command(command)
+        if gcl_command is None:
+            return None
+        return await self._request(gcl_command)
+
+    async def release(self, command):
+        '''
+            Releases the part gripped by the gripper.
+        '''
+
+        gcl_command = build_release_command(command)
+        if gcl_command is None:
+            return None
+        return await self._request(gcl_command)
+
+    async def run_cycle(self, steps):
+        '''
+            Runs a pick cycle as one GCL 'SEQ' command; see GripperDriver.run_cycle.
+        '''
+
+        try:
+            sequence = gcl.sequence(*steps)
+        except gcl.GclError as e:
+            logger.error("[E_NOT_ENOUGH_PARAMS] Invalid cycle: %s", e)
+            return None
+        for step in sequence.args:
+            if step.name == "MOVE" and build_move_command(step, self.state) is None:
+                return None
+        response = await self._request(str(sequence))
+        return parse_sequence_response(response) if response else None
+
+    async def calibrate(self):
+        '''
+            Calibrates the gripper to default min and max width.
+        '''
+
+        return await self._request("CALIBRATE")
+
+    async def get_pos(self, max_age=None):
+        '''
+            Returns the current position of the gripper.
+        '''
+
+        return await self._query("POS?", "width_mm", max_age)
+
+    async def get_speed(self, max_age=None):
+        '''
+            Returns the current speed of the gripper.
+        '''
+
+        return await self._query("SPEED?", "speed", max_age)
+
+    async def get_force(self, max_age=None):
+        '''
+            Returns the torque of the gripper.
+        '''
+
+        return await self._query("FORCE?", "torque", max_age)
+
+    async def get_gripstate(self, max_age=None):
+        '''
+            Returns the current state of the gripper as per the State Flow Diagram.
+        '''
+
+        return await self._query("GRIPSTATE?", "gripstate", max_age)
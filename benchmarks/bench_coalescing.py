@@ -0,0 +1,75 @@
+'''
+    Duplicate query traffic with and without single-flight coalescing in GripperDriver.
+
+    `--threads` threads (e.g. arm planner, GUI, vision) share one driver and poll `get_pos()`
+    `--calls` times each. Without coalescing every call is a `POS?` on the wire; with it, callers
+    that ask while a `POS?` is in flight share its response. The link runs through a FaultProxy
+    that adds `--latency` seconds per direction, like a field bus.
+
+    Run from the repository root: `python benchmarks/bench_coalescing.py [--threads 8] [--calls 500] [--latency 0.0005]`
+'''
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fault_proxy import FaultProxy
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+
+def start(target):
+    threading.Thread(target=target.start, daemon=True).start()
+    target.ready.wait(5)
+
+
+def burst(port, threads, calls, coalesce):
+    driver = GripperDriver(port=port, coalesce=coalesce, calibration_cache=False)
+    before = driver.metrics.snapshot()["counters"]["commands"]
+    barrier = threading.Barrier(threads + 1)
+
+    def poll():
+        barrier.wait()
+        for _ in range(calls):
+            if driver.get_pos() is None:
+                raise RuntimeError("Query failed")
+
+    workers = [threading.Thread(target=poll) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    begin = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - begin
+    sent = driver.metrics.snapshot()["counters"]["commands"] - before
+    driver.close()
+    return threads * calls / elapsed, sent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0005, help="Seconds added per direction by the proxy")
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    server = MockServer(port=0, clock=VirtualClock())
+    start(server)
+    proxy = FaultProxy(server.port)
+    start(proxy)
+    proxy.latency = args.latency
+
+    print(f"{args.threads} threads x {args.calls} get_pos() calls")
+    print(f"{'':<18}{'calls/s':>12}{'POS? sent':>12}")
+    for label, coalesce in (("per call", False), ("coalesced", True)):
+        rate, sent = burst(proxy.port, args.threads, args.calls, coalesce)
+        print(f"{label:<18}{rate:>12,.0f}{sent:>12,}")
+    proxy.stop()
+    server.stop()
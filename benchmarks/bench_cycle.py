@@ -0,0 +1,65 @@
+'''
+    Picks per hour with one driver call per step versus one 'SEQ' macro per pick cycle.
+
+    A pick cycle is MOVE(pre-grasp) -> GRIP -> RELEASE -> MOVE(home). Step by step, every command
+    is a blocking round trip; with `run_cycle` the whole cycle is sent as one command and the
+    gripper streams the per-step results back.
+
+    Motion runs on a virtual clock by default, so the numbers show the round-trip and parsing
+    overhead per pick; `--speedup` simulates (accelerated) motion time as well.
+
+    Run from the repository root: `python benchmarks/bench_cycle.py [--cycles 2000] [--speedup 100]`
+'''
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, RealClock, VirtualClock
+
+CYCLE = ["move(30, 500)", "grip(5, 25, 500)", "release(10, 500)", "move(110, 500)"]
+
+
+def step_by_step(driver):
+    driver.move_to(CYCLE[0])
+    driver.grip(CYCLE[1])
+    driver.release(CYCLE[2])
+    driver.move_to(CYCLE[3])
+
+
+def macro(driver):
+    driver.run_cycle(CYCLE)
+
+
+def picks_per_hour(run, cycles, clock_factory):
+    server = MockServer(port=0, clock=clock_factory())
+    threading.Thread(target=server.start, daemon=True).start()
+    server.ready.wait(5)
+    driver = GripperDriver(port=server.port, calibration_cache=False)
+    start = time.perf_counter()
+    for _ in range(cycles):
+        run(driver)
+    elapsed = time.perf_counter() - start
+    driver.close()
+    server.stop()
+    return cycles / elapsed * 3600
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--speedup", type=float, default=None, help="Simulate motion on a real clock accelerated by this factor")
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    clock_factory = VirtualClock if args.speedup is None else (lambda: RealClock(args.speedup))
+    separate = picks_per_hour(step_by_step, args.cycles, clock_factory)
+    sequence = picks_per_hour(macro, args.cycles, clock_factory)
+    print(f"{'(picks/hour)':<28}{'step by step':>16}{'SEQ macro':>16}")
+    print(f"{'4-step pick cycle':<28}{separate:>16,.0f}{sequence:>16,.0f}")
@@ -0,0 +1,126 @@
+'''
+    Time-to-detect and time-to-recover of GripperDriver under injected link faults.
+
+    The driver talks to an in-process MockServer through a FaultProxy (fault_proxy.py) and polls
+    `POS?` back-to-back. For every run one fault is injected at a known instant:
+
+        latency     50 ms added to every chunk in both directions
+        jitter      5 ms plus up to 20 ms random delay per chunk
+        fragments   responses split into 1-byte segments
+        stall       the link stops mid-response but stays open (half-open connection)
+        reset       every link is aborted with a TCP reset
+        power cycle the gripper drops all links, is off for --off seconds and comes back uncalibrated
+
+    time-to-detect is the time from the fault to the first failed query (a fault the driver rides
+    through has none); time-to-recover is the time to the first correct answer after the fault.
+    Runs that do not recover within --give-up seconds are counted as lost.
+
+    Run from the repository root: `python benchmarks/bench_faults.py [--runs 20] [--watchdog 0.5] [--off 0.1]`
+'''
+
+import argparse
+import logging
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fault_proxy import FaultProxy
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+
+def latency(proxy, server, args):
+    proxy.latency = 0.05
+
+
+def jitter(proxy, server, args):
+    proxy.latency, proxy.jitter = 0.005, 0.02
+
+
+def fragments(proxy, server, args):
+    proxy.segment_size = 1
+
+
+def stall(proxy, server, args):
+    proxy.stall()
+
+
+def reset(proxy, server, args):
+    proxy.reset()
+
+
+def power_cycle(proxy, server, args):
+    server.power_cycle(args.off)
+
+
+FAULTS = {"latency": latency, "jitter": jitter, "fragments": fragments, "stall": stall, "reset": reset, "power cycle": power_cycle}
+
+
+def start(target):
+    threading.Thread(target=target.start, daemon=True).start()
+    if not target.ready.wait(5):
+        raise RuntimeError(f"{type(target).__name__} did not start")
+
+
+def measure(inject, args):
+    server = MockServer(port=0, clock=VirtualClock())
+    start(server)
+    proxy = FaultProxy(server.port, seed=0)
+    start(proxy)
+    driver = GripperDriver(port=proxy.port, watchdog=args.watchdog or None, calibration_cache=False)
+    detect, recover, lost = [], [], 0
+    for _ in range(args.runs):
+        ready = time.perf_counter()
+        while driver.get_pos() is None:
+            if time.perf_counter() - ready > 5:
+                raise RuntimeError("Driver is not ready")
+        injected = time.perf_counter()
+        inject(proxy, server, args)
+        detected = None
+        while time.perf_counter() - injected < args.give_up:
+            if driver.get_pos() is not None:
+                recover.append(time.perf_counter() - injected)
+                break
+            if detected is None:
+                detected = time.perf_counter() - injected
+        else:
+            lost += 1
+            proxy.reset()  # without the watchdog a stalled link never comes back by itself
+        if detected is not None:
+            detect.append(detected)
+        proxy.clear()
+        server.ready.wait(5)
+    driver.close()
+    proxy.stop()
+    server.stop()
+    return detect, recover, lost
+
+
+def summary(values):
+    if not values:
+        return f"{'-':>9}{'-':>9}{'-':>9}"
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, math.ceil(0.95 * len(values)) - 1)]  # nearest rank
+    return f"{statistics.median(values) * 1000:>9.1f}{p95 * 1000:>9.1f}{values[-1] * 1000:>9.1f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--watchdog", type=float, default=0.5, help="Watchdog bound in seconds, 0 disables the watchdog")
+    parser.add_argument("--off", type=float, default=0.1, help="Seconds the gripper stays off in a power cycle")
+    parser.add_argument("--give-up", type=float, default=5.0, help="Seconds after which a run counts as lost")
+    parser.add_argument("--faults", nargs="*", default=list(FAULTS), choices=list(FAULTS))
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    print(f"{'':<14}{'time-to-detect (ms)':^27}{'time-to-recover (ms)':^27}")
+    print(f"{'fault':<14}{'median':>9}{'p95':>9}{'max':>9}{'median':>9}{'p95':>9}{'max':>9}{'lost':>7}")
+    for name in args.faults:
+        detect, recover, lost = measure(FAULTS[name], args)
+        print(f"{name:<14}{summary(detect)}{summary(recover)}{lost:>7}")
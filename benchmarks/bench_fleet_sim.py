@@ -0,0 +1,139 @@
+'''
+    Plant-scale simulation: FleetSimulator (NumPy state, one tick loop) versus one MockServer per gripper.
+
+    Part 1 times one motion update of N moving grippers: the vectorized `FleetSimulator.advance`
+    against interpolating N scalar Motion objects in a Python loop.
+
+    Part 2 runs a plant of N grippers at real time in one process: the grippers are served from
+    one thread, and an asyncio client (one connection per gripper, also in this process) moves every
+    gripper back and forth for `--duration` seconds. It reports how late the FIN MOVE answers are
+    compared to the simulated travel time, plus the process CPU load. The baseline serves N
+    scalar MockServers on one event loop, where every motion is its own timer task.
+
+    Requires numpy. Run from the repository root:
+        `python benchmarks/bench_fleet_sim.py [--grippers 200] [--duration 5] [--tick 0.005]`
+'''
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fleet_sim import FleetSimulator
+from gripper_sim import MockServer, Motion, RealClock
+
+STROKE = (30.0, 110.0)  # mm
+TRAVEL = (STROKE[1] - STROKE[0]) / 500.0 * 10  # seconds per move at 500 mm/s in the MockServer motion model
+
+
+class ScalarPlant:
+    '''
+        N independent MockServers served from one event loop.
+    '''
+
+    def __init__(self, count, clock):
+        self.grippers = [MockServer(port=0, clock=clock) for _ in range(count)]
+        self.ready = threading.Event()
+        self._loop = None
+        self._stopping = None
+
+    @property
+    def ports(self):
+        return [gripper.port for gripper in self.grippers]
+
+    async def serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        servers = [self._loop.create_task(gripper.serve()) for gripper in self.grippers]
+        while not all(gripper.ready.is_set() for gripper in self.grippers):
+            await asyncio.sleep(0.001)
+        self.ready.set()
+        await self._stopping.wait()
+        for gripper in self.grippers:
+            gripper._stopping.set()
+        await asyncio.gather(*servers, return_exceptions=True)
+
+    def start(self):
+        asyncio.run(self.serve())
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._stopping.set)
+
+
+def tick_cost(count, repeat=200):
+    fleet = FleetSimulator(count, clock=RealClock())
+    fleet.moving[:] = True
+    fleet.start_width[:], fleet.target_width[:], fleet.duration[:] = 110.0, 10.0, 1e9
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fleet.advance()
+    vectorized = (time.perf_counter() - start) / repeat
+
+    async def scalar():
+        motions = [Motion(fleet.clock, 110.0, 10.0, 1e9) for _ in range(count)]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for motion in motions:
+                motion.position()
+        return (time.perf_counter() - start) / repeat
+
+    return vectorized, asyncio.run(scalar())
+
+
+async def drive(port, until, lateness):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    width = STROKE[0]
+    while time.perf_counter() < until:
+        sent = time.perf_counter()
+        writer.write(f"MOVE({width},500.0)\n".encode())
+        while (await reader.readline()) != b"END\n":
+            pass
+        lateness.append(time.perf_counter() - sent - TRAVEL)
+        width = STROKE[1] if width == STROKE[0] else STROKE[0]
+    writer.close()
+
+
+async def load(ports, duration):
+    lateness = []
+    until = time.perf_counter() + duration
+    await asyncio.gather(*(drive(port, until, lateness) for port in ports))
+    return lateness
+
+
+def plant(simulator, duration):
+    threading.Thread(target=simulator.start, daemon=True).start()
+    simulator.ready.wait(30)
+    cpu, wall = time.process_time(), time.perf_counter()
+    lateness = sorted(asyncio.run(load(simulator.ports, duration)))
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    simulator.stop()
+    return lateness, cpu / wall
+
+
+def summary(lateness, load):
+    p = lambda q: lateness[int(q * (len(lateness) - 1))] * 1000
+    return f"{len(lateness):>8}{p(0.5):>10.1f}{p(0.99):>10.1f}{load * 100:>9.0f}%"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grippers", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--tick", type=float, default=0.005, help="Simulated seconds between motion updates")
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    print(f"{'(us per motion update)':<26}{'N':>8}{'vectorized':>12}{'scalar':>12}")
+    for count in (10, 100, 1000, 10000):
+        vectorized, scalar = tick_cost(count)
+        print(f"{'':<26}{count:>8}{vectorized * 1e6:>12.1f}{scalar * 1e6:>12.1f}")
+
+    print(f"\n{args.grippers} grippers at real time for {args.duration:g} s")
+    print(f"{'(FIN MOVE lateness, ms)':<26}{'moves':>8}{'p50':>10}{'p99':>10}{'CPU':>10}")
+    print(f"{'FleetSimulator':<26}{summary(*plant(FleetSimulator(args.grippers, tick=args.tick), args.duration))}")
+    print(f"{'MockServer per gripper':<26}{summary(*plant(ScalarPlant(args.grippers, RealClock()), args.duration))}")
@@ -0,0 +1,103 @@
+'''
+    Micro-benchmark of response framing: the original str-based framing of
+    GripperDriver._receive_response against the bytes-level LineFramer.
+
+    Run from the repository root: `python benchmarks/bench_framing.py`
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from framing import LineFramer
+
+
+class ChunkSocket:
+    '''
+        Socket stand-in that returns a fixed list of chunks through recv/recv_into.
+    '''
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.index = 0
+
+    def recv(self, size):
+        if self.index == len(self.chunks):
+            return b""
+        chunk = self.chunks[self.index]
+        if len(chunk) > size:
+            self.chunks[self.index] = chunk[size:]
+            return chunk[:size]
+        self.index += 1
+        return chunk
+
+    def recv_into(self, view):
+        chunk = self.recv(len(view))
+        n = len(chunk)
+        view[:n] = chunk
+        return n
+
+
+def str_framing(sock):
+    '''
+        Line framing as originally done in _receive_response: decode every chunk and split a growing str.
+    '''
+
+    lines = 0
+    buffer = ""
+    while True:
+        chunk = sock.recv(1024).decode("utf-8")
+        if not chunk:
+            break
+        buffer += chunk
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            line = line.strip()
+            lines += 1
+    return lines
+
+
+def bytes_framing(sock):
+    '''
+        Line framing with LineFramer.
+    '''
+
+    lines = 0
+    framer = LineFramer()
+    while framer.recv_into(sock):
+        for line in framer.lines():
+            lines += 1
+    return lines
+
+
+def make_stream(responses, lines_per_response):
+    body = b"".join(b"TELEMETRY 109.5,550.0,5.0\n" for _ in range(lines_per_response)) + b"END\n"
+    return body * responses
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def run(name, framing, chunks, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        sock = ChunkSocket(list(chunks))
+        start = time.perf_counter()
+        lines = framing(sock)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {lines:>8} lines {best * 1e3:>9.2f} ms {lines / best / 1e6:>8.2f} Mlines/s")
+
+
+if __name__ == "__main__":
+    scenarios = {
+        "multi-line, 1 KiB chunks": chunked(make_stream(200, 50), 1024),
+        "multi-line, one large chunk": [make_stream(200, 50)],
+        "fragmented, 7 byte chunks": chunked(make_stream(50, 10), 7),
+    }
+    for scenario, chunks in scenarios.items():
+        print(f"--- {scenario}")
+        run("str split (baseline)", str_framing, chunks)
+        run("bytearray + memoryview (LineFramer)", bytes_framing, chunks)
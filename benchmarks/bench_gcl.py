@@ -0,0 +1,78 @@
+'''
+    Parse throughput of the shared GCL grammar versus the previous ad-hoc patterns.
+
+    The previous parsing ran an uncompiled `re.match` per command type behind an if/elif chain
+    of `startswith` checks (as in the old MockServer.process_command). `gcl.parse` runs one
+    precompiled grammar, dispatches on the command name with a dict and caches parsed strings;
+    it is measured both on unique strings (cache misses) and on a repeating command mix.
+
+    Run from the repository root: `python benchmarks/bench_gcl.py [--count 200000]`
+'''
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gcl
+
+QUERIES = {"STATUS", "POS?", "SPEED?", "FORCE?", "GRIPSTATE?"}
+
+
+def legacy_parse(command):
+    if command in QUERIES:
+        return command, ()
+    elif command.startswith("MOVE"):
+        match = re.match(r"MOVE\(\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)", command)
+        speed = float(match.group(2)) if match.group(2) is not None else None
+        return "MOVE", (float(match.group(1)), speed)
+    elif command == "CALIBRATE":
+        return command, ()
+    elif command.startswith("GRIP"):
+        match = re.match(r"GRIP(?:\(\s*((?:\d*\.?\d+\s*(?:,\s*\d*\.?\d+\s*)*)?)\))?$", command)
+        arg_str = match.group(1)
+        return "GRIP", tuple(float(x.strip()) for x in arg_str.split(",")) if arg_str else ()
+    elif command.startswith("RELEASE"):
+        match = re.match(r"release(?:\(\s*(?:(\d*\.?\d+)(?:\s*,\s*(\d*\.?\d+))?)?\s*\))?$", command, re.IGNORECASE)
+        return "RELEASE", tuple(float(v) for v in match.groups() if v is not None)
+    raise ValueError(command)
+
+
+def make_commands(count, unique):
+    commands = []
+    for i in range(count):
+        width = round(i * 0.001, 3) if unique else 20.0
+        commands.append(random.choice([
+            f"MOVE({width},500.0)",
+            f"GRIP(5.0,{width},500.0)",
+            f"RELEASE({width},500.0)",
+            "POS?",
+            "GRIPSTATE?",
+        ]))
+    return commands
+
+
+def rate(parse, commands):
+    start = time.perf_counter()
+    for command in commands:
+        parse(command)
+    return len(commands) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    unique = make_commands(args.count, unique=True)
+    repeated = make_commands(args.count, unique=False)
+    gcl_uncached = gcl.parse.__wrapped__
+
+    print(f"{'(commands/s)':<22}{'legacy':>14}{'gcl':>14}{'gcl cached':>14}")
+    print(f"{'varying arguments':<22}{rate(legacy_parse, unique):>14,.0f}{rate(gcl_uncached, unique):>14,.0f}{rate(gcl.parse, unique):>14,.0f}")
+    print(f"{'repeating mix':<22}{rate(legacy_parse, repeated):>14,.0f}{rate(gcl_uncached, repeated):>14,.0f}{rate(gcl.parse, repeated):>14,.0f}")
@@ -0,0 +1,119 @@
+'''
+    Messages per second for the text GCL protocol versus binary WSG frames.
+
+    Starts a MockServer in-process and pipelines query commands over one connection in
+    batches, counting complete responses. Also measures the pure encode/decode cost of a
+    MOVE command in both representations.
+
+    Run from the repository root: `python benchmarks/bench_protocol.py [--port 8101] [--count 20000]`
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import wsg_codec
+from framing import LineFramer
+from gripper_sim import MockServer
+
+
+def connect(port):
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            conn = socket.create_connection(("127.0.0.1", port))
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return conn
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def text_queries(port, count, batch):
+    conn = connect(port)
+    framer = LineFramer()
+    request = b"POS?\n" * batch
+    start = time.perf_counter()
+    for _ in range(count // batch):
+        conn.sendall(request)
+        ends = 0
+        while ends < batch:
+            framer.recv_into(conn)
+            for line in framer.lines():
+                if line == "END":
+                    ends += 1
+                else:
+                    float(line.split("=", 1)[1])
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return count / elapsed
+
+
+def binary_queries(port, count, batch):
+    conn = connect(port)
+    conn.sendall(b"PROTOCOL(BINARY)\n")
+    response = b""
+    while not response.endswith(b"END\n"):
+        response += conn.recv(64)
+    decoder = wsg_codec.FrameDecoder()
+    request = wsg_codec.encode_command("POS?") * batch
+    start = time.perf_counter()
+    for _ in range(count // batch):
+        conn.sendall(request)
+        done = 0
+        while done < batch:
+            for command_id, payload in decoder.feed(conn.recv(65536)):
+                wsg_codec.decode_response(command_id, payload)
+                done += 1
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return count / elapsed
+
+
+def codec_cost(count):
+    pattern = re.compile(r"MOVE\(\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)")
+    start = time.perf_counter()
+    for _ in range(count):
+        line = f"MOVE({20.0},{500.0})\n".encode()
+        match = pattern.match(line.decode().strip())
+        float(match.group(1)), float(match.group(2))
+    text = count / (time.perf_counter() - start)
+
+    decoder = wsg_codec.FrameDecoder()
+    start = time.perf_counter()
+    for _ in range(count):
+        for frame in decoder.feed(wsg_codec.encode_command("MOVE", (20.0, 500.0))):
+            wsg_codec.decode_args(*frame)
+    binary = count / (time.perf_counter() - start)
+    return text, binary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    server = MockServer(port=args.port)
+    with contextlib.redirect_stdout(io.StringIO()):
+        threading.Thread(target=server.start, daemon=True).start()
+        text_rate = text_queries(args.port, args.count, args.batch)
+        binary_rate = binary_queries(args.port, args.count, args.batch)
+    text_codec, binary_codec = codec_cost(args.count)
+
+    print(f"{'':<28}{'text':>14}{'binary':>14}")
+    print(f"{'POS? round trips (msg/s)':<28}{text_rate:>14,.0f}{binary_rate:>14,.0f}")
+    print(f"{'MOVE encode+decode (msg/s)':<28}{text_codec:>14,.0f}{binary_codec:>14,.0f}")
+    text_request, text_result = b"POS?\n", b"POS=110.0\nEND\n"
+    print(f"{'POS? request size (bytes)':<28}{len(text_request):>14}{len(wsg_codec.encode_command('POS?')):>14}")
+    print(f"{'POS? result size (bytes)':<28}{len(text_result):>14}{len(wsg_codec.encode_result('POS', 110.0)):>14}")
@@ -0,0 +1,77 @@
+'''
+    Overhead of recording a session with recorder.Recorder on the command path.
+
+    Measures pipelined POS? round trips per second against an in-process MockServer with and
+    without a Recorder attached to the driver, and the cost of packing a single record.
+    Both cases use their own driver on the same server and are measured alternately, `--repeats`
+    times each after a warmup round, so neither profits from running second; medians are reported.
+
+    Run from the repository root: `python benchmarks/bench_recorder.py [--count 4000] [--repeats 41]`
+'''
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import recorder
+from gripper_driver import GripperDriver, GripperState
+from gripper_sim import MockServer, VirtualClock
+
+BATCH = 50
+
+
+def round_trips(driver, count):
+    start = time.perf_counter()
+    for _ in range(count // BATCH):
+        driver.pipeline(["POS?"] * BATCH)
+    return count // BATCH * BATCH / (time.perf_counter() - start)
+
+
+def pack_cost(count):
+    session = recorder.Recorder(os.path.join(tempfile.mkdtemp(), "pack.grec"))
+    state = GripperState()
+    start = time.perf_counter()
+    for i in range(count):
+        session.record(recorder.RESPONSE, i, "POS=110.0", state)
+    elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed / count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=4000)
+    parser.add_argument("--repeats", type=int, default=41)
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    server.ready.wait(5)
+    plain_driver = GripperDriver(port=server.port, calibration_cache=False)
+    recorded_driver = GripperDriver(port=server.port, calibration_cache=False)
+    plain, recorded = [], []
+    with recorder.Recorder(os.path.join(tempfile.mkdtemp(), "session.grec")) as session:
+        session.attach(recorded_driver)
+        round_trips(plain_driver, args.count // 4)  # warmup
+        round_trips(recorded_driver, args.count // 4)
+        for i in range(args.repeats):
+            # alternate which case runs first
+            order = [(plain, plain_driver), (recorded, recorded_driver)]
+            for rates, driver in (order if i % 2 == 0 else order[::-1]):
+                rates.append(round_trips(driver, args.count))
+    plain_driver.close()
+    recorded_driver.close()
+    server.stop()
+
+    plain, recorded = statistics.median(plain), statistics.median(recorded)
+    print(f"{'(POS? round trips/s, median)':<30}{'plain':>12}{'recorded':>12}{'overhead':>12}")
+    print(f"{'pipelined, batch of 50':<30}{plain:>12,.0f}{recorded:>12,.0f}{(plain / recorded - 1) * 100:>11.1f}%")
+    print(f"packing one record: {pack_cost(args.count) * 1e6:.2f} us")
@@ -0,0 +1,70 @@
+'''
+    Time-to-recover of GripperDriver after a simulated power blip.
+
+    Repeatedly stops the in-process MockServer (which drops every connection), keeps the
+    gripper "off" for `--blip` seconds, starts a fresh server on the same port and measures how
+    long the driver needs to reconnect and resync its state once the gripper is back.
+
+    Run from the repository root: `python benchmarks/bench_recovery.py [--port 8102] [--runs 20] [--blip 0.05]`
+'''
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+
+def start_server(port):
+    server = MockServer(port=port, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    server.ready.wait(5)
+    return server
+
+
+def measure(port, runs, blip):
+    server = start_server(port)
+    driver = GripperDriver(port=port, calibration_cache=False)
+    after_power_on, outage = [], []
+    for _ in range(runs):
+        power_off = time.perf_counter()
+        server.stop()
+        while driver.connected:
+            time.sleep(0.0005)
+        time.sleep(blip)
+        server = start_server(port)
+        power_on = time.perf_counter()
+        if not driver._reconnector.wait(10) or driver.get_pos() is None:
+            raise RuntimeError("Driver did not recover")
+        recovered = time.perf_counter()
+        after_power_on.append(recovered - power_on)
+        outage.append(recovered - power_off)
+    driver.close()
+    server.stop()
+    return after_power_on, outage
+
+
+def summary(values):
+    values = sorted(values)
+    return f"{statistics.median(values) * 1000:>10.1f}{values[int(0.95 * (len(values) - 1))] * 1000:>10.1f}{values[-1] * 1000:>10.1f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8102)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--blip", type=float, default=0.05, help="Seconds the gripper stays off")
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    after_power_on, outage = measure(args.port, args.runs, args.blip)
+    print(f"{'(ms)':<34}{'median':>10}{'p95':>10}{'max':>10}")
+    print(f"{'power on -> first POS? answered':<34}{summary(after_power_on)}")
+    print(f"{'power off -> first POS? answered':<34}{summary(outage)}")
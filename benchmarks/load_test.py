@@ -0,0 +1,157 @@
+'''
+    Load generation and latency benchmark for GripperDriver against MockServer.
+
+    Starts one simulated gripper per client in-process (each cell has its own gripper state),
+    drives them concurrently with one GripperDriver per thread through a command mix for a fixed
+    duration and prints throughput plus p50/p95/p99 latency per command type as JSON.
+
+    Mixes:
+        - queries: POS?, SPEED?, FORCE?, GRIPSTATE? and STATUS round trips
+        - cycle:   pick cycles MOVE -> GRIP -> RELEASE
+        - mixed:   one pick cycle followed by a batch of queries
+
+    Motion runs on a virtual clock by default, so the numbers measure the driver and the link
+    rather than simulated travel time; pass `--speedup` to include (accelerated) motion time.
+
+    Run from the repository root:
+        `python benchmarks/load_test.py [--clients 8] [--duration 5] [--mix mixed] [--output result.json]`
+'''
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, RealClock, VirtualClock
+
+QUERIES = [
+    ("POS?", lambda driver: driver.get_pos()),
+    ("SPEED?", lambda driver: driver.get_speed()),
+    ("FORCE?", lambda driver: driver.get_force()),
+    ("GRIPSTATE?", lambda driver: driver.get_gripstate()),
+    ("STATUS", lambda driver: driver._receive_response() if driver._send_command("STATUS") else None),
+]
+
+CYCLE = [
+    ("MOVE", lambda driver: driver.move_to("move(30, 500)")),
+    ("GRIP", lambda driver: driver.grip("grip(5, 25)")),
+    ("RELEASE", lambda driver: driver.release("release(10, 500)")),
+]
+
+MIXES = {
+    "queries": QUERIES,
+    "cycle": CYCLE,
+    "mixed": CYCLE + QUERIES,
+}
+
+
+def percentile(sorted_values, q):
+    '''
+        Nearest-rank percentile of an already sorted list.
+    '''
+
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))]
+
+
+def run_client(port, mix, stop, latencies, errors, start_barrier):
+    driver = GripperDriver(port=port, calibration_cache=False)
+    start_barrier.wait()
+    while not stop.is_set():
+        for name, call in mix:
+            start = time.perf_counter()
+            response = call(driver)
+            latencies[name].append(time.perf_counter() - start)
+            # queries return one line as a string, other commands a list of lines
+            lines = [response] if isinstance(response, str) else response
+            if lines is None or any("ERROR" in line or "NO PART" in line for line in lines):
+                errors[name] += 1
+    driver.close()
+
+
+def run(clients, duration, mix_name, clock_factory):
+    '''
+        Runs the load test and returns the report as a dict.
+    '''
+
+    mix = MIXES[mix_name]
+    servers = [MockServer(port=0, clock=clock_factory()) for _ in range(clients)]
+    for server in servers:
+        threading.Thread(target=server.start, daemon=True).start()
+    for server in servers:
+        server.ready.wait(5)
+
+    per_client = [(defaultdict(list), defaultdict(int)) for _ in range(clients)]
+    stop = threading.Event()
+    start_barrier = threading.Barrier(clients + 1)
+    threads = [threading.Thread(target=run_client, args=(server.port, mix, stop, *stats, start_barrier), daemon=True)
+               for server, stats in zip(servers, per_client)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = time.monotonic()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    for server in servers:
+        server.stop()
+
+    latencies, errors = defaultdict(list), defaultdict(int)
+    for client_latencies, client_errors in per_client:
+        for name, values in client_latencies.items():
+            latencies[name].extend(values)
+        for name, count in client_errors.items():
+            errors[name] += count
+
+    commands = {}
+    for name, _ in mix:
+        values = sorted(latencies[name])
+        commands[name] = {
+            "count": len(values),
+            "errors": errors[name],
+            "throughput_per_s": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50) * 1000, 3) if values else None,
+            "p95_ms": round(percentile(values, 95) * 1000, 3) if values else None,
+            "p99_ms": round(percentile(values, 99) * 1000, 3) if values else None,
+            "max_ms": round(values[-1] * 1000, 3) if values else None,
+        }
+    total = sum(stats["count"] for stats in commands.values())
+    return {
+        "clients": clients,
+        "mix": mix_name,
+        "duration_s": round(elapsed, 3),
+        "total_commands": total,
+        "throughput_per_s": round(total / elapsed, 1),
+        "commands": commands,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Number of concurrent drivers, one simulated gripper each")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to generate load")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    parser.add_argument("--speedup", type=float, default=None, help="Simulate motion on a real clock accelerated by this factor")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+    logging.getLogger("gripper").setLevel(logging.CRITICAL)
+
+    clock_factory = VirtualClock if args.speedup is None else (lambda: RealClock(args.speedup))
+    report = run(args.clients, args.duration, args.mix, clock_factory)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
@@ -0,0 +1,139 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger("gripper.calibration")
+
+
+def default_path():
+    '''
+        Returns the cache file: GRIPPER_CALIBRATION_CACHE if set, else gripper/calibration.json in
+        the user's cache directory (XDG_CACHE_HOME or ~/.cache).
+    '''
+
+    path = os.environ.get("GRIPPER_CALIBRATION_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gripper", "calibration.json")
+
+
+class CalibrationCache:
+    '''
+        Calibration results persisted on disk, keyed by gripper address (e.g. '10.0.0.11:8000').
+
+        A driver that finds an entry whose min/max widths match the ones the gripper reports in
+        STATUS skips CALIBRATE on connect. A mismatch (e.g. the gripper was recalibrated or replaced)
+        invalidates the entry and the driver calibrates again.
+
+        Attributes:
+            - path (str): JSON file holding the entries (see `default_path`)
+            - tolerance (float): Allowed difference in mm between cached and reported widths
+            - max_entries (int): Entries kept in the file; the least recently calibrated are dropped
+    '''
+
+    def __init__(self, path=None, tolerance=1e-3, max_entries=64):
+        self.path = path if path is not None else default_path()
+        self.tolerance = tolerance
+        self.max_entries = max_entries
+
+    def load(self):
+        '''
+            Returns all entries as {address: {"min_width", "max_width", "calibrated_at"}}.
+        '''
+
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def is_valid(self, address, min_width, max_width):
+        '''
+            Returns True if `address` has a cached calibration matching the reported widths.
+        '''
+
+        if max_width <= min_width:
+            return False
+        entry = self.load().get(address)
+        if not isinstance(entry, dict):
+            return False
+        try:
+            return (abs(entry["min_width"] - min_width) <= self.tolerance
+                    and abs(entry["max_width"] - max_width) <= self.tolerance)
+        except (KeyError, TypeError):
+            return False
+
+    def store(self, address, min_width, max_width):
+        '''
+            Records a successful calibration of `address`. The file is replaced atomically.
+        '''
+
+        entries = self.load()
+        entries[address] = {"min_width": min_width, "max_width": max_width, "calibrated_at": time.time()}
+        if len(entries) > self.max_entries:
+            newest = sorted(entries, key=lambda key: self._calibrated_at(entries[key]), reverse=True)
+            entries = {key: entries[key] for key in newest[:self.max_entries]}
+        self._write(entries)
+
+    def invalidate(self, address):
+        '''
+            Forgets the calibration of `address`.
+        '''
+
+        entries = self.load()
+        if entries.pop(address, None) is not None:
+            self._write(entries)
+
+    @staticmethod
+    def _calibrated_at(entry):
+        try:
+            return float(entry["calibrated_at"])
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+
+    def _write(self, entries):
+        directory = os.path.dirname(self.path) or "."
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".calibration-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+            tmp_path = None
+        except OSError as e:
+            logger.warning("[WARNING] Could not store calibration in %s: %s", self.path, e)
+        finally:
+            # Do not leave a half-written temporary file behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,9 @@
+# Shared test configuration
+
+import os
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def calibration_cache_file(tmp_path_factory):
+    # Keep the drivers created by the tests from writing to the user's calibration cache
+    os.environ["GRIPPER_CALIBRATION_CACHE"] = str(tmp_path_factory.mktemp("cache") / "calibration.json")
@@ -0,0 +1,186 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Per-command response deadlines.
+#
+# Instead of one fixed timeout for every command, the deadline follows from what the command does:
+#     MOVE      |target - width| / speed        (width and speed from the cached gripper state)
+#     RELEASE   pull_back_distance / speed_limit
+#     others    no motion, only the round trip over the link
+# Observed latencies are fed back after every response. As for TCP's retransmission timeout,
+# a smoothed mean and mean deviation are kept per command name (for motions: of the ratio of
+# observed to kinematic time, on top of the link round trip) and the deadline allows the mean
+# plus four deviations. Until a command has `warmup` samples, queries get `query_timeout` and
+# all other commands `default_timeout`.
+
+import threading
+from collections import namedtuple
+
+import gcl
+
+# Deadline of one command: `expected` is the kinematic motion time in seconds (0 without motion)
+# and `learn` tells whether its latency may refine the estimates.
+Deadline = namedtuple("Deadline", ["name", "expected", "timeout", "learn"])
+
+QUERIES = frozenset(("STATUS", "POS?", "SPEED?", "FORCE?", "GRIPSTATE?"))
+MOTIONS = frozenset(("MOVE", "RELEASE"))
+
+
+class SmoothedLatency:
+    '''
+        Exponentially weighted mean and mean deviation of a series of samples.
+    '''
+
+    __slots__ = ("mean", "deviation", "samples")
+
+    def __init__(self):
+        self.mean = 0.0
+        self.deviation = 0.0
+        self.samples = 0
+
+    def observe(self, value, gain=0.125, deviation_gain=0.25):
+        if self.samples == 0:
+            self.mean = value
+            self.deviation = value / 2
+        else:
+            error = value - self.mean
+            self.mean += gain * error
+            self.deviation += deviation_gain * (abs(error) - self.deviation)
+        self.samples += 1
+
+    def upper(self):
+        '''
+            Returns the mean plus four deviations.
+        '''
+
+        return self.mean + 4 * self.deviation
+
+
+class DeadlineEstimator:
+    '''
+        Computes the response deadline of each command and learns correction factors online.
+
+        Attributes:
+            - query_timeout (float): Deadline of queries until enough latencies were observed
+            - default_timeout (float): Deadline of other commands until enough latencies were observed
+            - minimum (float): Lower bound of every deadline, absorbs scheduling jitter
+            - maximum (float): Upper bound of every deadline
+            - warmup (int): Number of samples per command before learned deadlines are used
+            - release_distance (float): Pull-back distance (mm) assumed when RELEASE does not give one
+            - release_speed (float): Speed limit (mm/s) assumed when RELEASE does not give one
+    '''
+
+    def __init__(self, query_timeout=1.0, default_timeout=10.0, minimum=0.25, maximum=60.0, warmup=3,
+                 release_distance=10.0, release_speed=500.0):
+        self.query_timeout = query_timeout
+        self.default_timeout = default_timeout
+        self.minimum = minimum
+        self.maximum = maximum
+        self.warmup = warmup
+        self.release_distance = release_distance
+        self.release_speed = release_speed
+        self._lock = threading.Lock()
+        self._round_trip = SmoothedLatency()
+        self._latencies = {}
+        self._ratios = {}
+
+    def expected_motion(self, command, state):
+        '''
+            Returns the kinematic duration in seconds of a parsed `command` given the gripper
+            `state`, 0.0 without motion, or None if the current width is not known.
+        '''
+
+        args = command.args
+        if command.name == "MOVE":
+            if state.updated_at["width_mm"] is None:
+                return None
+            speed = args.speed or state.speed
+            return abs(args.width - state.width_mm) / speed if speed else None
+        if command.name == "RELEASE":
+            distance = args.pull_back_distance if args.pull_back_distance is not None else self.release_distance
+            return distance / (args.speed_limit or self.release_speed)
+        return 0.0
+
+    def estimate(self, cmd, state):
+        '''
+            Returns the Deadline of the GCL command string `cmd` sent to a gripper in `state`.
+        '''
+
+        try:
+            command = gcl.parse(cmd)
+        except gcl.GclError:
+            return Deadline(None, 0.0, self.default_timeout, False)
+        if command.name == "SEQ":
+            # Steps run back-to-back with pauses of unknown length, so each step gets the default
+            return Deadline("SEQ", 0.0, self._clamp(self.default_timeout * len(command.args)), False)
+        if command.nowait:
+            # Only the acknowledgement is awaited
+            return self._round_trip_deadline(f"{command.name} NOWAIT", self.query_timeout)
+        if command.name not in MOTIONS:
+            return self._round_trip_deadline(command.name, self.query_timeout if command.name in QUERIES else self.default_timeout)
+
+        expected = self.expected_motion(command, state)
+        with self._lock:
+            ratio = self._ratios.get(command.name)
+            if expected is None or ratio is None or ratio.samples < self.warmup:
+                timeout = self.default_timeout
+            else:
+                timeout = self._round_trip.upper() + expected * ratio.upper()
+        return Deadline(command.name, expected or 0.0, self._clamp(timeout), expected is not None)
+
+    def observe(self, deadline, latency):
+        '''
+            Feeds back the observed `latency` (seconds from send to complete response) of a command.
+        '''
+
+        if not deadline.learn:
+            return
+        with self._lock:
+            if deadline.name not in MOTIONS:
+                self._latencies.setdefault(deadline.name, SmoothedLatency()).observe(latency)
+                if deadline.name in QUERIES:
+                    self._round_trip.observe(latency)
+            elif deadline.expected > 1e-3:
+                motion = max(0.0, latency - self._round_trip.mean)
+                self._ratios.setdefault(deadline.name, SmoothedLatency()).observe(motion / deadline.expected)
+
+    def snapshot(self):
+        '''
+            Returns the learned estimates: round trip and per-command latency (mean, deviation) and motion ratios.
+        '''
+
+        with self._lock:
+            return {
+                "round_trip": (self._round_trip.mean, self._round_trip.deviation),
+                "latencies": {name: (s.mean, s.deviation) for name, s in self._latencies.items()},
+                "ratios": {name: (s.mean, s.deviation) for name, s in self._ratios.items()},
+            }
+
+    def _round_trip_deadline(self, name, initial):
+        with self._lock:
+            latency = self._latencies.get(name)
+            timeout = latency.upper() if latency is not None and latency.samples >= self.warmup else initial
+        return Deadline(name, 0.0, self._clamp(timeout), True)
+
+    def _clamp(self, timeout):
+        return min(max(timeout, self.minimum), self.maximum)
@@ -0,0 +1,256 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import argparse
+import asyncio
+import logging
+import random
+import socket
+import struct
+import threading
+from gripper_logging import setup_logging
+
+logger = logging.getLogger("gripper.faults")
+
+
+class Link:
+    '''
+        One proxied connection: the client side, the gripper side and the tasks forwarding between them.
+    '''
+
+    def __init__(self, client, gripper):
+        self.client = client
+        self.gripper = gripper
+        self.tasks = []
+        self.stalled = False
+        self.stall_next = False
+
+
+class FaultProxy:
+    '''
+        FaultProxy is a TCP proxy between a driver and a gripper (or MockServer) that injects link faults.
+
+        The driver connects to the proxy instead of the gripper; every connection is forwarded to
+        `target_host:target_port`. Faults are switched on and off at run time from any thread, so a
+        test or benchmark can break a working link at a known instant and measure the recovery.
+
+        Features:
+            - `latency` and `jitter` (seconds) delay every chunk in both directions; order is kept
+            - `segment_size` splits data from the gripper into segments of that many bytes, written
+              `segment_gap` seconds apart, so responses arrive fragmented
+            - `stall()` forwards part of the next chunk from the gripper and then nothing more on the
+              links open at that moment, while the connections stay open (a half-open link)
+            - `reset()` aborts every open link with a TCP reset
+            - A power cycle of the gripper itself is simulated by MockServer.power_cycle
+
+        Attributes:
+            - target_host (str), target_port (int): Address of the gripper
+            - host (str), port (int): Address the proxy listens on (port 0 picks a free port)
+            - ready (threading.Event): Set once the proxy accepts connections
+    '''
+
+    def __init__(self, target_port, target_host='127.0.0.1', host='127.0.0.1', port=0, seed=None):
+        self.target_host = target_host
+        self.target_port = target_port
+        self.host = host
+        self.port = port
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.segment_size = None
+        self.segment_gap = 0.0
+        self.ready = threading.Event()
+        self._random = random.Random(seed)
+        self._links = set()
+        self._handlers = set()
+        self._loop = None
+        self._stopping = None
+
+    def clear(self):
+        '''
+            Switches off latency, jitter and fragmentation; links that are already stalled stay stalled.
+        '''
+
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.segment_size = None
+        self.segment_gap = 0.0
+
+    def stall(self):
+        '''
+            Stalls every open link in the middle of the next data from the gripper.
+        '''
+
+        self._loop.call_soon_threadsafe(self._stall)
+
+    def reset(self):
+        '''
+            Aborts every open link with a TCP reset.
+        '''
+
+        self._loop.call_soon_threadsafe(self._reset)
+
+    def _stall(self):
+        for link in self._links:
+            link.stall_next = True
+
+    def _reset(self):
+        for link in list(self._links):
+            for writer in (link.client, link.gripper):
+                sock = writer.get_extra_info("socket")
+                if sock is not None:
+                    try:
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    except OSError:
+                        pass
+                writer.transport.abort()
+        logger.info("[FAULT] Reset %d links.", len(self._links))
+
+    async def handle_client(self, reader, writer):
+        '''
+            Opens the connection to the gripper and forwards both directions until either side closes.
+        '''
+
+        try:
+            gripper_reader, gripper_writer = await asyncio.open_connection(self.target_host, self.target_port)
+        except OSError as e:
+            logger.info("[FAULT] Gripper unreachable: %s", e)
+            writer.transport.abort()
+            return
+        link = Link(writer, gripper_writer)
+        self._links.add(link)
+        self._handlers.add(asyncio.current_task())
+        link.tasks = [
+            asyncio.get_running_loop().create_task(self._forward(reader, gripper_writer, link, False)),
+            asyncio.get_running_loop().create_task(self._forward(gripper_reader, writer, link, True)),
+        ]
+        try:
+            await asyncio.wait(link.tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in link.tasks:
+                task.cancel()
+            self._links.discard(link)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+            gripper_writer.close()
+
+    async def _forward(self, reader, writer, link, from_gripper):
+        '''
+            Copies `reader` to `writer`, delaying every chunk by latency plus jitter. Chunks are stamped
+            with their due time on arrival and written in order, so a delay does not hold back reading.
+        '''
+
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+
+        async def write():
+            while (chunk := await chunks.get()) is not None:
+                due, data = chunk
+                if due > loop.time():
+                    await asyncio.sleep(due - loop.time())
+                await self._write(writer, data, link, from_gripper)
+
+        writer_task = loop.create_task(write())
+        last_due = 0.0
+        try:
+            while (data := await reader.read(4096)):
+                delay = self.latency + self.jitter * self._random.random()
+                last_due = max(last_due, loop.time() + delay)
+                chunks.put_nowait((last_due, data))
+            chunks.put_nowait(None)
+            await writer_task
+        except ConnectionError:
+            pass
+        finally:
+            writer_task.cancel()
+
+    async def _write(self, writer, data, link, from_gripper):
+        if from_gripper and link.stall_next:
+            link.stall_next = False
+            link.stalled = True
+            data = data[:max(1, len(data) // 2)]
+            logger.info("[FAULT] Link stalled mid-response.")
+            writer.write(data)
+            await writer.drain()
+            return
+        if link.stalled and from_gripper:
+            return
+        size = self.segment_size if from_gripper else None
+        if not size:
+            writer.write(data)
+            await writer.drain()
+            return
+        for start in range(0, len(data), size):
+            writer.write(data[start:start + size])
+            await writer.drain()
+            await asyncio.sleep(self.segment_gap)
+
+    async def serve(self):
+        '''
+            Forwards connections on the running event loop until `stop` is called.
+        '''
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        server = await asyncio.start_server(self.handle_client, self.host, self.port, reuse_address=True)
+        self.port = server.sockets[0].getsockname()[1]
+        logger.info("[FAULT] Proxy on %s:%s -> %s:%s", self.host, self.port, self.target_host, self.target_port)
+        self.ready.set()
+        try:
+            await self._stopping.wait()
+        finally:
+            self.ready.clear()
+            server.close()
+            self._reset()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await server.wait_closed()
+
+    def start(self):
+        '''
+            Runs the proxy; blocks until `stop` is called.
+        '''
+
+        asyncio.run(self.serve())
+
+    def stop(self):
+        '''
+            Stops a running proxy from any thread and resets all links.
+        '''
+
+        if self._loop is not None and self._stopping is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TCP proxy that adds latency, jitter and fragmentation to a gripper link")
+    parser.add_argument("--port", type=int, default=8001, help="Port the proxy listens on")
+    parser.add_argument("--target-host", default="127.0.0.1", help="Gripper address")
+    parser.add_argument("--target-port", type=int, default=8000, help="Gripper port")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay (s) added to every chunk")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay (s) up to this value")
+    parser.add_argument("--segment-size", type=int, default=None, help="Split data from the gripper into segments of this size")
+    args = parser.parse_args()
+    setup_logging()
+
+    proxy = FaultProxy(args.target_port, args.target_host, port=args.port)
+    proxy.latency, proxy.jitter, proxy.segment_size = args.latency, args.jitter, args.segment_size
+    proxy.start()
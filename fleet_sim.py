@@ -0,0 +1,252 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import argparse
+import asyncio
+import logging
+import threading
+import numpy as np
+from gripper_sim import MockServer, Motion, RealClock, VirtualClock
+from gripper_logging import setup_logging
+
+logger = logging.getLogger("gripper.fleet_sim")
+
+
+def _array_field(name, kind):
+    '''
+        Property that stores an attribute of one gripper in slot `index` of the fleet array `name`.
+    '''
+
+    def get(self):
+        return kind(getattr(self.fleet, name)[self.index])
+
+    def set(self, value):
+        getattr(self.fleet, name)[self.index] = value
+
+    return property(get, set)
+
+
+class TickTimer:
+    '''
+        Stands in for the timer task of a Motion: the fleet's tick loop ends the motion instead.
+    '''
+
+    __slots__ = ("moving", "index")
+
+    def __init__(self, moving, index):
+        self.moving = moving
+        self.index = index
+
+    def cancel(self):
+        self.moving[self.index] = False
+
+
+class FleetGripper(MockServer):
+    '''
+        One gripper of a FleetSimulator: a MockServer whose state lives in the fleet's arrays.
+
+        All GCL handling is inherited, so every gripper answers exactly like a MockServer. Only the
+        motion differs: instead of one timer task per motion, the fleet's tick loop interpolates the
+        width of all moving grippers at once and ends the motions that reached their target.
+    '''
+
+    width = _array_field("width", float)
+    speed = _array_field("speed", float)
+    torque = _array_field("torque", float)
+    gripstate = _array_field("gripstate", int)
+    min_width = _array_field("min_width", float)
+    max_width = _array_field("max_width", float)
+    is_calibrated = _array_field("calibrated", bool)
+
+    def __init__(self, fleet, index, host, port):
+        self.fleet = fleet
+        self.index = index
+        super().__init__(host, port, clock=fleet.clock)
+
+    def position(self):
+        fleet = self.fleet
+        return float(fleet.position[self.index]) if fleet.moving[self.index] else self.width
+
+    def _start_motion(self, width):
+        self._stop_motion()
+        duration = min(9.9, (abs(self.width - width) / self.speed) * 10)
+        motion = Motion(self.clock, self.width, width, duration)
+        motion.timer = TickTimer(self.fleet.moving, self.index)
+        self._motion = motion
+        self.gripstate = 6
+        self.fleet.schedule(self.index, motion)
+        return motion
+
+
+class FleetSimulator:
+    '''
+        FleetSimulator emulates a plant of N independent grippers in one process.
+
+        The state of all grippers (width, speed, torque, gripstate, calibration range and the
+        running motions) is kept in NumPy arrays indexed by gripper. Every gripper is served on
+        its own port with the MockServer GCL behavior; all of them share one asyncio event loop
+        and one tick loop that advances every running motion with a few array operations per tick,
+        so hundreds of moving grippers cost one timer instead of one task each.
+
+        Features:
+            - N grippers, each with its own state and TCP port (`ports`), from a single thread
+            - Vectorized motion: positions of all moving grippers are interpolated once per `tick`
+            - Same protocol as MockServer: text and binary, SEQ, NOWAIT, AUTOSEND, HEARTBEAT
+            - Works with RealClock (optionally accelerated) and VirtualClock
+
+        Attributes:
+            - count (int): Number of grippers
+            - host (str): Address the grippers listen on
+            - base_port (int): Port of gripper 0, gripper i listens on base_port + i (0 picks free ports)
+            - clock: Source of simulated time shared by all grippers
+            - tick (float): Simulated seconds between motion updates
+            - grippers (list of FleetGripper): The simulated grippers
+            - ready (threading.Event): Set once every gripper accepts connections
+    '''
+
+    def __init__(self, count, host='127.0.0.1', base_port=0, clock=None, tick=0.005):
+        self.count = count
+        self.host = host
+        self.base_port = base_port
+        self.clock = clock if clock is not None else RealClock()
+        self.tick = tick
+        self.ready = threading.Event()
+        self.width = np.zeros(count)
+        self.speed = np.zeros(count)
+        self.torque = np.zeros(count)
+        self.gripstate = np.zeros(count, dtype=np.int8)
+        self.min_width = np.zeros(count)
+        self.max_width = np.zeros(count)
+        self.calibrated = np.zeros(count, dtype=bool)
+        self.moving = np.zeros(count, dtype=bool)
+        self.position = np.zeros(count)
+        self.start_width = np.zeros(count)
+        self.target_width = np.zeros(count)
+        self.started_at = np.zeros(count)
+        self.duration = np.zeros(count)
+        self.grippers = [FleetGripper(self, i, host, base_port + i if base_port else 0) for i in range(count)]
+        self._loop = None
+        self._stopping = None
+        self._wake = None
+
+    @property
+    def ports(self):
+        return [gripper.port for gripper in self.grippers]
+
+    def schedule(self, index, motion):
+        '''
+            Hands the motion of gripper `index` to the tick loop.
+        '''
+
+        self.start_width[index] = motion.start
+        self.target_width[index] = motion.target
+        self.started_at[index] = motion.started_at
+        self.duration[index] = motion.duration
+        self.position[index] = motion.start
+        self.moving[index] = True
+        self._wake.set()
+
+    def advance(self):
+        '''
+            Interpolates the width of every moving gripper at the current simulated time and ends
+            the motions that reached their target. Returns the number of grippers still moving.
+        '''
+
+        moving = np.flatnonzero(self.moving)
+        if not moving.size:
+            return 0
+        elapsed = self.clock.now() - self.started_at[moving]
+        fraction = np.minimum(1.0, elapsed / np.maximum(self.duration[moving], 1e-9))
+        start = self.start_width[moving]
+        self.position[moving] = np.round(start + (self.target_width[moving] - start) * fraction, 3)
+        finished = moving[fraction >= 1.0]
+        for index in finished.tolist():
+            self.moving[index] = False
+            gripper = self.grippers[index]
+            if gripper._motion is not None:
+                gripper._finish_motion(gripper._motion, True)
+        return moving.size - finished.size
+
+    async def run_ticks(self):
+        '''
+            Advances the motions every `tick` simulated seconds while any gripper moves.
+        '''
+
+        while True:
+            if not self.advance():
+                self._wake.clear()
+                await self._wake.wait()
+            await self.clock.sleep(self.tick)
+
+    async def serve(self):
+        '''
+            Serves all grippers on the running event loop until `stop` is called.
+        '''
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        self._wake = asyncio.Event()
+        servers = [self._loop.create_task(gripper.serve()) for gripper in self.grippers]
+        ticks = self._loop.create_task(self.run_ticks())
+        while not all(gripper.ready.is_set() for gripper in self.grippers):
+            await asyncio.sleep(0.001)
+        logger.info("[SERVER] %d grippers listening on %s:%s-%s", self.count, self.host, self.grippers[0].port, self.grippers[-1].port)
+        self.ready.set()
+        try:
+            await self._stopping.wait()
+        finally:
+            self.ready.clear()
+            ticks.cancel()
+            for gripper in self.grippers:
+                gripper._stopping.set()
+            await asyncio.gather(*servers, return_exceptions=True)
+
+    def start(self):
+        '''
+            Runs the fleet; blocks until `stop` is called.
+        '''
+
+        asyncio.run(self.serve())
+
+    def stop(self):
+        '''
+            Stops a running fleet from any thread and closes all client connections.
+        '''
+
+        if self._loop is not None and self._stopping is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate a plant of grippers, one port per gripper")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=9000, help="Port of the first gripper")
+    parser.add_argument("--speedup", type=float, default=1.0, help="Run simulated motion this many times faster")
+    parser.add_argument("--virtual", action="store_true", help="Complete simulated motion instantly")
+    parser.add_argument("--tick", type=float, default=0.005, help="Simulated seconds between motion updates")
+    args = parser.parse_args()
+    setup_logging()
+
+    fleet = FleetSimulator(args.count, args.host, args.base_port, VirtualClock() if args.virtual else RealClock(args.speedup), args.tick)
+    fleet.start()
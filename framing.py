@@ -0,0 +1,102 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+
+class LineFramer:
+    '''
+        Reusable bytes-level line framer for newline-terminated GCL traffic.
+
+        Incoming data is received straight into a preallocated bytearray with `recv_into`.
+        The end of the last complete line is located with `bytearray.rfind` and that region is
+        decoded from a memoryview, so only complete lines are ever turned into `str`. Bytes after the last newline stay in
+        the buffer and are returned as part of the next line once the rest arrives.
+
+        Attributes:
+            - bufsize (int): Initial buffer size; the buffer grows if a single line does not fit
+    '''
+
+    def __init__(self, bufsize=65536):
+        self._buf = bytearray(bufsize)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _reserve(self, size):
+        '''
+            Makes room for at least `size` more bytes after the buffered data.
+        '''
+
+        if len(self._buf) - self._end >= size:
+            return
+        buffered = self._end - self._start
+        if self._start and len(self._buf) - buffered >= size:
+            self._buf[:buffered] = bytes(self._view[self._start:self._end])
+        else:
+            new_buf = bytearray(max(2 * len(self._buf), buffered + size))
+            new_buf[:buffered] = self._view[self._start:self._end]
+            self._view.release()
+            self._buf = new_buf
+            self._view = memoryview(self._buf)
+        self._start, self._end = 0, buffered
+
+    def recv_into(self, sock, size=4096):
+        '''
+            Receives up to `size` bytes from `sock` directly into the buffer.
+            Returns the number of bytes received (0 when the peer closed the connection).
+        '''
+
+        end = self._end
+        if len(self._buf) - end < size:
+            self._reserve(size)
+            end = self._end
+        received = sock.recv_into(self._view[end:end + size])
+        self._end = end + received
+        return received
+
+    def feed(self, data):
+        '''
+            Appends bytes that were received elsewhere.
+        '''
+
+        self._reserve(len(data))
+        self._buf[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def lines(self):
+        '''
+            Returns every complete line in the buffer, decoded and stripped, and consumes them.
+            The complete region is decoded in one pass from a memoryview; a trailing partial
+            line stays buffered.
+        '''
+
+        last = self._buf.rfind(b"\n", self._start, self._end)
+        if last == -1:
+            return []
+        text = str(self._view[self._start:last], "utf-8", "replace")
+        self._start = last + 1
+        if self._start == self._end:
+            self._start = self._end = 0
+        return [line.strip() for line in text.split("\n")]
@@ -0,0 +1,186 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Text GCL grammar shared by GripperDriver, the CLI and MockServer.
+#
+#     command   := name [ '(' [ number { ',' number } ] ')' ]
+#     name      := letters, optionally followed by '?' (case-insensitive)
+#     number    := digits [ '.' digits ] | '.' digits
+#     sequence  := 'SEQ ' command { ';' command }
+#     nowait    := command ' NOWAIT'
+#
+# `parse` turns a command string into a Command whose `args` is a typed namedtuple (e.g.
+# Move(width=20.0, speed=None)); `str(command)` gives the canonical form sent on the wire,
+# e.g. 'MOVE(20.0,500.0)'. Parsed commands are cached, so repeated strings are parsed once.
+# A sequence is a Command named 'SEQ' whose `args` is the tuple of its step Commands; the
+# gripper runs the steps one after the other and aborts at the first failing step.
+# A motion command with the NOWAIT suffix is acknowledged right away; the gripper reports the
+# end of the motion later with an unsolicited 'EVENT FIN MOVE <width>' / 'EVENT ABORT MOVE <width>'.
+# HEARTBEAT is answered out of band with an unsolicited 'EVENT HEARTBEAT <gripstate>' line, even
+# while an earlier command of the connection is still running.
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import wsg_codec
+
+_NUMBER = r"(?:\d+(?:\.\d*)?|\.\d+)"
+GRAMMAR = re.compile(rf"\s*([A-Za-z]+\??)\s*(?:\(\s*({_NUMBER}(?:\s*,\s*{_NUMBER})*)?\s*\))?\s*")
+NAME = re.compile(r"\s*([A-Za-z]+\??)")
+
+# Typed arguments; arguments that are not given are None and keep the gripper's current value.
+NoArgs = namedtuple("NoArgs", [])
+Move = namedtuple("Move", ["width", "speed"], defaults=(None,))
+Grip = namedtuple("Grip", ["force", "part_width", "speed_limit"], defaults=(None, None, None))
+Release = namedtuple("Release", ["pull_back_distance", "speed_limit"], defaults=(None, None))
+Autosend = namedtuple("Autosend", ["rate_hz"], defaults=(None,))
+
+# Command name -> (argument type, minimum number of arguments)
+COMMANDS = {
+    "MOVE": (Move, 1),
+    "GRIP": (Grip, 0),
+    "RELEASE": (Release, 0),
+    "AUTOSEND": (Autosend, 0),
+    "CALIBRATE": (NoArgs, 0),
+    "STOP": (NoArgs, 0),
+    "BYE": (NoArgs, 0),
+    "STATUS": (NoArgs, 0),
+    "POS?": (NoArgs, 0),
+    "SPEED?": (NoArgs, 0),
+    "FORCE?": (NoArgs, 0),
+    "GRIPSTATE?": (NoArgs, 0),
+    "HEARTBEAT": (NoArgs, 0),
+}
+
+# Commands allowed as steps of a sequence
+SEQUENCE_STEPS = frozenset(("MOVE", "GRIP", "RELEASE", "CALIBRATE", "STOP", "STATUS", "POS?", "SPEED?", "FORCE?", "GRIPSTATE?"))
+
+# Commands that may be sent with the NOWAIT suffix
+NOWAIT_COMMANDS = frozenset(("MOVE",))
+
+
+class GclError(ValueError):
+    '''
+        Raised for strings that are not valid GCL commands.
+
+        Attributes:
+            - name (str): Upper-case command name if it could be read, else None
+            - status (int): WSG status code describing the problem
+    '''
+
+    def __init__(self, message, name=None, status=wsg_codec.E_CMD_FORMAT_ERROR):
+        super().__init__(message)
+        self.name = name
+        self.status = status
+
+
+class Command(namedtuple("Command", ["name", "args", "nowait"], defaults=(False,))):
+    '''
+        A parsed GCL command: upper-case `name`, typed `args` and whether it was sent with NOWAIT.
+    '''
+
+    __slots__ = ()
+
+    def __str__(self):
+        if self.name == "SEQ":
+            return "SEQ " + ";".join(str(step) for step in self.args)
+        values = [str(float(v)) for v in self.args if v is not None]
+        text = f"{self.name}({','.join(values)})" if values else self.name
+        return f"{text} NOWAIT" if self.nowait else text
+
+
+def command(name, *args, nowait=False):
+    '''
+        Builds a validated Command from a name and numeric arguments, e.g. command("MOVE", 20, 500).
+    '''
+
+    built = _build(name.upper(), list(map(float, args)))
+    return _without_wait(built) if nowait else built
+
+
+def sequence(*steps):
+    '''
+        Builds a SEQ Command from step command strings or Commands.
+    '''
+
+    steps = tuple(parse(step) if isinstance(step, str) else step for step in steps)
+    if not steps:
+        raise GclError("SEQ needs at least one step", "SEQ", wsg_codec.E_NOT_ENOUGH_PARAMS)
+    for step in steps:
+        if step.name not in SEQUENCE_STEPS or step.nowait:
+            raise GclError(f"{step} is not allowed in a sequence", "SEQ")
+    return _new(Command, ("SEQ", steps, False))
+
+
+@lru_cache(maxsize=4096)
+def parse(text):
+    '''
+        Parses a GCL command string (any case) into a Command. Raises GclError if it is invalid.
+    '''
+
+    plain = _PLAIN.get(text)
+    if plain is not None:
+        return plain
+    if text[:4].upper() == "SEQ ":
+        try:
+            return sequence(*text[4:].split(";"))
+        except GclError as e:
+            raise GclError(f"Invalid sequence: {e}", "SEQ", e.status) from None
+    if text[-6:].upper() == "NOWAIT" and text[-7:-6].isspace():
+        return _without_wait(parse(text[:-7]))
+    match = GRAMMAR.fullmatch(text)
+    if match is None:
+        head = NAME.match(text)
+        name = head.group(1).upper() if head else None
+        if name not in COMMANDS:
+            raise GclError(f"Unknown command {text.strip()!r}", status=wsg_codec.E_CMD_UNKNOWN)
+        raise GclError(f"Invalid arguments for {name}", name)
+    name, arg_text = match.groups()
+    return _build(name.upper(), list(map(float, arg_text.split(","))) if arg_text else [])
+
+
+def _build(name, values):
+    spec = _SPECS.get(name)
+    if spec is None:
+        raise GclError(f"Unknown command {name}", status=wsg_codec.E_CMD_UNKNOWN)
+    arg_type, required, padding = spec
+    missing = len(padding) - len(values)
+    if missing < 0 or len(values) < required:
+        raise GclError(f"{name} takes {required} to {len(padding)} arguments", name, wsg_codec.E_NOT_ENOUGH_PARAMS)
+    if missing:
+        values += padding[:missing]
+    # tuple.__new__ skips the Python-level namedtuple constructors, which dominate the build cost
+    return _new(Command, (name, _new(arg_type, values), False))
+
+
+def _without_wait(command):
+    if command.name not in NOWAIT_COMMANDS:
+        raise GclError(f"{command.name} cannot be sent with NOWAIT", command.name)
+    return command._replace(nowait=True)
+
+
+_new = tuple.__new__
+_SPECS = {name: (arg_type, required, [None] * len(arg_type._fields)) for name, (arg_type, required) in COMMANDS.items()}
+# Commands sent without arguments in canonical form (e.g. 'POS?') skip the grammar
+_PLAIN = {name: _build(name, []) for name, (arg_type, required) in COMMANDS.items() if required == 0}
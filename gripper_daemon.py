@@ -0,0 +1,375 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import argparse
+import asyncio
+import logging
+import os
+import threading
+import time
+import gcl
+from gripper_driver import GripperDriver
+from gripper_sim import ClientSession
+from gripper_logging import setup_logging
+
+logger = logging.getLogger("gripper.daemon")
+
+
+class GripperDaemon:
+    '''
+        GripperDaemon owns the single connection to a gripper and shares it between local processes.
+
+        Clients (e.g. the arm controller, a GUI and the vision process) connect to a Unix domain
+        socket and speak the same text GCL protocol as to the gripper itself, so a GripperDriver
+        created with `unix_path` works unchanged. All clients are served by one asyncio event loop;
+        the gripper link is a GripperDriver whose blocking calls run in the loop's thread pool.
+
+        Features:
+            - One gripper connection per gripper, however many processes use it
+            - Motion commands (MOVE, GRIP, RELEASE, CALIBRATE, SEQ) are serialized, so commands of
+              different clients never interleave on the gripper. A blocking MOVE runs upstream as a NOWAIT
+              move, which keeps the link free: STOP is forwarded at once and preempts it. STOP still
+              queues behind a running GRIP, RELEASE, CALIBRATE or SEQ, which block the link
+            - Queries (POS?, SPEED?, FORCE?, GRIPSTATE?, STATUS) are answered from the cached gripper
+              state when it is at most `max_age` seconds old, saving round trips to the device
+            - Responses are fanned out to the client that sent the command; 'MOVE(...) NOWAIT' gets its
+              'EVENT FIN MOVE' / 'EVENT ABORT MOVE' line when the motion ends
+            - AUTOSEND is served from one telemetry stream of the gripper, at the rate each client asks for
+            - BYE closes the client's connection only; the gripper link stays up
+            - CALIBRATE is answered by the daemon while its own link is calibrated, and refused while the
+              fingers move or hold a part, so a connecting client cannot make the gripper drop a part
+            - Unknown commands and PROTOCOL switches are answered by the daemon itself and never reach
+              the shared link, which stays on the text protocol
+            - HEARTBEAT is answered at once while the gripper link is up, even behind a running command,
+              so client watchdogs see both the daemon and the gripper link alive
+
+        Attributes:
+            - path (str): Path of the Unix domain socket clients connect to
+            - driver (GripperDriver): Connection to the gripper
+            - max_age (float): Maximum age in seconds of cached values used to answer queries
+            - ready (threading.Event): Set once the daemon accepts clients
+    '''
+
+    QUERIES = {"POS?": "get_pos", "SPEED?": "get_speed", "FORCE?": "get_force", "GRIPSTATE?": "get_gripstate"}
+    BUSY_GRIPSTATES = frozenset((1, 4, 5, 6))  # GRASPING, HOLDING, RELEASING, POSITIONING
+    MAX_AUTOSEND_RATE = 1000 # Hz
+
+    def __init__(self, path, driver, max_age=0.05):
+        self.path = path
+        self.driver = driver
+        self.max_age = max_age
+        self.ready = threading.Event()
+        self._loop = None
+        self._stopping = None
+        self._motion_lock = None
+        self._clients = {}
+        self._subscribers = {}
+        self._telemetry_rate = 0
+
+    async def handle_client(self, reader, writer):
+        '''
+            Serves one client connection: newline-framed commands are answered in arrival order.
+            Lines are read ahead of command execution (see `read_ahead`) to answer heartbeats at once.
+        '''
+
+        session = ClientSession(writer)
+        self._clients[writer] = asyncio.current_task()
+        logger.info("[DAEMON] Client connected.")
+        commands = asyncio.Queue()
+        read_ahead = asyncio.get_running_loop().create_task(self.read_ahead(reader, session, commands))
+        try:
+            while True:
+                raw = await commands.get()
+                if isinstance(raw, Exception):
+                    raise raw
+                if not raw:
+                    break
+                try:
+                    command = raw.decode().strip()
+                except UnicodeDecodeError:
+                    session.reply("ERROR: Unknown command")
+                    session.end()
+                    await writer.drain()
+                    continue
+                if command and not await self.process_command(command, session):
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            read_ahead.cancel()
+            session.stop_autosend()
+            if self._subscribers.pop(session, None) is not None:
+                await self._update_telemetry()
+            self._clients.pop(writer, None)
+            writer.close()
+            logger.info("[DAEMON] Client disconnected.")
+
+    async def read_ahead(self, reader, session, commands):
+        '''
+            Reads the client's lines into `commands`, answering 'HEARTBEAT' lines right away with
+            'EVENT HEARTBEAT <gripstate>'. Without a gripper link the heartbeat stays unanswered.
+        '''
+
+        try:
+            while (raw := await reader.readline()):
+                if raw.strip().upper() != b"HEARTBEAT":
+                    commands.put_nowait(raw)
+                elif self.driver.connected:
+                    session.send(f"EVENT HEARTBEAT {self.driver.state.gripstate}\n".encode())
+        except ConnectionError as e:
+            commands.put_nowait(e)
+        finally:
+            commands.put_nowait(b"")
+
+    async def process_command(self, command, session):
+        '''
+            Executes one client command on the shared gripper link and answers it.
+            Returns False if the client closes its connection with BYE.
+        '''
+
+        logger.debug("[DAEMON] Received: %s", command, extra={"command": command})
+        try:
+            parsed = gcl.parse(command)
+        except gcl.GclError as e:
+            self._reject(session, command, e)
+            return True
+        name = parsed.name
+        if name == "BYE":
+            session.reply("ACK BYE")
+            session.end()
+            return False
+        if name == "AUTOSEND":
+            await self.autosend(session, parsed.args.rate_hz or 0)
+            return True
+        if parsed.nowait:
+            await self.move_nowait(session, command)
+            return True
+        if name == "CALIBRATE":
+            await self.calibrate(session)
+            return True
+        if name == "MOVE" and not self.driver.binary:
+            await self.move(session, command)
+            return True
+
+        if name in self.QUERIES:
+            lines = await self._run(self._query, name)
+        elif name == "STATUS":
+            lines = await self._run(self._status)
+        elif name == "STOP":
+            lines = await self._run(self.driver.command, command)
+        else:
+            async with self._motion_lock:
+                lines = await self._run(self.driver.command, command)
+        self._answer(session, lines)
+        return True
+
+    async def move(self, session, command):
+        '''
+            Runs a blocking client MOVE as a NOWAIT move on the gripper and answers it like the gripper
+            would ('ACK MOVE' then 'FIN MOVE' or 'ABORT MOVE') once the motion ends. The link is not
+            blocked meanwhile, so a STOP from any client reaches the gripper at once.
+        '''
+
+        async with self._motion_lock:
+            handle = await self._run(self.driver.move_async, command)
+            if handle is not None:
+                await self._run(handle.wait)
+        if handle is None or handle.error is not None:
+            self._answer(session, None)
+        else:
+            self._answer(session, ["ACK MOVE", "FIN MOVE" if handle.completed else "ABORT MOVE"])
+
+    async def calibrate(self, session):
+        '''
+            Calibrates the shared gripper only if the daemon's link lost its calibration and the gripper
+            is idle. A calibrated link is reported as calibrated without moving the fingers.
+        '''
+
+        async with self._motion_lock:
+            lines = await self._run(self._calibrate)
+        self._answer(session, lines)
+
+    def _calibrate(self):
+        state = self.driver.state
+        if state.is_calibrated and state.max_width > state.min_width:
+            return ["ACK CALIBRATE", "FIN CALIBRATE"]
+        if self.driver.get_gripstate() is None:
+            return None
+        if state.gripstate in self.BUSY_GRIPSTATES:
+            return ["ACK CALIBRATE", "ERROR: Gripper is busy"]
+        lines = self.driver.calibrate()
+        if lines and "FIN CALIBRATE" in lines:
+            state.is_calibrated = True
+            self.driver.refresh()
+        return lines
+
+    async def move_nowait(self, session, command):
+        '''
+            Starts a NOWAIT move on the gripper, answers its ACK and later sends the end-of-motion event.
+        '''
+
+        async with self._motion_lock:
+            handle = await self._run(self.driver.move_async, command[:command.upper().rindex("NOWAIT")])
+        if handle is None:
+            self._answer(session, None)
+            return
+        self._answer(session, ["ACK MOVE"])
+
+        async def report():
+            await self._run(handle.wait)
+            if not session.writer.is_closing():
+                width = handle.width if handle.width is not None else self.driver.state.width_mm
+                session.send(f"EVENT {'FIN' if handle.completed else 'ABORT'} MOVE {width}\n".encode())
+
+        asyncio.get_running_loop().create_task(report())
+
+    async def autosend(self, session, rate_hz):
+        '''
+            Subscribes the client to telemetry at `rate_hz` (0 unsubscribes).
+        '''
+
+        rate_hz = min(rate_hz, self.MAX_AUTOSEND_RATE)
+        session.stop_autosend()
+        self._subscribers.pop(session, None)
+        if rate_hz > 0:
+            self._subscribers[session] = rate_hz
+        await self._update_telemetry()
+        if rate_hz > 0:
+            session.start_autosend(rate_hz, self._telemetry_line)
+        session.reply("ACK AUTOSEND")
+        session.end()
+
+    async def _update_telemetry(self):
+        '''
+            Runs the gripper's telemetry stream at the highest rate any client subscribed to.
+        '''
+
+        rate = max(self._subscribers.values(), default=0)
+        if rate != self._telemetry_rate:
+            self._telemetry_rate = rate
+            await self._run(self.driver.start_telemetry if rate else self.driver.stop_telemetry, *([rate] if rate else []))
+
+    def _telemetry_line(self):
+        sample = self.driver.telemetry.latest() if self.driver.telemetry is not None else None
+        if sample is None:
+            state = self.driver.state
+            return f"TELEMETRY {state.width_mm},{state.speed},{state.torque}\n"
+        return f"TELEMETRY {sample.width},{sample.speed},{sample.force}\n"
+
+    def _query(self, name):
+        response = getattr(self.driver, self.QUERIES[name])(max_age=self.max_age)
+        return [response] if response is not None else None
+
+    def _status(self):
+        state = self.driver.state
+        if not all(state.is_fresh(field, self.max_age) for field in state.FIELDS):
+            start = time.monotonic()
+            state = self.driver.refresh()
+            # with a small max_age the refreshed values may already count as stale; only a failed refresh is an error
+            if state is None or any(stamp is None or stamp < start for stamp in state.updated_at.values()):
+                return None
+        return [f"{state.width_mm},{state.speed},{state.torque},{state.min_width},{state.max_width},{state.gripstate}"]
+
+    def _reject(self, session, command, error):
+        '''
+            Answers a command that is not valid GCL like the gripper would, without forwarding it:
+            a PROTOCOL switch or a malformed line must not reach the link shared by all clients.
+        '''
+
+        if command.upper().startswith("PROTOCOL"):
+            session.reply("ERROR: The daemon only speaks the text protocol")
+        elif error.name is None:
+            session.reply("ERROR: Unknown command")
+        else:
+            session.reply(f"ACK {error.name}")
+            session.reply("ERROR")
+        session.end()
+
+    def _answer(self, session, lines):
+        if lines is None:
+            session.reply("ERROR: No response from gripper")
+        else:
+            for line in lines:
+                session.reply(line)
+        session.end()
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def serve(self):
+        '''
+            Serves clients on the running event loop until `stop` is called.
+        '''
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        self._motion_lock = asyncio.Lock()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self.handle_client, self.path)
+        logger.info("[DAEMON] Sharing the gripper link on %s", self.path)
+        self.ready.set()
+        try:
+            await self._stopping.wait()
+        finally:
+            self.ready.clear()
+            server.close()
+            handlers = list(self._clients.values())
+            for writer in list(self._clients):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await server.wait_closed()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def start(self):
+        '''
+            Runs the daemon; blocks until `stop` is called.
+        '''
+
+        asyncio.run(self.serve())
+
+    def stop(self):
+        '''
+            Stops a running daemon from any thread and closes all client connections.
+        '''
+
+        if self._loop is not None and self._stopping is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Share one gripper connection between local processes")
+    parser.add_argument("--socket", default="/tmp/gripper.sock", help="Unix domain socket for clients")
+    parser.add_argument("--host", default="127.0.0.1", help="Gripper address")
+    parser.add_argument("--port", type=int, default=8000, help="Gripper port")
+    parser.add_argument("--max-age", type=float, default=0.05, help="Maximum age (s) of cached values served to queries")
+    args = parser.parse_args()
+    setup_logging()
+
+    daemon = GripperDaemon(args.socket, GripperDriver(args.host, args.port), max_age=args.max_age)
+    try:
+        daemon.start()
+    finally:
+        daemon.driver.disconnect()
@@ -21,24 +21,347 @@
 
 '''
 
+import logging
 import socket
 import time
 import threading
-import re
-from interact import run_cli_ui
+from collections import deque, namedtuple
+import gcl
+import wsg_codec
+from framing import LineFramer
+from telemetry import TelemetryBuffer, parse_telemetry_line
+from gripper_metrics import DriverMetrics
+from gripper_logging import LazyJoin, setup_logging
+from gripper_errors import GripperConnectionError, GripperError, GripperTimeoutError
+from deadlines import DeadlineEstimator
+from reconnect import Reconnector
+from calibration_cache import CalibrationCache
+from watchdog import Watchdog
+
+logger = logging.getLogger("gripper.driver")
+
+
+def build_move_command(command, state):
+    '''
+        Validates a move command (user text such as 'move(20, 500)' or a gcl.Command) against
+        the gripper limits in `state`. Returns the GCL string to send, or None if the command is invalid.
+    '''
+
+    command = _parse_as(command, "MOVE", "[E_NOT_ENOUGH_PARAMS] Invalid move command. Run help to know usage.")
+    if command is None:
+        return None
+    if not (state.min_width <= command.args.width <= state.max_width):
+        logger.error("[E_CMD_FAILED] Width out of range.")
+        return None
+    return str(command)
+
+
+def build_grip_command(command):
+    '''
+        Validates a grip command and returns the GCL string to send, or None if invalid.
+    '''
+
+    command = _parse_as(command, "GRIP", "[E_NOT_ENOUGH_PARAMS] Invalid grip command. Run help to know usage.")
+    return str(command) if command is not None else None
+
+
+def build_release_command(command):
+    '''
+        Validates a release command and returns the GCL string to send, or None if invalid.
+    '''
+
+    command = _parse_as(command, "RELEASE", "[E_NOT_ENOUGH_PARAMS] Invalid release command. Run help to know more.")
+    return str(command) if command is not None else None
+
+
+def _parse_as(command, name, error):
+    '''
+        Parses `command` with the shared GCL grammar unless it already is a gcl.Command.
+        Returns it if it is a `name` command, else logs `error` and returns None.
+    '''
+
+    if isinstance(command, str):
+        try:
+            command = gcl.parse(command)
+        except gcl.GclError:
+            command = None
+    if command is None or command.name != name:
+        logger.error(error)
+        return None
+    return command
+
 
 class GripperState:
     '''
         Represents a copy of the internal state of the mock gripper.
+
+        Every field carries the monotonic time of its last update, so the state doubles as a
+        staleness-bounded cache: `is_fresh(field, max_age)` tells whether a value read from the
+        gripper may still be served without a round trip. Commands that change the gripper
+        state invalidate the affected fields (see INVALIDATED_BY) and bump their `generation`, so
+        a query answered before such a command cannot mark its older value as fresh again.
     '''
+
+    FIELDS = ("width_mm", "speed", "torque", "gripstate", "min_width", "max_width")
+    INVALIDATED_BY = {
+        "MOVE": ("width_mm", "speed", "gripstate"),
+        "GRIP": ("width_mm", "torque", "gripstate"),
+        "RELEASE": ("width_mm", "gripstate"),
+        "STOP": ("width_mm", "gripstate"),
+        "CALIBRATE": ("min_width", "max_width", "gripstate"),
+        "SEQ": FIELDS,
+    }
         
     def __init__(self):
         self.width_mm = 0.0
         self.speed = 0.0
         self.torque = 0.0
+        self.gripstate = 0
         self.is_calibrated = False
         self.min_width = 0.0
         self.max_width = 0.0 
+        self.updated_at = dict.fromkeys(self.FIELDS)
+        self.generation = dict.fromkeys(self.FIELDS, 0)
+        self.text = {}  # field -> value as the gripper wrote it in a text response
+        self.listener = None
+        self._lock = threading.Lock()
+
+    def update(self, since=None, text=None, **fields):
+        '''
+            Stores freshly read values and stamps them with the current time, then calls `listener(state)` if set.
+            `since` maps fields to their `generation` when the reading command was sent; fields invalidated
+            since then are left alone. `text` maps fields to their text in the gripper's response.
+        '''
+
+        now = time.monotonic()
+        with self._lock:
+            for field, value in fields.items():
+                if since is not None and field in since and since[field] != self.generation[field]:
+                    continue
+                setattr(self, field, value)
+                self.updated_at[field] = now
+                if text is not None and field in text:
+                    self.text[field] = text[field]
+                else:
+                    self.text.pop(field, None)
+        if self.listener is not None:
+            self.listener(self)
+
+    def update_from_status(self, response, since=None):
+        '''
+            Updates all fields from a STATUS response 'width,speed,torque,min_width,max_width[,gripstate]',
+            given either as text or as the tuple of values decoded from a binary frame.
+        '''
+
+        names = ("width_mm", "speed", "torque", "min_width", "max_width", "gripstate")
+        text = None
+        if isinstance(response, str):
+            parts = [v.strip() for v in response.strip().split(",")]
+            values = [float(v) for v in parts]
+            text = dict(zip(names, parts))
+        else:
+            values = list(response)
+        fields = dict(zip(names[:5], values))
+        if len(values) > 5:
+            fields["gripstate"] = int(values[5])
+        self.update(since=since, text=text, **fields)
+
+    def cached_response(self, key, field, binary=False):
+        '''
+            Formats the cached `field` exactly as the gripper answers the query `key`, e.g. 'POS=110'.
+        '''
+
+        value = getattr(self, field)
+        if binary:
+            return format_result(key, value)
+        return f"{key}={self.text.get(field, value)}"
+
+    def is_fresh(self, field, max_age):
+        '''
+            Returns True if `field` was read at most `max_age` seconds ago and not invalidated since.
+        '''
+
+        stamp = self.updated_at[field]
+        return max_age is not None and stamp is not None and time.monotonic() - stamp <= max_age
+
+    def invalidate(self, *fields):
+        '''
+            Marks the given fields (all fields if none are given) as stale.
+        '''
+
+        with self._lock:
+            for field in fields or self.FIELDS:
+                self.updated_at[field] = None
+                self.generation[field] += 1
+
+    def invalidate_for(self, cmd):
+        '''
+            Invalidates the fields that the GCL command `cmd` is going to change.
+        '''
+
+        fields = self.INVALIDATED_BY.get(cmd.split("(", 1)[0].split(" ", 1)[0])
+        if fields:
+            self.invalidate(*fields)
+
+
+def parse_query_response(response):
+    '''
+        Returns the value of a query response such as 'POS=110.0' as a float.
+    '''
+
+    return float(response.split("=", 1)[1])
+
+
+def format_result(key, value):
+    '''
+        Formats a query result decoded from a binary frame like its text response, e.g. 'POS=110'.
+    '''
+
+    if key == "STATUS":
+        return ",".join(f"{v:g}" for v in value)
+    return f"{key}={value:g}"
+
+
+StepResult = namedtuple("StepResult", ["command", "lines", "ok"])
+
+
+def parse_sequence_response(lines):
+    '''
+        Splits the response of a 'SEQ' command into one StepResult per executed step.
+        The step that aborted the sequence, if any, is the last one and has `ok` set to False.
+    '''
+
+    results = []
+    for line in lines:
+        if line.startswith("STEP "):
+            results.append(StepResult(line.split(" ", 2)[2], [], True))
+        elif line.startswith("ABORT SEQ"):
+            if results:
+                results[-1] = results[-1]._replace(ok=False)
+        elif line not in ("ACK SEQ", "FIN SEQ") and results:
+            results[-1].lines.append(line)
+    return results
+
+
+class PendingResponse:
+    '''
+        A command written to the gripper whose 'END'-terminated response has not been read yet.
+    '''
+
+    def __init__(self, cmd):
+        self.cmd = cmd
+        self.lines = []
+        self.done = threading.Event()
+        self.error = None
+        self.status = None
+        self.value = None
+        self.sent_at = None
+        self.ack_at = None
+        self.done_at = None
+        self.motion = None
+        self.deadline = None
+        self.previous = None  # command in flight ahead of this one on the same connection
+
+
+class SharedQuery:
+    '''
+        A read-only query shared by concurrent callers: the first caller sends it, the others
+        wait for `claimed` and take the same response.
+    '''
+
+    def __init__(self, cmd):
+        self.pending = PendingResponse(cmd)
+        self.response = None
+        self.claimed = threading.Event()
+
+    def joinable(self):
+        '''
+            A query can be joined until its response has arrived; an answer that is already there
+            may predate the caller's earlier commands (e.g. a MOVE that finished after it).
+        '''
+
+        return not self.pending.done.is_set()
+
+
+class MotionHandle:
+    '''
+        A move started with `GripperDriver.move_async`, returned once the gripper acknowledged it.
+
+        The motion runs on the gripper while the caller does other work; the handle can be
+        polled (`done`, `position`, `progress`), waited for (`wait`) or cancelled (`cancel`).
+
+        Attributes:
+            - command (str): GCL command that started the motion
+            - start (float): Width when the motion was started, if known
+            - target (float): Width the fingers move to
+            - completed (bool): True if the target was reached, False if stopped; None while moving
+            - width (float): Width at which the motion ended
+            - error (Exception): Set if the motion could not be followed, e.g. GripperConnectionError
+    '''
+
+    def __init__(self, driver, command, start, target):
+        self.command = command
+        self.start = start
+        self.target = target
+        self.completed = None
+        self.width = None
+        self.error = None
+        self._driver = driver
+        self._done = threading.Event()
+
+    def done(self):
+        '''
+            Returns True once the motion has ended.
+        '''
+
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        '''
+            Waits up to `timeout` seconds for the motion to end. Returns True if the target was
+            reached, False if the motion was stopped or failed, None if it is still running.
+        '''
+
+        if not self._done.wait(timeout):
+            return None
+        return bool(self.completed)
+
+    def position(self):
+        '''
+            Returns the current width: the final width once done, else a POS? query to the gripper.
+        '''
+
+        if self.done():
+            return self.width
+        response = self._driver.get_pos()
+        return parse_query_response(response) if response else None
+
+    def progress(self):
+        '''
+            Returns the fraction (0.0 to 1.0) of the distance covered so far.
+        '''
+
+        width = self.position()
+        if width is None or self.start is None or self.start == self.target:
+            return 1.0 if self.completed else 0.0
+        return max(0.0, min(1.0, (self.start - width) / (self.start - self.target)))
+
+    def cancel(self, timeout=None):
+        '''
+            Stops the motion with STOP. Returns True if it ended before reaching its target.
+        '''
+
+        if not self.done():
+            self._driver.stop()
+        return self.wait(self._driver.RESPONSE_TIMEOUT if timeout is None else timeout) is False
+
+    def _finish(self, completed, width=None, error=None):
+        if self._done.is_set():
+            return
+        self.completed = completed
+        self.width = width
+        self.error = error
+        self._done.set()
 
 
 class GripperDriver:
@@ -49,146 +372,677 @@ class GripperDriver:
         up-to-date internal state of the gripper including position (width), speed, and torque.
 
         Features:
-            - Establishes and maintains a TCP/IP connection with the gripper
+            - Establishes and maintains a TCP/IP connection with the gripper, or a Unix domain socket
+              connection to a gripper daemon (`unix_path`) that shares one gripper link between processes
             - Sends control commands to set position or initiate calibration
             - Retrieves current gripper status and parses response data
-            - Handles communication interruptions and reconnects if needed
+            - Pipelines commands: several commands can be in flight, responses are matched in order
+            - Caches state values with timestamps; getters accept a `max_age` to skip round trips
+            - Coalesces concurrent identical queries (POS?, SPEED?, FORCE?, GRIPSTATE?, STATUS): threads
+              asking while the same query is in flight share its response instead of sending their own
+            - Optional binary WSG protocol (struct-encoded frames with CRC) selected at connect time
+            - Streams telemetry (AUTOSEND) into a timestamped ring buffer readable without socket I/O
+            - Optionally publishes the state (and telemetry) into shared memory, where other processes
+              read consistent snapshots lock-free with SharedStateReader
+            - Records per-command latency histograms and link counters in `metrics` (see gripper_metrics.py)
+            - Pre/post command hooks, e.g. to attach tracing spans
+            - Per-command response deadlines from the gripper kinematics, refined from observed latencies
+              (see deadlines.py); a missed deadline fails the command with GripperTimeoutError
+            - Public methods return None when a command fails; `last_error` tells the calling thread why
+              (GripperTimeoutError, GripperConnectionError)
+            - Non-blocking moves (`move_async`) returning a MotionHandle that can be polled, waited for
+              or cancelled with STOP while the connection stays free for other commands
+            - Handles communication interruptions: in-flight commands fail fast with GripperConnectionError
+              and a background thread reconnects with exponential backoff, then resyncs the state with one STATUS
+            - Optional link watchdog: heartbeats on an idle link plus TCP keepalive detect a dead link within
+              a bound and start the reconnection before any command times out (see watchdog.py)
             - Provides recovery behavior and safety defaults for bin picking applications
         
         Attributes:
             - host (str): IP address of the gripper
             - port (int): Port number for TCP connection
             - timeout (int): Timeout
+            - protocol (str): 'text' for GCL text lines or 'binary' for WSG binary frames
+            - backoff (Backoff): Delay policy between reconnection attempts (see reconnect.py)
+            - reconnect_budget (float): Seconds to keep reconnecting per outage, None to keep trying
+            - deadlines (DeadlineEstimator): Response deadline policy; RESPONSE_TIMEOUT is its default timeout
+            - unix_path (str): Unix domain socket of a gripper daemon (see gripper_daemon.py) to use instead of TCP
+            - shared_state (str): Name of a shared memory block to publish the state into (see shared_state.py)
+            - lazy (bool): Connect on the first command instead of in the constructor
+            - calibration_cache (CalibrationCache): Calibrations persisted per gripper address; False disables it
+            - watchdog (float): Seconds of silence after which the link is declared down, None to disable the watchdog
+            - coalesce (bool): Share in-flight queries between threads asking the same
 
     '''
-    def __init__(self, host='127.0.0.1', port=8000, timeout=5):
+    def __init__(self, host='127.0.0.1', port=8000, timeout=5, protocol="text", backoff=None, reconnect_budget=None,
+                 deadlines=None, unix_path=None, shared_state=None, lazy=False, calibration_cache=None, watchdog=None,
+                 coalesce=True):
         self.host = host
         self.port = port
+        self.unix_path = unix_path
         self.timeout = timeout
+        self.binary = protocol == "binary"
         self.RESPONSE_TIMEOUT = 10.0
+        self.RECONNECT_WAIT = 2.0
+        self.deadlines = deadlines if deadlines is not None else DeadlineEstimator(default_timeout=self.RESPONSE_TIMEOUT)
         self.sock = None
+        self.socket = None
         self.state = GripperState()
+        self.shared_state = None
+        if shared_state is not None:
+            from shared_state import SharedStatePublisher  # multiprocessing is only imported when used
+            self.shared_state = SharedStatePublisher(shared_state)
+            self.state.listener = self.shared_state.publish
         self.lock = threading.Lock()
         self.connected = False
-        self._connect()
+        self._pending = deque()
+        self._send_lock = threading.Lock()
+        self._local = threading.local()
+        self.coalesce = coalesce
+        self._shared_queries = {}
+        self._shared_lock = threading.Lock()
+        self._reader_thread = None
+        self.telemetry = None
+        self.last_received = time.monotonic()
+        self.metrics = DriverMetrics()
+        self._pre_command_hooks = []
+        self._post_command_hooks = []
+        self.calibration_cache = CalibrationCache() if calibration_cache is None else calibration_cache
+        self._reconnector = Reconnector(self._reconnect, backoff, reconnect_budget)
+        self._connect_lock = threading.Lock()
+        self._lazy = lazy
+        self.watchdog = Watchdog(self, watchdog) if watchdog is not None else None
+        if not lazy and not self._connect():
+            self._reconnector.start()
+        if self.watchdog is not None:
+            self.watchdog.start()
+
+    @property
+    def last_error(self):
+        '''
+            Exception that made the calling thread's last command fail, e.g. GripperTimeoutError for a
+            missed deadline or GripperConnectionError for a lost link; None if it got a response.
+        '''
+
+        return getattr(self._local, "last_error", None)
+
+    @property
+    def address(self):
+        '''
+            Address of the gripper, e.g. '127.0.0.1:8000' (the socket path for a daemon).
+        '''
+
+        return self.unix_path if self.unix_path is not None else f"{self.host}:{self.port}"
 
     def _connect(self):
         '''
-            Establish TCP connection to gripper.
+            Makes one attempt to establish the TCP connection to the gripper.
+            Returns True once connected and the state has been read with STATUS.
         '''
         
+        old_socket, self.socket = self.socket, None
+        if old_socket is not None:
+            self._close_socket(old_socket)
         try:
-            print(f"[INFO] Connecting to gripper at {self.host}:{self.port}...")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(self.timeout)
-            self.socket.connect((self.host, self.port))
-            print("[E_SUCCESS] Connection established.")
+            if self.unix_path is not None:
+                logger.info("[INFO] Connecting to gripper daemon at %s...", self.unix_path)
+                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket.settimeout(self.timeout)
+                self.socket.connect(self.unix_path)
+            else:
+                logger.info("[INFO] Connecting to gripper at %s:%s...", self.host, self.port)
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.settimeout(self.timeout)
+                self.socket.connect((self.host, self.port))
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.watchdog is not None:
+                self.watchdog.configure(self.socket)
+            if self.binary:
+                self._switch_to_binary()
+            self.socket.settimeout(None)
+            logger.info("[E_SUCCESS] Connection established.")
+            self._pending = deque()
+            self.last_received = time.monotonic()
+            if self.binary:
+                read_loop, args = self._read_binary_loop, (self.socket, self._pending)
+            else:
+                read_loop, args = self._read_loop, (self.socket, self._pending, deque())
+            # connected before the reader starts, so a link that drops at once is reported as lost
             self.connected = True
-            self._initialize_gripperstate()
-            if not self.state.is_calibrated:
-                print("[WARNING] Gripper not calibrated. Calibrating...")
-                self.calibrate()
-                self.state.is_calibrated = True
+            self._reader_thread = threading.Thread(target=read_loop, args=args, daemon=True)
+            self._reader_thread.start()
+            if not self._initialize_gripperstate():
+                raise ConnectionError("Gripper did not answer STATUS")
+            self._check_calibration()
+            return self.connected
             
         except (socket.timeout, ConnectionRefusedError, OSError) as e:
             self.connected = False
-            print(f"[E_NOT_INITIALIZED] Connection failed: {e}")
-            self._attempt_recovery()   
+            # Failed attempts of a running reconnection are summarized by the reconnector.
+            logger.log(logging.DEBUG if self._reconnector.running else logging.ERROR, "[E_NOT_INITIALIZED] Connection failed: %s", e)
+            return False
+
+    def _check_calibration(self):
+        '''
+            Calibrates the gripper after connecting, unless it is already known to be calibrated:
+            by this driver, or by a cached calibration matching the min/max widths just read with STATUS.
+            An empty width range means the gripper lost its calibration (e.g. after a power cycle).
+        '''
+
+        if self.state.is_calibrated and self.state.max_width > self.state.min_width:
+            return
+        if self.unix_path is not None and self.state.max_width > self.state.min_width:
+            # the daemon's own link calibrates the shared gripper; a valid width range means it did
+            self.state.is_calibrated = True
+            return
+        cache = self.calibration_cache
+        if cache and cache.is_valid(self.address, self.state.min_width, self.state.max_width):
+            logger.info("[INFO] Using cached calibration of %s.", self.address)
+            self.state.is_calibrated = True
+            return
+        logger.warning("[WARNING] Gripper not calibrated. Calibrating...")
+        response = self.calibrate()
+        self.state.is_calibrated = True
+        if response and "FIN CALIBRATE" in response:
+            self.refresh()
+            if cache:
+                cache.store(self.address, self.state.min_width, self.state.max_width)
+
+    def _ensure_connected(self):
+        '''
+            Connects on first use of a lazy driver; otherwise waits for the background reconnection.
+            Returns True if the gripper is connected. Commands of other threads wait while an attempt
+            is still resyncing the state, so they are not sent on a link that may fail its STATUS.
+        '''
+
+        if self._lazy:
+            with self._connect_lock:
+                if self._lazy:
+                    self._lazy = False
+                    if self._connect():
+                        return True
+        if self._reconnector.running:
+            # the attempt itself must not wait for the reconnection it is part of
+            return self.connected if self._reconnector.on_reconnect_thread() else self._recover()
+        return self.connected or self._recover()
+
+    def _reconnect(self):
+        '''
+            Reconnection attempt made by the background reconnector.
+        '''
+
+        if not self._connect():
+            return False
+        self.metrics.increment("reconnects")
+        return True
+
+    def _recover(self):
+        '''
+            Starts the background reconnector if needed and waits up to RECONNECT_WAIT for the link.
+            Returns True if the gripper is connected.
+        '''
+
+        self._reconnector.start()
+        return self._reconnector.wait(self.RECONNECT_WAIT) and self.connected
+
+    def _switch_to_binary(self):
+        '''
+            Switches the freshly opened connection to binary WSG frames.
+        '''
+
+        self.socket.sendall(b"PROTOCOL(BINARY)\n")
+        response = b""
+        while not response.endswith(b"END\n"):
+            chunk = self.socket.recv(64)
+            if not chunk:
+                raise ConnectionError("Connection closed during protocol switch")
+            response += chunk
+        if b"ACK PROTOCOL" not in response:
+            raise ConnectionError("Gripper does not support the binary protocol")
+        logger.info("[INFO] Using binary protocol.")
 
     def _initialize_gripperstate(self):
         '''
-            Initializes the state of the gripper.
+            Initializes the state of the gripper. Returns False if it could not be read.
         '''
         
         try:
-            self._send_command("STATUS")
-            print("[INFO] Default values of Width, Speed, Torque, Min Width and Max Width are read.")
+            pending = self._send_command("STATUS")
+            logger.info("[INFO] Default values of Width, Speed, Torque, Min Width and Max Width are read.")
             response = self._receive_response()[0]
-            self.state.width_mm, self.state.speed, self.state.torque, self.state.min_width, self.state.max_width = map(float, response.strip().split(","))
-        except Exception as E:
-            print("[E_CMD_FAILED]. Try reconnecting...")
+            self.state.update_from_status(pending.value if pending.value is not None else response)
+            return True
+        except Exception:
+            logger.error("[E_CMD_FAILED]. Try reconnecting...")
+            return False
 
     def disconnect(self):
         '''
-            Disconnects the client from the gripper.
+            Disconnects the client from the gripper. BYE is only sent over an open link: a lazy
+            driver that never connected, or one whose link is down, is just closed.
         '''
         
         if self.socket:
             self._send_command("BYE")
-            response = self._receive_response()
-            self.socket.close()
-            self.socket = None
-            self.connected = False
-            print("[E_SUCCESS] Disconnected from gripper")
+            self._receive_response()
+            logger.info("[E_SUCCESS] Disconnected from gripper")
+        self.close()
+
+    def close(self):
+        '''
+            Closes the connection without announcing it to the gripper and stops reconnecting.
+            A later command connects again. Stops publishing the shared state and removes its block.
+        '''
+
+        self._reconnector.stop()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        sock, self.socket = self.socket, None
+        self.connected = False
+        if sock is not None:
+            self._close_socket(sock)
+        if self.shared_state is not None:
+            self.shared_state.close()
     
     def stop(self):
         '''
-            Returns the gripper to the IDLE state.
+            Returns the gripper to the IDLE state. Like every command, it connects a lazy driver first.
         '''
         
-        if self.socket:
-            self._send_command("STOP")
-            response = self._receive_response()
-            print("[E_SUCCESS] Returned to IDLE state.")
+        self._send_command("STOP")
+        response = self._receive_response()
+        if response:
+            logger.info("[E_SUCCESS] Returned to IDLE state.", extra={"gripstate": 0})
 
-    def _send_command(self, cmd):
+        return response
+
+    def _send_command(self, cmd, motion=None, pending=None):
         '''
-            Send a string command over TCP.
+            Send a newline-terminated string command over TCP without waiting for its response.
+            The command is queued so that a later `_receive_response` call from the same thread
+            returns its response; several commands may be sent before any response is read.
+            `motion` is the MotionHandle of a NOWAIT move, followed once the move is acknowledged.
+            `pending` is the PendingResponse to use if the caller already created it.
         '''
 
-        if not self.connected:
-            self._attempt_recovery()
+        if pending is None:
+            pending = PendingResponse(cmd)
+        pending.motion = motion
+        pending.deadline = self.deadlines.estimate(cmd, self.state)
+        self._run_hooks(self._pre_command_hooks, pending)
+        if (not self.connected or self._reconnector.running) and not self._ensure_connected():
+            logger.error("[E_NOT_INITIALIZED] Not connected to gripper.", extra={"command": cmd})
+            pending.error = GripperConnectionError("Not connected to gripper")
+            pending.done.set()
+            self._unclaimed_responses().append(pending)
+            return pending
+        try:
+            data = wsg_codec.encode_gcl(cmd) if self.binary else f"{cmd}\n".encode('utf-8')
+        except ValueError as e:
+            logger.error("[E_CMD_UNKNOWN] %s", e, extra={"command": cmd})
+            pending.error = e
+            pending.done.set()
+            self._unclaimed_responses().append(pending)
+            return pending
         try:
-            self.socket.sendall(cmd.encode('utf-8'))
-            print(f"[COMMAND] Sent: {cmd}")
-        except (BrokenPipeError, OSError):
-            print("[E_NOT_INITIALIZED] Lost connection while sending.")
+            with self._send_lock:
+                if not self.connected:
+                    raise GripperConnectionError("Connection to gripper lost")
+                pending.sent_at = time.monotonic()
+                pending.previous = self._pending[-1] if self._pending else None
+                self._pending.append(pending)
+                # invalidated in wire order, so queries sent earlier see the bumped generation
+                self.state.invalidate_for(cmd)
+                self.socket.sendall(data)
+            self.metrics.increment("commands")
+            self.metrics.increment("bytes_sent", len(data))
+            logger.debug("[COMMAND] Sent: %s", cmd, extra={"command": cmd})
+        except OSError:
+            logger.error("[E_NOT_INITIALIZED] Lost connection while sending.", extra={"command": cmd})
+            pending.error = GripperConnectionError("Lost connection while sending")
+            pending.done.set()
             self.connected = False
-            self._attempt_recovery()
+            self._reconnector.start()
+        self._unclaimed_responses().append(pending)
+
+        return pending
+
+    def _unclaimed_responses(self):
+        '''
+            Returns the queue of commands sent by the calling thread whose responses are not yet claimed.
+        '''
+
+        queue = getattr(self._local, "unclaimed", None)
+        if queue is None:
+            queue = self._local.unclaimed = deque()
+        return queue
+
+    def _timeout(self, pending):
+        return pending.deadline.timeout if pending.deadline is not None else self.RESPONSE_TIMEOUT
+
+    def _expires_at(self, pending):
+        '''
+            Returns the monotonic time by which `pending` must be complete. The gripper answers the
+            commands of a connection in order, so the deadline of a command only starts when the
+            command ahead of it completed, or when that command missed its own deadline.
+        '''
+
+        chain = []
+        while True:
+            chain.append(pending)
+            previous = pending.previous
+            if previous is None or previous.done.is_set():
+                break
+            pending = previous
+        expires = previous.done_at if previous is not None else None
+        for item in reversed(chain):
+            start = item.sent_at if expires is None else max(item.sent_at, expires)
+            expires = start + self._timeout(item)
+        return expires
 
     def _receive_response(self):
         '''
-            Receive any number of lines until 'END' is seen or socket closes.
+            Returns the response lines of the oldest command sent by this thread, waiting until the
+            command's deadline for its 'END' line. A missed deadline sets a GripperTimeoutError on
+            the command and returns None.
+        '''
+
+        queue = self._unclaimed_responses()
+        if not queue:
+            return None
+        pending = queue.popleft()
+        timeout = self._timeout(pending)
+        while not pending.done.is_set():
+            remaining = self._expires_at(pending) - time.monotonic()
+            if remaining <= 0:
+                break
+            # wake up when the command ahead completes, which starts this command's deadline
+            previous = pending.previous
+            waiting_for = previous if previous is not None and not previous.done.is_set() else pending
+            waiting_for.done.wait(remaining)
+        if not pending.done.is_set():
+            pending.error = GripperTimeoutError(f"No complete response to {pending.cmd} within {timeout:.3g} s")
+            logger.warning("[E_TIMEOUT] %s", pending.error, extra={"command": pending.cmd})
+            self.metrics.increment("timeouts")
+            response = None
+        elif pending.error is not None:
+            logger.error("[E_NOT_INITIALIZED] No response received: %s", pending.error, extra={"command": pending.cmd})
+            self.metrics.increment("errors")
+            response = None
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                latency = pending.done_at - pending.sent_at if pending.sent_at is not None else None
+                logger.debug("[E_SUCCESS] Received: %s", LazyJoin(pending.lines),
+                             extra={"command": pending.cmd, "latency": latency, "gripstate": self.state.gripstate})
+            response = pending.lines
+        self._local.last_error = pending.error
+        self._run_hooks(self._post_command_hooks, pending, response)
+        return response
+
+    def add_command_hook(self, pre=None, post=None):
+        '''
+            Registers callbacks around every command.
+            `pre(pending)` runs before the command is written and `post(pending, response)` runs
+            when the caller claims its response. `pending` carries `cmd` and the monotonic
+            `sent_at`, `ack_at` and `done_at` timestamps; hooks may store their own attributes
+            on it (e.g. a tracing span opened in `pre` and closed in `post`).
+        '''
+
+        if pre is not None:
+            self._pre_command_hooks.append(pre)
+        if post is not None:
+            self._post_command_hooks.append(post)
+
+    def _run_hooks(self, hooks, *args):
+        for hook in hooks:
+            try:
+                hook(*args)
+            except Exception as e:
+                logger.warning("[WARNING] Command hook failed: %s", e)
+
+    def command(self, cmd):
+        '''
+            Sends a raw GCL command (e.g. 'CALIBRATE' or 'MOVE(20.0,500.0)') and returns its response lines.
+        '''
+
+        self._send_command(cmd)
+        return self._receive_response()
+
+    def pipeline(self, commands):
+        '''
+            Sends several GCL commands back-to-back and returns their responses in the same order.
+            The gripper executes them one after the other, but the driver pays a single round trip.
         '''
 
-        self.socket.settimeout(self.RESPONSE_TIMEOUT)
-        response_lines = []
-        buffer = ""
+        for cmd in commands:
+            self._send_command(cmd)
+        return [self._receive_response() for _ in commands]
 
+    def _read_loop(self, sock, pending, motions):
+        '''
+            Background reader: frames incoming lines and completes pending commands on each 'END'.
+            `motions` holds the acknowledged NOWAIT moves in start order; the gripper runs one
+            motion at a time, so each 'EVENT ... MOVE' line ends the oldest of them.
+        '''
+
+        framer = LineFramer()
+        try:
+            while (received := framer.recv_into(sock)):
+                self.last_received = time.monotonic()
+                self.metrics.increment("bytes_received", received)
+                for line in framer.lines():
+                    if line.startswith("TELEMETRY "):
+                        self._store_telemetry(line)
+                        continue
+                    if line.startswith("EVENT "):
+                        if line.startswith("EVENT HEARTBEAT "):
+                            self._heartbeat_event(line, pending)
+                        else:
+                            self._motion_event(line, motions)
+                        continue
+                    if not pending:
+                        continue
+                    if line == "END":
+                        response = pending.popleft()
+                        if response.motion is not None:
+                            self._track_motion(response, motions)
+                        self._complete(response)
+                    elif line:
+                        response = pending[0]
+                        if response.ack_at is None and line.startswith("ACK"):
+                            response.ack_at = time.monotonic()
+                        response.lines.append(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._connection_lost(sock, pending, motions)
+    
+    def _read_binary_loop(self, sock, pending):
+        '''
+            Background reader for the binary protocol: intermediate frames (E_CMD_PENDING) add a
+            response line, the final frame of a command completes it and carries query results.
+        '''
+
+        decoder = wsg_codec.FrameDecoder()
         try:
             while True:
-                chunk = self.socket.recv(1024).decode("utf-8")
-                if not chunk:
+                data = sock.recv(4096)
+                if not data:
                     break
-                buffer += chunk
+                self.last_received = time.monotonic()
+                self.metrics.increment("bytes_received", len(data))
+                for command_id, payload in decoder.feed(data):
+                    if not pending:
+                        continue
+                    status, value = wsg_codec.decode_response(command_id, payload)
+                    if status == wsg_codec.E_CMD_PENDING:
+                        if pending[0].ack_at is None and value and value.startswith("ACK"):
+                            pending[0].ack_at = time.monotonic()
+                        pending[0].lines.append(value or "")
+                        continue
+                    response = pending.popleft()
+                    response.status = status
+                    if status == wsg_codec.E_SUCCESS and command_id in wsg_codec.RESULTS:
+                        response.value = value
+                        response.lines.append(format_result(wsg_codec.RESULTS[command_id][0], value))
+                    elif value:
+                        response.lines.append(value)
+                    self._complete(response)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._connection_lost(sock, pending)
 
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if line == "END":
-                        response = "\n".join(f"[E_SUCCESS] Received: {line}" for line in response_lines)
-                        print(f"{response}")
-                        return response_lines
-                    if line:
-                        response_lines.append(line)
-        except socket.timeout:
-            print("[E_TIMEOUT] Timeout while waiting for complete response.")
-
-            return response_lines if response_lines else None
-    
-    def _attempt_recovery(self):
+    def _complete(self, response):
         '''
-            Attempt to reconnect to the gripper.
+            Marks a response as complete, records its latencies and feeds them back to the deadlines.
         '''
-        
-        print("[INFO] Attempting communication recovery...")
-        time.sleep(1)
+
+        response.done_at = time.monotonic()
+        self.metrics.record(response)
+        lines = response.lines
+        if response.deadline is not None and not (lines and lines[-1].startswith(("ABORT", "ERROR"))):
+            # time spent queued behind earlier commands of the connection is not the command's latency
+            previous = response.previous
+            started = response.sent_at
+            if previous is not None and previous.done_at is not None:
+                started = max(started, previous.done_at)
+            self.deadlines.observe(response.deadline, response.done_at - started)
+        response.previous = None
+        response.done.set()
+
+    def _track_motion(self, response, motions):
+        '''
+            Follows the motion of an acknowledged NOWAIT move, or fails its handle if it was rejected.
+        '''
+
+        if any(line.startswith("ERROR") for line in response.lines):
+            response.motion._finish(False, error=GripperError(", ".join(response.lines)))
+        else:
+            motions.append(response.motion)
+
+    def _motion_event(self, line, motions):
+        '''
+            Ends the oldest followed motion on 'EVENT FIN MOVE <width>' or 'EVENT ABORT MOVE <width>'.
+        '''
+
+        parts = line.split()
+        if len(parts) != 4 or parts[2] != "MOVE" or not motions:
+            logger.debug("[WARNING] Unexpected event: %s", line)
+            return
         try:
-            if self.socket:
-                self.socket.close()
-        except:
+            width = float(parts[3])
+            self.state.update(text={"width_mm": parts[3]}, width_mm=width, gripstate=0)
+        except ValueError:
+            width = None
+        motions.popleft()._finish(parts[1] == "FIN", width)
+
+    def _send_heartbeat(self):
+        '''
+            Sends a 'HEARTBEAT' for the watchdog. The gripper answers it out of band with
+            'EVENT HEARTBEAT <gripstate>', so it takes no place among the pending commands.
+            The write never blocks: with the send buffer full the link is busy, not idle.
+        '''
+
+        with self._send_lock:
+            if not self.connected or self.socket is None:
+                return
+            try:
+                sent = self.socket.send(b"HEARTBEAT\n", socket.MSG_DONTWAIT)
+                if sent < 10:
+                    self.socket.sendall(b"HEARTBEAT\n"[sent:])
+            except OSError:
+                return  # busy (BlockingIOError) or broken; the reader thread notices a broken link
+        self.metrics.increment("heartbeats")
+        self.metrics.increment("bytes_sent", 10)
+
+    def _heartbeat_event(self, line, pending):
+        '''
+            Takes the gripper state reported by 'EVENT HEARTBEAT <gripstate>' when no command is in
+            flight; otherwise the out-of-band value could be older than the command's own result.
+        '''
+
+        if pending:
+            return
+        try:
+            self.state.update(gripstate=int(line[16:]))
+        except ValueError:
+            logger.debug("[WARNING] Unexpected event: %s", line)
+
+    def _store_telemetry(self, line):
+        '''
+            Appends one AUTOSEND telemetry line to the ring buffer, stamped with the receive time.
+        '''
+
+        if self.telemetry is None:
+            return
+        try:
+            width, speed, force = parse_telemetry_line(line)
+        except ValueError:
+            logger.warning("[WARNING] Skipping malformed telemetry line: %s", line)
+            return
+        now = time.monotonic()
+        self.telemetry.append(now, width, speed, force)
+        if self.shared_state is not None:
+            self.shared_state.publish_telemetry(now, width, speed, force)
+
+    def start_telemetry(self, rate_hz, capacity=4096):
+        '''
+            Subscribes to position, speed and force pushed by the gripper at `rate_hz`.
+            Samples are kept in `self.telemetry`, a TelemetryBuffer of `capacity` samples that
+            can be read (latest sample or time window) without any socket round trip.
+        '''
+
+        if self.telemetry is None or self.telemetry.capacity != capacity:
+            self.telemetry = TelemetryBuffer(capacity)
+        self._send_command(f"AUTOSEND({rate_hz})")
+        return self._receive_response()
+
+    def stop_telemetry(self):
+        '''
+            Stops the telemetry stream. Samples already received stay in `self.telemetry`.
+        '''
+
+        self._send_command("AUTOSEND(0)")
+        return self._receive_response()
+
+    def _close_socket(self, sock):
+        '''
+            Shuts down and closes `sock`, which also wakes up its reader thread.
+        '''
+
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            sock.close()
+        except OSError:
             pass
-        self._connect()
+
+    def _connection_lost(self, sock, pending, motions=()):
+        '''
+            Called by a reader thread when its socket closes: fails the commands and NOWAIT moves
+            still in flight on it with GripperConnectionError and, if it was the current link,
+            reconnects in the background.
+        '''
+
+        with self._send_lock:
+            current = sock is self.socket
+            if current:
+                self.connected = False
+            while pending:
+                failed = pending.popleft()
+                failed.error = GripperConnectionError("Connection to gripper lost")
+                failed.previous = None
+                if failed.motion is not None:
+                    failed.motion._finish(False, error=failed.error)
+                failed.done.set()
+        for motion in motions:
+            motion._finish(False, error=GripperConnectionError("Connection to gripper lost"))
+        if current:
+            logger.error("[E_NOT_INITIALIZED] Lost connection to gripper. Reconnecting...")
+            self._reconnector.start()
 
     def move_to(self, command):
         '''
@@ -196,69 +1050,166 @@ class GripperDriver:
         '''
 
         try:
-            match = re.match(r"move\(\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)", command)
-            if match:
-                width_mm = float(match.group(1))
-                speed = float(match.group(2)) if match.group(2) is not None else None
-                with self.lock:
-                    if not (self.state.min_width <= width_mm <= self.state.max_width):
-                        print("[E_CMD_FAILED] Width out of range.")
-                        return
-                    if speed is not None:
-                        self._send_command(f"MOVE({width_mm},{speed})")
-                    else:
-                        self._send_command(f"MOVE({width_mm})")
-                    response = self._receive_response()
-
-                    return response
-            else:
-                print(f"[E_NOT_ENOUGH_PARAMS] Invalid move command. Run help to know usage.")
+            with self.lock:
+                gcl_command = build_move_command(command, self.state)
+                if gcl_command is None:
+                    return
+                self._send_command(gcl_command)
+                response = self._receive_response()
+                if response and response[-1] == "FIN MOVE":
+                    # the fingers stopped at the target, so the next move's deadline can use it
+                    self.state.update(width_mm=gcl.parse(gcl_command).args.width)
+
+                return response
         except Exception as E:
-            print(f"[E_CMD_FAILED] Invalid move command resulted in {E}.")
+            logger.error("[E_CMD_FAILED] Invalid move command resulted in %s.", E)
     
-    def get_pos(self):
+    def move_async(self, command):
+        '''
+            Starts a move without waiting for it, e.g. move_async('move(20, 500)').
+            Returns a MotionHandle as soon as the gripper acknowledged the move, or None if the
+            command is invalid or was not acknowledged. Other commands, e.g. POS? or STOP, can be
+            sent while the fingers move. Needs the text protocol.
+        '''
+
+        if self.binary:
+            logger.error("[E_CMD_UNKNOWN] Non-blocking moves need the text protocol.")
+            return None
+        with self.lock:
+            move = build_move_command(command, self.state)
+            if move is None:
+                return None
+            target = gcl.parse(move).args.width
+            handle = MotionHandle(self, f"{move} NOWAIT", self.state.width_mm, target)
+            self._send_command(handle.command, motion=handle)
+            response = self._receive_response()
+        if not response or handle.error is not None:
+            handle._finish(False, error=handle.error or GripperError("Move was not acknowledged"))
+            return None
+        return handle
+
+    def _query(self, cmd, field, max_age):
+        '''
+            Returns the response of a query command (e.g. POS?) and caches its value in the state.
+            If the cached value is not older than `max_age` seconds, no command is sent.
+        '''
+
+        if self.state.is_fresh(field, max_age):
+            self._local.last_error = None
+            return self.state.cached_response(cmd[:-1], field, self.binary)
+        since = {field: self.state.generation[field]}
+        pending, response = self._shared_query(cmd)
+        if not response:
+            return None
+        try:
+            if pending is not None and pending.value is not None:
+                value, text = pending.value, None
+            else:
+                value, text = parse_query_response(response[0]), {field: response[0].split("=", 1)[1].strip()}
+        except (IndexError, ValueError):
+            return self._unexpected_response(cmd, response)
+        if pending is not None:
+            self.state.update(since=since, text=text, **{field: int(value) if field == "gripstate" else value})
+
+        return response[0]
+
+    def _shared_query(self, cmd):
+        '''
+            Sends the read-only query `cmd` and returns (pending, response lines), or joins the same
+            query if another thread has it in flight and returns (None, its response lines), in
+            which case that thread updates the state.
+        '''
+
+        if not self.coalesce:
+            pending = self._send_command(cmd)
+            return pending, self._receive_response()
+        with self._shared_lock:
+            shared = self._shared_queries.get(cmd)
+            if shared is not None and shared.joinable():
+                self.metrics.increment("coalesced")
+                leader = False
+            else:
+                shared = self._shared_queries[cmd] = SharedQuery(cmd)
+                leader = True
+        if not leader:
+            shared.claimed.wait()
+            self._local.last_error = shared.pending.error
+            return None, shared.response
+        try:
+            self._send_command(cmd, pending=shared.pending)
+            shared.response = self._receive_response()
+        finally:
+            with self._shared_lock:
+                if self._shared_queries.get(cmd) is shared:
+                    del self._shared_queries[cmd]
+            shared.claimed.set()
+        return shared.pending, shared.response
+
+    def _unexpected_response(self, cmd, response):
+        '''
+            Handles a response that does not carry the value asked for, e.g. 'ERROR: No response from
+            gripper' from a daemon whose gripper is down: sets `last_error` and returns None.
+        '''
+
+        self._local.last_error = GripperError(f"Unexpected response to {cmd}: {', '.join(response)}")
+        logger.error("[E_CMD_FAILED] %s", self._local.last_error, extra={"command": cmd})
+        return None
+
+    def refresh(self):
+        '''
+            Refreshes every field of the state with a single STATUS round trip.
+            Returns the state, or None if the gripper did not answer with a STATUS line.
+        '''
+
+        since = dict(self.state.generation)
+        pending, response = self._shared_query("STATUS")
+        if not response:
+            return None
+        if pending is not None and pending.value is not None:
+            self.state.update_from_status(pending.value, since)
+            return self.state
+        try:
+            values = [float(v) for v in response[0].split(",")]
+            if len(values) < 5:
+                raise ValueError(response[0])
+        except (IndexError, ValueError):
+            return self._unexpected_response("STATUS", response)
+        if pending is not None:
+            self.state.update_from_status(response[0], since)
+
+        return self.state
+
+    def get_pos(self, max_age=None):
         '''
             Returns the current position of the gripper.
+            A cached position not older than `max_age` seconds is returned without a round trip.
         '''
         
-        self._send_command("POS?")
-        response = self._receive_response()[0]
-        self.state.width_mm = map(float, response.strip().split(","))
-
-        return response
+        return self._query("POS?", "width_mm", max_age)
 
-    def get_speed(self):
+    def get_speed(self, max_age=None):
         '''
             Returns the current speed of the gripper.
+            A cached speed not older than `max_age` seconds is returned without a round trip.
         '''
         
-        self._send_command("SPEED?")
-        response = self._receive_response()[0]
-        self.state.speed = map(float, response.strip().split(","))
-
-        return response
+        return self._query("SPEED?", "speed", max_age)
     
-    def get_force(self):
+    def get_force(self, max_age=None):
         '''
             Returns the torque of the gripper.
+            A cached torque not older than `max_age` seconds is returned without a round trip.
         '''
         
-        self._send_command("FORCE?")
-        response = self._receive_response()[0]
-        self.state.torque = map(float, response.strip().split(","))
+        return self._query("FORCE?", "torque", max_age)
 
-        return response
-
-    def get_gripstate(self):
+    def get_gripstate(self, max_age=None):
         '''
             Returns the current state of the gripper as per the State Flow Diagram.
+            A cached state not older than `max_age` seconds is returned without a round trip.
         '''
         
-        self._send_command("GRIPSTATE?")
-        response = self._receive_response()[0]
-        self.state.gripstate = map(float, response.strip().split(","))
-
-        return response
+        return self._query("GRIPSTATE?", "gripstate", max_age)
 
     def calibrate(self):
         '''
@@ -275,30 +1226,16 @@ class GripperDriver:
             Executes grip action at the current gripper position.
         '''
         
-        pattern = r"grip(?:\(\s*(?:(\d*\.?\d+)\s*(?:,\s*(\d*\.?\d+))?\s*(?:,\s*(\d*\.?\d+))?)?\s*\))?$"
-        match = re.match(pattern, command)
         try:
-            if match:
-                force, part_width, speed_limit = None, None, None
-                values = [float(v) for v in match.groups() if v is not None]
-                if len(values)==3:
-                    force, part_width, speed_limit = values[0], values[1], values[2]
-                    self._send_command(f"GRIP({force},{part_width},{speed_limit})")
-                elif len(values)==2:
-                    force, part_width = values[0], values[1]
-                    self._send_command(f"GRIP({force},{part_width})")
-                elif len(values)==1:
-                    force = values[0]
-                    self._send_command(f"GRIP({force})")
-                else:
-                    self._send_command(f"GRIP()")
-                response = self._receive_response()  
+            gcl_command = build_grip_command(command)
+            if gcl_command is None:
+                return
+            self._send_command(gcl_command)
+            response = self._receive_response()  
 
-                return response               
-            else:
-                print("[E_NOT_ENOUGH_PARAMS] Invalid grip command. Run help to know usage.")
+            return response               
         except Exception as E:
-            print(f"[E_CMD_FAILED] Invalid grip command resulted in {E}.")
+            logger.error("[E_CMD_FAILED] Invalid grip command resulted in %s.", E)
             
     
     def release(self, command):
@@ -307,25 +1244,38 @@ class GripperDriver:
         '''
         
         try:
-            match = re.match(r"release(?:\(\s*(?:(\d*\.?\d+)(?:\s*,\s*(\d*\.?\d+))?)?\s*\))?$", command, re.IGNORECASE)
-            if match: # Type checking
-                pull_back_distance, release_speed_limit = None, None
-                values = [float(v) for v in match.groups() if v is not None]
-                if len(values) == 2:
-                    pull_back_distance, release_speed_limit = values[0], values[1]
-                    self._send_command(f"RELEASE({pull_back_distance},{release_speed_limit})")
-                elif len(values) == 1:
-                    pull_back_distance = values[0]
-                    self._send_command(f"RELEASE({pull_back_distance})")
-                else:
-                    self._send_command(f"RELEASE()")
-                response = self._receive_response()   
+            gcl_command = build_release_command(command)
+            if gcl_command is None:
+                return
+            self._send_command(gcl_command)
+            response = self._receive_response()   
 
-                return response 
-            else:
-                print("[E_NOT_ENOUGH_PARAMS] Invalid release command. Run help to know more.")
+            return response 
         except Exception as E:
-            print(f"[E_CMD_FAILED] Invalid release command resulted in {E}.")
+            logger.error("[E_CMD_FAILED] Invalid release command resulted in %s.", E)
+
+    def run_cycle(self, steps):
+        '''
+            Runs a pick cycle, e.g. ["move(30, 500)", "grip(5, 25, 500)", "release(10, 500)", "move(110)"],
+            as one GCL 'SEQ' command: the gripper executes the steps back-to-back and streams ACK/FIN
+            per step, so the whole cycle costs a single round trip.
+            Returns a list of StepResult for the steps that ran; if a step failed (e.g. NO PART) it
+            is the last one and the remaining steps were skipped. Returns None on errors.
+        '''
+
+        try:
+            sequence = gcl.sequence(*steps)
+        except gcl.GclError as e:
+            logger.error("[E_NOT_ENOUGH_PARAMS] Invalid cycle: %s", e)
+            return None
+        for step in sequence.args:
+            if step.name == "MOVE" and build_move_command(step, self.state) is None:
+                return None
+        self._send_command(str(sequence))
+        response = self._receive_response()
+        if not response:
+            return None
+        return parse_sequence_response(response)
 
 if __name__ == "__main__":
     '''
@@ -337,5 +1287,8 @@ if __name__ == "__main__":
         directly from the terminal for testing or debugging purposes.
     '''
     
+    from interact import run_cli_ui
+
+    setup_logging(default_level="DEBUG")
     driver = GripperDriver()
     run_cli_ui(driver)
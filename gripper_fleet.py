@@ -0,0 +1,214 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import asyncio
+import logging
+import threading
+from async_gripper_driver import AsyncGripperDriver
+
+logger = logging.getLogger("gripper.fleet")
+
+
+class GripperFleet:
+    '''
+        GripperFleet drives many grippers from one process with a single I/O thread.
+
+        Every member is an AsyncGripperDriver; all of them share one asyncio event loop that runs
+        in a background thread, so N grippers cost N sockets but no extra threads. The blocking
+        API offers broadcast and scatter/gather operations that return a dict keyed by member name.
+        Members that lose their connection are skipped (their result is None) and reconnected in
+        the background with exponential backoff, without stalling the other members.
+
+        Features:
+            - One event loop thread for all connections
+            - Broadcast of raw GCL commands and scatter/gather of driver calls
+            - Per-member reconnection with backoff in the background
+
+        Attributes:
+            - members (dict or iterable): name -> (host, port), or (host, port) pairs named by index
+            - timeout (int): Timeout for establishing each connection
+            - reconnect_interval (float): First delay between reconnection attempts of a member
+            - max_reconnect_interval (float): Upper bound of the reconnection delay
+    '''
+
+    def __init__(self, members, timeout=5, reconnect_interval=0.5, max_reconnect_interval=10.0):
+        if not isinstance(members, dict):
+            members = dict(enumerate(members))
+        self.timeout = timeout
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self.drivers = {name: AsyncGripperDriver(host, port, timeout) for name, (host, port) in members.items()}
+        self._reconnecting = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run(self, coro):
+        '''
+            Runs a coroutine on the fleet's event loop and waits for its result.
+        '''
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def connect(self):
+        '''
+            Connects all members concurrently. Returns a dict name -> connected (bool).
+            Members that could not connect keep being retried in the background.
+        '''
+
+        async def connect_all():
+            results = await asyncio.gather(*(driver.connect() for driver in self.drivers.values()))
+            for name, connected in zip(self.drivers, results):
+                if not connected:
+                    self._schedule_reconnect(name)
+            return dict(zip(self.drivers, results))
+
+        return self._run(connect_all())
+
+    def close(self):
+        '''
+            Closes all connections and stops the I/O thread.
+        '''
+
+        async def close_all():
+            for task in self._reconnecting.values():
+                task.cancel()
+            await asyncio.gather(*(driver.close() for driver in self.drivers.values()))
+
+        self._run(close_all())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _schedule_reconnect(self, name):
+        '''
+            Starts a background reconnection task for member `name` unless one is running.
+            Must be called on the event loop.
+        '''
+
+        task = self._reconnecting.get(name)
+        if task is None or task.done():
+            self._reconnecting[name] = self._loop.create_task(self._reconnect(name))
+
+    async def _reconnect(self, name):
+        '''
+            Reconnects member `name` with exponential backoff.
+        '''
+
+        driver = self.drivers[name]
+        delay = self.reconnect_interval
+        while not driver.connected:
+            await asyncio.sleep(delay)
+            if await driver.connect():
+                logger.info("[E_SUCCESS] Fleet member %s reconnected.", name)
+                return
+            delay = min(2 * delay, self.max_reconnect_interval)
+
+    def gather(self, method, *args, names=None):
+        '''
+            Calls the AsyncGripperDriver coroutine `method` with `args` on every connected member
+            (or only on `names`) concurrently. Returns a dict name -> result; members that are
+            disconnected or fail yield None and are reconnected in the background.
+        '''
+
+        async def call_all():
+            selected = list(self.drivers) if names is None else list(names)
+            connected = [name for name in selected if self.drivers[name].connected]
+            results = await asyncio.gather(*(getattr(self.drivers[name], method)(*args) for name in connected), return_exceptions=True)
+            gathered = dict.fromkeys(selected)
+            for name, result in zip(connected, results):
+                if not isinstance(result, BaseException):
+                    gathered[name] = result
+            for name in selected:
+                if not self.drivers[name].connected:
+                    self._schedule_reconnect(name)
+            return gathered
+
+        return self._run(call_all())
+
+    def broadcast(self, cmd, names=None):
+        '''
+            Sends the raw GCL command `cmd` to every member. Returns a dict name -> response lines.
+        '''
+
+        return self.gather("command", cmd, names=names)
+
+    def calibrate(self, names=None):
+        '''
+            Calibrates every member. Returns a dict name -> response lines.
+        '''
+
+        return self.gather("calibrate", names=names)
+
+    def stop(self, names=None):
+        '''
+            Returns every member to the IDLE state. Returns a dict name -> response lines.
+        '''
+
+        return self.gather("stop", names=names)
+
+    def move_to(self, command, names=None):
+        '''
+            Sends the same move command (e.g. 'move(20, 500)') to every member.
+        '''
+
+        return self.gather("move_to", command, names=names)
+
+    def _values(self, method, field, max_age, names):
+        responses = self.gather(method, max_age, names=names)
+        return {name: getattr(self.drivers[name].state, field) if response else None for name, response in responses.items()}
+
+    def get_pos(self, max_age=None, names=None):
+        '''
+            Returns a dict name -> width in mm (None for unreachable members).
+        '''
+
+        return self._values("get_pos", "width_mm", max_age, names)
+
+    def get_speed(self, max_age=None, names=None):
+        '''
+            Returns a dict name -> speed in mm/s (None for unreachable members).
+        '''
+
+        return self._values("get_speed", "speed", max_age, names)
+
+    def get_force(self, max_age=None, names=None):
+        '''
+            Returns a dict name -> force in N (None for unreachable members).
+        '''
+
+        return self._values("get_force", "torque", max_age, names)
+
+    def get_gripstate(self, max_age=None, names=None):
+        '''
+            Returns a dict name -> gripstate (None for unreachable members).
+        '''
+
+        return self._values("get_gripstate", "gripstate", max_age, names)
@@ -0,0 +1,138 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Logging for the driver, simulator and fleet.
+#
+# All modules log to children of the 'gripper' logger ('gripper.driver', 'gripper.sim', ...).
+# Per-message traffic (commands sent, responses received) is logged at DEBUG, connection events
+# at INFO, problems at WARNING/ERROR. Records carry structured fields in `extra`:
+#     command (GCL command), latency (seconds from send to complete response), gripstate
+#
+# Without `setup_logging` nothing is configured and records propagate to the root logger as
+# usual for a library. `setup_logging` moves formatting and I/O to a QueueListener thread, so
+# the I/O path only pays for creating the record and putting it on a queue.
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+STRUCTURED_FIELDS = ("command", "latency", "gripstate")
+
+DEFAULT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_listener = None
+
+
+class LazyJoin:
+    '''
+        Joins response lines only when the record is formatted, i.e. on the listener thread.
+    '''
+
+    __slots__ = ("lines", "separator")
+
+    def __init__(self, lines, separator=", "):
+        self.lines = lines
+        self.separator = separator
+
+    def __str__(self):
+        return self.separator.join(self.lines)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    '''
+        QueueHandler that enqueues records unformatted.
+
+        The stock QueueHandler formats the message in the logging thread before enqueueing it;
+        for an in-process queue the record can be passed as is and formatted by the listener.
+    '''
+
+    def prepare(self, record):
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    '''
+        Formats records as one JSON object per line, including the structured fields.
+    '''
+
+    def format(self, record):
+        entry = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def setup_logging(level=None, handler=None, json_format=False, default_level="INFO"):
+    '''
+        Routes the 'gripper' loggers through a QueueHandler/QueueListener pair.
+
+        `level` defaults to the GRIPPER_LOG_LEVEL environment variable, then to `default_level`,
+        so verbose output can be switched on or off without code changes. `handler` receives the
+        formatted records on the listener thread (stdout by default). Returns the listener.
+    '''
+
+    global _listener
+    stop_logging()
+    if level is None:
+        level = os.environ.get("GRIPPER_LOG_LEVEL", default_level)
+    if handler is None:
+        handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(DEFAULT_FORMAT))
+
+    records = queue.SimpleQueue()
+    logger = logging.getLogger("gripper")
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.addHandler(DeferredQueueHandler(records))
+    logger.propagate = False
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    '''
+        Flushes and stops the listener started by `setup_logging` and restores the default configuration.
+    '''
+
+    global _listener
+    logger = logging.getLogger("gripper")
+    for handler in list(logger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,215 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import json
+import threading
+from bisect import bisect_left
+
+import gcl
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Latency phases of a command: written -> first 'ACK' line -> final 'END'
+PHASES = ("send_to_ack", "ack_to_fin", "total")
+
+COUNTERS = ("commands", "timeouts", "errors", "reconnects", "bytes_sent", "bytes_received", "heartbeats", "link_losses", "coalesced")
+
+
+def command_key(cmd):
+    '''
+        Returns the name latencies of `cmd` are filed under: the GCL command name, with " NOWAIT"
+        for NOWAIT moves, e.g. "MOVE", "MOVE NOWAIT" or "SEQ".
+    '''
+
+    try:
+        command = gcl.parse(cmd)
+    except gcl.GclError:
+        return cmd.partition("(")[0].strip().upper()
+    return f"{command.name} NOWAIT" if command.nowait else command.name
+
+
+class Histogram:
+    '''
+        Fixed-bucket latency histogram.
+
+        Recording is a bisect over a short tuple plus three additions under an uncontended lock,
+        so it is cheap enough to run on every command. Quantiles are estimated by linear
+        interpolation inside the bucket that contains them.
+    '''
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        '''
+            Records one observation in seconds.
+        '''
+
+        i = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q):
+        '''
+            Estimates the `q` quantile (0..1), or returns None if nothing was recorded.
+        '''
+
+        with self._lock:
+            counts, count = list(self.counts), self.count
+        if count == 0:
+            return None
+        rank = q * count
+        seen = 0
+        for i, n in enumerate(counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+    def snapshot(self):
+        '''
+            Returns count, sum, p50/p95/p99 estimates and the cumulative bucket counts.
+        '''
+
+        with self._lock:
+            counts, count, total = list(self.counts), self.count, self.sum
+        cumulative, buckets = 0, {}
+        for bound, n in zip(self.bounds + (float("inf"),), counts):
+            cumulative += n
+            buckets[_format_bound(bound)] = cumulative
+        return {
+            "count": count,
+            "sum": total,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class DriverMetrics:
+    '''
+        Per-command latency histograms and connection counters of one driver.
+
+        Latencies are recorded per GCL command name (e.g. 'MOVE', 'POS?') and phase:
+            - send_to_ack: command written until the first 'ACK' line is read
+            - ack_to_fin: first 'ACK' line until the response is complete
+            - total: command written until the response is complete
+
+        Counters: commands, timeouts, errors, reconnects, bytes_sent, bytes_received, heartbeats
+        (sent by the watchdog), link_losses (links the watchdog declared down) and coalesced
+        (queries that shared another thread's in-flight query, see COUNTERS).
+    '''
+
+    def __init__(self):
+        self._histograms = {}
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def histogram(self, command, phase):
+        '''
+            Returns the histogram of `command` for `phase`, creating it on first use.
+        '''
+
+        key = (command, phase)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def increment(self, counter, amount=1):
+        '''
+            Adds `amount` to one of the COUNTERS.
+        '''
+
+        with self._lock:
+            self._counters[counter] += amount
+
+    def record(self, pending):
+        '''
+            Records the latencies of a completed PendingResponse from its timestamps.
+        '''
+
+        if pending.sent_at is None or pending.done_at is None:
+            return
+        command = command_key(pending.cmd)
+        self.histogram(command, "total").observe(pending.done_at - pending.sent_at)
+        if pending.ack_at is not None:
+            self.histogram(command, "send_to_ack").observe(pending.ack_at - pending.sent_at)
+            self.histogram(command, "ack_to_fin").observe(pending.done_at - pending.ack_at)
+
+    def snapshot(self):
+        '''
+            Returns a plain dict with all counters and the latency summary of every command.
+        '''
+
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+        latency = {}
+        for (command, phase), histogram in sorted(histograms.items()):
+            latency.setdefault(command, {})[phase] = histogram.snapshot()
+        return {"counters": counters, "latency": latency}
+
+    def to_json(self, **kwargs):
+        '''
+            Returns the snapshot as a JSON string.
+        '''
+
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, prefix="gripper"):
+        '''
+            Returns the metrics in the Prometheus text exposition format.
+        '''
+
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in snapshot["counters"].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        metric = f"{prefix}_command_latency_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for command, phases in snapshot["latency"].items():
+            for phase, summary in phases.items():
+                labels = f'command="{command}",phase="{phase}"'
+                for bound, cumulative in summary["buckets"].items():
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{metric}_sum{{{labels}}} {summary['sum']:.9g}")
+                lines.append(f"{metric}_count{{{labels}}} {summary['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
@@ -21,10 +21,210 @@
 
 '''
 
+import argparse
+import asyncio
+import logging
 import socket
 import threading
-import re
 import time
+import gcl
+import wsg_codec
+from gripper_logging import setup_logging
+
+logger = logging.getLogger("gripper.sim")
+
+
+class RealClock:
+    '''
+        Simulated time that follows the wall clock, optionally accelerated.
+
+        With `speedup` > 1 every simulated delay (motion, release) passes `speedup` times faster,
+        while the state transitions stay the same.
+    '''
+
+    def __init__(self, speedup=1.0):
+        self.speedup = speedup
+        self._origin = time.monotonic()
+
+    def now(self):
+        '''
+            Returns the current simulated time in seconds.
+        '''
+
+        return (time.monotonic() - self._origin) * self.speedup
+
+    async def sleep(self, duration):
+        '''
+            Waits for `duration` seconds of simulated time.
+        '''
+
+        await asyncio.sleep(duration / self.speedup)
+
+
+class VirtualClock:
+    '''
+        Simulated time that advances instantly.
+
+        `sleep` moves the simulated time forward by the requested duration and only yields to the
+        event loop, so motion completes immediately but goes through the same state transitions.
+        Useful for fast, deterministic tests.
+    '''
+
+    def __init__(self):
+        self._now = 0.0
+
+    def now(self):
+        '''
+            Returns the current simulated time in seconds.
+        '''
+
+        return self._now
+
+    async def sleep(self, duration):
+        '''
+            Advances the simulated time by `duration` seconds without waiting.
+        '''
+
+        self._now += duration
+        await asyncio.sleep(0)
+
+
+class Motion:
+    '''
+        A finger motion in progress: the width is interpolated linearly over simulated time, so
+        queries and STOP during the move see intermediate widths.
+    '''
+
+    def __init__(self, clock, start, target, duration):
+        self.clock = clock
+        self.start = start
+        self.target = target
+        self.duration = duration
+        self.started_at = clock.now()
+        self.done = asyncio.get_running_loop().create_future()
+        self.session = None
+        self.timer = None
+
+    def position(self):
+        '''
+            Returns the width reached at the current simulated time.
+        '''
+
+        if self.duration <= 0:
+            return self.target
+        fraction = min(1.0, (self.clock.now() - self.started_at) / self.duration)
+        return round(self.start + (self.target - self.start) * fraction, 3)
+
+
+class ClientSession:
+    '''
+        Per-connection context of the mock gripper.
+
+        All writes go through the connection's asyncio StreamWriter from the server's event
+        loop, so command responses and AUTOSEND telemetry never interleave within a line.
+        Responses are written in the protocol selected by the client: newline-terminated
+        text lines closed by 'END', or binary WSG frames (see wsg_codec) after the client
+        switched the connection with 'PROTOCOL(BINARY)'.
+    '''
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.autosend_task = None
+        self.binary = False
+        self.command_id = 0
+        self.result = None
+        self.in_sequence = False
+        self.step_status = None
+        self._out = []
+
+    def send(self, data):
+        '''
+            Writes raw bytes to the client.
+        '''
+
+        self.writer.write(data)
+
+    def flush(self):
+        '''
+            Sends the response lines queued so far in a single write.
+        '''
+
+        if self._out:
+            data = b"".join(self._out)
+            self._out = []
+            self.send(data)
+
+    def begin(self, command_id):
+        '''
+            Starts the response to the binary command `command_id`.
+        '''
+
+        self.command_id = command_id
+        self.result = None
+
+    def reply(self, line):
+        '''
+            Queues one response line, e.g. 'ACK MOVE'.
+        '''
+
+        if self.binary:
+            self._out.append(wsg_codec.encode_response(self.command_id, wsg_codec.E_CMD_PENDING, line.encode()))
+        else:
+            self._out.append(f"{line}\n".encode())
+
+    def value(self, key, value):
+        '''
+            Queues the result of a query, e.g. ('POS', 110.0).
+        '''
+
+        if self.binary:
+            self.result = (key, value)
+        elif key == "STATUS":
+            self.reply(",".join(str(v) for v in value))
+        else:
+            self.reply(f"{key}={value}")
+
+    def end(self, status=wsg_codec.E_SUCCESS):
+        '''
+            Completes the response of the current command and sends it.
+            Inside a sequence only the step's lines are sent and its status is kept in `step_status`.
+        '''
+
+        if self.in_sequence:
+            self.step_status = status
+        elif not self.binary:
+            self._out.append(b"END\n")
+        elif self.result is not None and status == wsg_codec.E_SUCCESS:
+            self._out.append(wsg_codec.encode_result(*self.result))
+        else:
+            self._out.append(wsg_codec.encode_response(self.command_id, status))
+        self.flush()
+
+    def start_autosend(self, rate_hz, telemetry):
+        '''
+            Pushes `telemetry()` to the client `rate_hz` times per second until stopped.
+        '''
+
+        period = 1.0 / rate_hz
+
+        async def push():
+            loop = asyncio.get_running_loop()
+            next_time = loop.time()
+            while not self.writer.is_closing():
+                self.send(telemetry().encode())
+                next_time += period
+                await asyncio.sleep(max(0.0, next_time - loop.time()))
+
+        self.autosend_task = asyncio.get_running_loop().create_task(push())
+
+    def stop_autosend(self):
+        '''
+            Stops the telemetry stream of this client, if any.
+        '''
+
+        if self.autosend_task is not None:
+            self.autosend_task.cancel()
+            self.autosend_task = None
 
 
 class MockServer:
@@ -41,15 +241,42 @@ class MockServer:
             - Sends simulated multi-line responses (e.g., ACK, FIN, STATUS)
             - Maintains an internal GripperState object to track position, speed, and torque
             - Can simulate delays, state updates, and communication behavior of a real gripper
+            - Serves all clients from one asyncio event loop; motion delays are non-blocking timers
+            - Streams position, speed and force at a requested rate after AUTOSEND(<RATE_HZ>)
+            - Speaks binary WSG frames instead of text after PROTOCOL(BINARY)
+            - Models the finger position over time: POS?/STATUS during a move report intermediate
+              widths, STOP or a new motion preempts it, and 'MOVE(...) NOWAIT' is acknowledged at
+              once and reports its end with an 'EVENT FIN MOVE <width>' / 'EVENT ABORT MOVE <width>' line
+            - Answers 'HEARTBEAT' at once with 'EVENT HEARTBEAT <gripstate>', even during a MOVE of the same connection
+            - Simulates power cycles (`power_cycle`): all connections drop and the gripper comes back
+              uncalibrated, rejecting motion commands until CALIBRATE
         
         Attributes:
             - host (str): IP address to bind the server socket
-            - port (int): Port number to listen for client connections
+            - port (int): Port number to listen for client connections (0 picks a free port)
+            - clock: Source of simulated time (RealClock by default, VirtualClock for instant motion)
+            - ready (threading.Event): Set once the server accepts connections
     '''
     
-    def __init__(self, host='127.0.0.1', port=8000):
+    # GCL command name -> handler name (do_<name>)
+    BINARY_HANDLERS = {
+        "BYE": "bye", "CALIBRATE": "calibrate", "MOVE": "move", "STOP": "stop", "GRIP": "grip", "RELEASE": "release",
+        "STATUS": "status", "GRIPSTATE?": "gripstate", "POS?": "pos", "SPEED?": "speed", "FORCE?": "force",
+    }
+    TEXT_HANDLERS = dict(BINARY_HANDLERS, AUTOSEND="autosend", SEQ="seq", HEARTBEAT="heartbeat")
+    # Handlers rejected with E_NOT_INITIALIZED until the gripper is calibrated
+    NEEDS_CALIBRATION = frozenset(("move", "move_nowait", "grip", "release", "seq"))
+
+    def __init__(self, host='127.0.0.1', port=8000, clock=None):
         self.host = host
         self.port = port
+        self.clock = clock if clock is not None else RealClock()
+        self.ready = threading.Event()
+        self._loop = None
+        self._stopping = None
+        self._server = None
+        self._clients = {}
+        self._motion = None
 
         # Default Values
         self.width = 110 # mm
@@ -57,6 +284,7 @@ class MockServer:
         self.torque = 5 # N
         self.min_width = 0.0 # mm
         self.max_width = 110.0 # mm
+        self.is_calibrated = True
         self.is_connected = False 
         self.gripstate = 0
         self.pull_back_distance = 10 # mm; relative to current position
@@ -64,13 +292,15 @@ class MockServer:
         self.PART_FALL_WIDTH_THRESHOLD = 10 # mm
         self.grip_speed_limit = 500 # mm/s
         self.grip_part_width = 25 # mm
+        self.MAX_AUTOSEND_RATE = 1000 # Hz
+        self.backlog = 4096
     
     def to_status_string(self):
         '''
             Returns default parameters with its values as a string.
         '''
         
-        return f"{self.width},{self.speed},{self.torque},{self.min_width},{self.max_width}"
+        return f"{self.position()},{self.speed},{self.torque},{self.min_width},{self.max_width},{self.gripstate}"
 
     def to_calibration_string(self):
         '''
@@ -79,183 +309,483 @@ class MockServer:
         
         return f"{self.min_width},{self.max_width}"
 
-    def handle_client(self, conn, addr):
+    def to_telemetry_string(self):
+        '''
+            Returns the unsolicited telemetry line pushed to AUTOSEND subscribers.
+        '''
+
+        return f"TELEMETRY {self.position()},{self.speed},{self.torque}\n"
+
+    def position(self):
+        '''
+            Returns the current finger width, interpolated while a motion is running.
+        '''
+
+        return self._motion.position() if self._motion is not None else self.width
+
+    def _start_motion(self, width):
+        '''
+            Starts moving the fingers to `width` at the current speed, preempting a running motion.
+        '''
+
+        self._stop_motion()
+        duration = min(9.9, (abs(self.width - width) / self.speed) * 10)
+        motion = Motion(self.clock, self.width, width, duration)
+        self._motion = motion
+        self.gripstate = 6
+        motion.timer = asyncio.ensure_future(self._run_motion(motion))
+        return motion
+
+    async def _run_motion(self, motion):
+        await self.clock.sleep(motion.duration)
+        self._finish_motion(motion, True)
+
+    def _stop_motion(self):
+        '''
+            Stops the running motion, if any, at its current width.
+        '''
+
+        motion = self._motion
+        if motion is not None:
+            motion.timer.cancel()
+            self._finish_motion(motion, False)
+
+    def _finish_motion(self, motion, completed):
+        '''
+            Ends `motion` (reached its target if `completed`, else stopped) and reports it to
+            whoever waits for it: the MOVE handler or, for NOWAIT, an event line to the client.
+        '''
+
+        if self._motion is not motion:
+            return
+        self.width = motion.target if completed else motion.position()
+        self._motion = None
+        self.gripstate = 0
+        if not motion.done.done():
+            motion.done.set_result(completed)
+        session = motion.session
+        if session is not None and not session.writer.is_closing():
+            session.send(f"EVENT {'FIN' if completed else 'ABORT'} MOVE {self.width}\n".encode())
+
+    async def handle_client(self, reader, writer):
         ''' 
             Handles communication with a connected client.
 
-            This method runs in a dedicated thread or process for each client connection.
-            It receives GCL commands sent over the socket, processes them by updating the
-            internal GripperState accordingly, and sends appropriate simulated responses
-            (e.g., 'ACK', 'FIN', 'STATUS') back to the client.
+            This coroutine runs on the server's event loop for each client connection, so
+            thousands of clients share one thread and a long MOVE only delays its own connection.
+            Commands are framed by newlines, so a client may pipeline several commands
+            without waiting for each response. Every complete line is processed in arrival
+            order, which keeps the responses in the same order as the requests.
+            After 'PROTOCOL(BINARY)' the connection carries binary WSG frames instead.
+            The stream is read ahead of command execution (see `read_ahead`), so heartbeats are
+            answered while a command of this connection is still running.
         '''
         
-        print(f"[SERVER] Connected by {addr}")
-        with conn:
-            self.gripstate = 1
+        addr = writer.get_extra_info("peername")
+        logger.info("[SERVER] Connected by %s", addr)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = ClientSession(writer)
+        decoder = wsg_codec.FrameDecoder()
+        self._clients[writer] = asyncio.current_task()
+        self.gripstate = 1
+        buffer = b""
+        chunks = asyncio.Queue()
+        read_ahead = asyncio.get_running_loop().create_task(self.read_ahead(reader, session, chunks))
+        try:
             while True:
-                try:
-                    data = conn.recv(1024)
-                    if not data:
+                data = await chunks.get()
+                if isinstance(data, Exception):
+                    raise data
+                if not data:
+                    break
+                if session.binary:
+                    for command_id, payload in decoder.feed(data):
+                        await self.process_frame(command_id, payload, session)
+                    await writer.drain()
+                    continue
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                for i, line in enumerate(lines):
+                    command = line.decode().strip()
+                    if command:
+                        await self.process_command(command, session)
+                    if session.binary:
+                        remainder = b"\n".join(lines[i + 1:] + [buffer])
+                        for command_id, payload in decoder.feed(remainder):
+                            await self.process_frame(command_id, payload, session)
                         break
-                    command = data.decode().strip()
-                    print(f"[SERVER] Received: {command}")
-
-                    if command.startswith("MOVE"):
-                        try:
-                            conn.sendall(b"ACK MOVE\n")
-                            match = re.match(r"MOVE\(\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)", command)
-                            if match:
-                                self.speed = float(match.group(2)) if match.group(2) is not None else self.speed
-                                time_to_move = (abs(self.width - float(match.group(1))) / self.speed) * 10
-                                self.width = float(match.group(1))
-                                self.gripstate = 6
-                                sleep_duration = min(9.9, time_to_move)
-                                time.sleep(sleep_duration)
-                                self.gripstate = 0
-                                conn.sendall(b"FIN MOVE\n")
-                                conn.sendall(b"END\n")
-                            else:
-                                self.gripstate = 7
-                                conn.sendall(b"ERROR\n")
-                                conn.sendall(b"END\n")
-                        except Exception as e:
-                            self.gripstate = 7
-                            error_msg = f"ERROR: {e}\n"
-                            conn.sendall(error_msg.encode('utf-8'))
-                            conn.sendall(b"END\n")
-
-                    elif command == "STATUS":
-                        response = self.to_status_string().encode()
-                        conn.sendall(response)
-                        conn.sendall(b"\nEND\n")
-
-                    elif command == "POS?":
-                        response = "POS="+str(self.width)+"\n"
-                        conn.sendall(response.encode())
-                        conn.sendall(b"END\n")
-                    
-                    elif command == "SPEED?":
-                        response = "SPEED="+str(self.speed)+"\n"
-                        conn.sendall(response.encode())
-                        conn.sendall(b"END\n")
-                    
-                    elif command == "FORCE?":
-                        response = "FORCE="+str(self.torque)+"\n"
-                        conn.sendall(response.encode())
-                        conn.sendall(b"END\n")
-                    
-                    elif command == "GRIPSTATE?":
-                        response = "GRIPSTATE="+str(self.gripstate)+"\n"
-                        conn.sendall(response.encode())
-                        conn.sendall(b"END\n")
-
-                    elif command == "CALIBRATE":
-                        self.gripstate = 0
-                        conn.sendall(b"ACK CALIBRATE\n")
-                        self.min_width = 0.0
-                        self.max_width = 110.0
-                        conn.sendall(b"FIN CALIBRATE\n")
-                        conn.sendall(b"END\n")
-                    
-                    elif command == "BYE":
-                        self.is_connected = False
-                        conn.sendall(b"ACK BYE\n")
-                        conn.sendall(b"END\n")
-                    
-                    elif command == "STOP":
-                        conn.sendall(b"ACK STOP\n")
-                        self.gripstate = 0
-                        conn.sendall(b"FIN STOP\n")
-                        conn.sendall(b"END\n")
-                    
-                    elif command.startswith("GRIP"):
-                        try:
-                            conn.sendall(b"ACK GRIP\n")
-                            self.gripstate = 1
-                            pattern = r"GRIP(?:\(\s*((?:\d*\.?\d+\s*(?:,\s*\d*\.?\d+\s*)*)?)\))?$"
-                            match = re.match(pattern, command)
-                            if match is not None:
-                                arg_str = match.group(1)
-                                values = [float(x.strip()) for x in arg_str.split(",")] if arg_str else []
-                                if len(values) == 3:
-                                    self.torque, self.grip_part_width, self.grip_speed_limit = values[0], values[1], values[2]
-                                elif len(values) == 2:
-                                    self.torque, self.grip_part_width = values[0], values[1]
-                                elif len(values) == 1:
-                                    self.torque = values[0]
-
-                                if abs(self.width - self.grip_part_width) >= self.PART_FALL_WIDTH_THRESHOLD:
-                                    self.gripstate=2 # NO PART
-                                    conn.sendall(b"No part detected between the fingers. Set width between the fingers and width of the part correctly.\n")
-                                    conn.sendall(b"ACK NO PART\n")
-                                    conn.sendall(b"END\n")
-                                else:
-                                    self.gripstate=4 # HOLDING
-                                    conn.sendall(b"ACK HOLDING\n")
-                                    conn.sendall(b"FIN GRIP\n")
-                                    conn.sendall(b"END\n")
-                            else:
-                                self.gripstate = 7
-                                conn.sendall(b"ERROR\n")
-                                conn.sendall(b"END\n")
-                        except Exception as e:
-                                self.gripstate = 7
-                                error_msg = f"ERROR: {e}\n"
-                                conn.sendall(error_msg.encode('utf-8'))
-                                conn.sendall(b"END\n")
-                        
-                    elif command.startswith("RELEASE"):
-                        try:
-                            conn.sendall(b"ACK RELEASE\n")
-                            match = re.match(r"release(?:\(\s*(?:(\d*\.?\d+)(?:\s*,\s*(\d*\.?\d+))?)?\s*\))?$", command, re.IGNORECASE)
-                            if match and self.gripstate in [2, 3, 4]:
-                                values = [float(v) for v in match.groups() if v is not None]
-                                if len(values) == 2:
-                                    self.pull_back_distance, self.release_speed_limit = values[0], values[1]
-                                elif len(values) == 1:
-                                    self.pull_back_distance = values[0]
-
-                                self.gripstate = 5
-                                sleep_duration = min(9.9, self.pull_back_distance / (self.release_speed_limit/100))
-                                time.sleep(sleep_duration) # Diving by 100 to show difference
-                                self.width = max(0.0, self.width - self.pull_back_distance)
-                                self.gripstate = 0
-                                conn.sendall(b"FIN RELEASE\n")
-                                conn.sendall(b"END\n")
-                            else:
-                                self.gripstate = 7
-                                conn.sendall(b"ERROR. Was the part gripped?\n")
-                                conn.sendall(b"END\n")
-                        except Exception as e:
-                            self.gripstate = 7
-                            error_msg = f"ERROR: {e}\n"
-                            conn.sendall(error_msg.encode('utf-8'))
-                            conn.sendall(b"END\n")
-                            
-                    else:
-                        self.gripstate = 7
-                        conn.sendall(b"ERROR: Unknown command\n")
-                        conn.sendall(b"END\n")
-
-                except ConnectionResetError:
-                    self.gripstate = 7
-                    print("[SERVER] Connection reset by client.")
+                await writer.drain()
+
+        except ConnectionError:
+            self.gripstate = 7
+            logger.info("[SERVER] Connection reset by client.", extra={"gripstate": self.gripstate})
+        finally:
+            read_ahead.cancel()
+            session.stop_autosend()
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def read_ahead(self, reader, session, chunks):
+        '''
+            Reads the client's stream into `chunks` for the command loop of `handle_client`.
+            Complete text-mode 'HEARTBEAT' lines are answered right here and dropped from the stream.
+        '''
+
+        text = True
+        at_line_start = True
+        try:
+            while (data := await reader.read(4096)):
+                if text:
+                    ends_line = data.endswith(b"\n")
+                    if b"HEARTBEAT" in data or b"heartbeat" in data:
+                        data = self._take_heartbeats(data, session, at_line_start)
+                    if b"PROTOCOL(BINARY)" in data:
+                        text = False
+                    at_line_start = ends_line
+                if data:
+                    chunks.put_nowait(data)
+        except ConnectionError as e:
+            chunks.put_nowait(e)
+        finally:
+            chunks.put_nowait(b"")
+
+    def _take_heartbeats(self, data, session, at_line_start):
+        lines = data.split(b"\n")
+        kept = []
+        for i, line in enumerate(lines):
+            complete = (i > 0 or at_line_start) and i < len(lines) - 1
+            if complete and line.strip().upper() == b"HEARTBEAT":
+                self.do_heartbeat(session)
+                continue
+            kept.append(line)
+            if line.strip() == b"PROTOCOL(BINARY)":
+                kept.extend(lines[i + 1:])
+                break
+        return b"\n".join(kept)
+
+    async def process_command(self, command, session):
+        '''
+            Processes a single text GCL command by parsing its arguments and executing it.
+            Responses (e.g., 'ACK', 'FIN', 'STATUS') are sent through the client `session`.
+        '''
+
+        logger.debug("[SERVER] Received: %s", command, extra={"command": command, "gripstate": self.gripstate})
+
+        if command == "PROTOCOL(BINARY)":
+            session.reply("ACK PROTOCOL")
+            session.end()
+            session.binary = True
+            return
+        try:
+            parsed = gcl.parse(command)
+        except gcl.GclError as e:
+            if e.name is None:
+                self.reject(session, "ERROR: Unknown command", status=e.status)
+            else:
+                self.reject(session, f"ACK {e.name}", "ERROR", status=e.status)
+            return
+        name = self.TEXT_HANDLERS[parsed.name]
+        await self.execute(session, f"{name}_nowait" if parsed.nowait else name, *parsed.args)
+
+    async def process_frame(self, command_id, payload, session):
+        '''
+            Processes a single binary command frame. Arguments are unpacked with `struct`,
+            so no text parsing takes place.
+        '''
+
+        session.begin(command_id)
+        try:
+            name, args = wsg_codec.decode_args(command_id, payload)
+        except wsg_codec.ProtocolError as e:
+            self.reject(session, f"ERROR: {e}", status=wsg_codec.E_CMD_UNKNOWN)
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SERVER] Received: %s%s", name, args if args else "", extra={"command": name, "gripstate": self.gripstate})
+        if name == "MOVE" and args[0] is None:
+            self.reject(session, "ACK MOVE", "ERROR", status=wsg_codec.E_NOT_ENOUGH_PARAMS)
+            return
+        await self.execute(session, self.BINARY_HANDLERS[name], *args)
+
+    async def execute(self, session, name, *args):
+        '''
+            Runs the handler `do_<name>` with typed arguments, awaiting it if it is a coroutine.
+            Unexpected errors put the gripper into the ERROR state and are reported to the client.
+        '''
+
+        if not self.is_calibrated and name in self.NEEDS_CALIBRATION:
+            session.reply("ERROR: Gripper not calibrated")
+            session.end(wsg_codec.E_NOT_INITIALIZED)
+            return
+        try:
+            result = getattr(self, f"do_{name}")(session, *args)
+            if result is not None:
+                await result
+        except Exception as e:
+            self.gripstate = 7
+            session.reply(f"ERROR: {e}")
+            session.end(wsg_codec.E_CMD_FAILED)
+
+    def reject(self, session, *lines, status=wsg_codec.E_CMD_FORMAT_ERROR):
+        '''
+            Answers a malformed command: sends `lines`, and puts the gripper into the ERROR state.
+        '''
+
+        self.gripstate = 7
+        for line in lines:
+            session.reply(line)
+        session.end(status)
+
+    def do_status(self, session):
+        session.value("STATUS", (self.position(), self.speed, self.torque, self.min_width, self.max_width, self.gripstate))
+        session.end()
+
+    def do_pos(self, session):
+        session.value("POS", self.position())
+        session.end()
+
+    def do_speed(self, session):
+        session.value("SPEED", self.speed)
+        session.end()
+
+    def do_force(self, session):
+        session.value("FORCE", self.torque)
+        session.end()
+
+    def do_gripstate(self, session):
+        session.value("GRIPSTATE", self.gripstate)
+        session.end()
+
+    def do_calibrate(self, session):
+        self.gripstate = 0
+        session.reply("ACK CALIBRATE")
+        self.min_width = 0.0
+        self.max_width = 110.0
+        self.is_calibrated = True
+        session.reply("FIN CALIBRATE")
+        session.end()
+
+    def do_bye(self, session):
+        self.is_connected = False
+        session.reply("ACK BYE")
+        session.end()
+
+    def do_stop(self, session):
+        session.reply("ACK STOP")
+        self._stop_motion()
+        self.gripstate = 0
+        session.reply("FIN STOP")
+        session.end()
+
+    def do_heartbeat(self, session):
+        '''
+            Answers a heartbeat out of band: one 'EVENT HEARTBEAT <gripstate>' line and no END.
+        '''
+
+        session.send(f"EVENT HEARTBEAT {self.gripstate}\n".encode())
+
+    def do_autosend(self, session, rate_hz=None):
+        '''
+            Starts pushing telemetry on this connection at `rate_hz`, or stops it for 0 / no rate.
+        '''
+
+        rate_hz = min(rate_hz or 0, self.MAX_AUTOSEND_RATE)
+        session.stop_autosend()
+        if rate_hz > 0:
+            session.start_autosend(rate_hz, self.to_telemetry_string)
+        session.reply("ACK AUTOSEND")
+        session.end()
+
+    async def do_seq(self, session, *steps):
+        '''
+            Runs the steps of a pick-cycle macro in one go. Each step's lines are streamed after a
+            'STEP <n> <NAME>' line; the sequence aborts at the first step that does not succeed
+            (e.g. NO PART or ERROR) with 'ABORT SEQ <n>', otherwise it finishes with 'FIN SEQ'.
+        '''
+
+        session.reply("ACK SEQ")
+        session.flush()
+        session.in_sequence = True
+        failed = None
+        try:
+            for number, step in enumerate(steps, 1):
+                session.reply(f"STEP {number} {step.name}")
+                session.step_status = None
+                await self.execute(session, self.TEXT_HANDLERS[step.name], *step.args)
+                if session.step_status != wsg_codec.E_SUCCESS:
+                    failed = number
                     break
+        finally:
+            session.in_sequence = False
+        if failed is not None:
+            session.reply(f"ABORT SEQ {failed}")
+            session.end(session.step_status or wsg_codec.E_CMD_FAILED)
+        else:
+            session.reply("FIN SEQ")
+            session.end()
+
+    async def do_move(self, session, width, speed=None):
+        '''
+            Moves the fingers to `width`, optionally setting a new speed. Answers 'FIN MOVE' once
+            the target is reached, or 'ABORT MOVE' if the motion is stopped or preempted.
+        '''
+
+        session.reply("ACK MOVE")
+        session.flush()
+        self.speed = speed if speed is not None else self.speed
+        motion = self._start_motion(width)
+        if await asyncio.shield(motion.done):
+            session.reply("FIN MOVE")
+            session.end()
+        else:
+            session.reply("ABORT MOVE")
+            session.end(wsg_codec.E_CMD_ABORTED)
+
+    def do_move_nowait(self, session, width, speed=None):
+        '''
+            Starts moving the fingers to `width` and answers right away; the end of the motion is
+            pushed to this client as 'EVENT FIN MOVE <width>' or 'EVENT ABORT MOVE <width>'.
+        '''
+
+        session.reply("ACK MOVE")
+        self.speed = speed if speed is not None else self.speed
+        self._start_motion(width).session = session
+        session.end()
+
+    def do_grip(self, session, force=None, part_width=None, speed_limit=None):
+        '''
+            Grips a part at the current position; parameters that are not given keep their values.
+        '''
+
+        session.reply("ACK GRIP")
+        self._stop_motion()
+        self.gripstate = 1
+        if force is not None:
+            self.torque = force
+        if part_width is not None:
+            self.grip_part_width = part_width
+        if speed_limit is not None:
+            self.grip_speed_limit = speed_limit
+
+        if abs(self.width - self.grip_part_width) >= self.PART_FALL_WIDTH_THRESHOLD:
+            self.gripstate=2 # NO PART
+            session.reply("No part detected between the fingers. Set width between the fingers and width of the part correctly.")
+            session.reply("ACK NO PART")
+            session.end(wsg_codec.E_CMD_FAILED)
+        else:
+            self.gripstate=4 # HOLDING
+            session.reply("ACK HOLDING")
+            session.reply("FIN GRIP")
+            session.end()
+
+    async def do_release(self, session, pull_back_distance=None, release_speed_limit=None):
+        '''
+            Releases a gripped part and pulls the fingers back.
+        '''
+
+        session.reply("ACK RELEASE")
+        self._stop_motion()
+        if self.gripstate not in [2, 3, 4]:
+            self.gripstate = 7
+            session.reply("ERROR. Was the part gripped?")
+            session.end(wsg_codec.E_CMD_FAILED)
+            return
+        if pull_back_distance is not None:
+            self.pull_back_distance = pull_back_distance
+        if release_speed_limit is not None:
+            self.release_speed_limit = release_speed_limit
+
+        session.flush()
+        self.gripstate = 5
+        sleep_duration = min(9.9, self.pull_back_distance / (self.release_speed_limit/100))
+        await self.clock.sleep(sleep_duration) # Diving by 100 to show difference
+        self.width = max(0.0, self.width - self.pull_back_distance)
+        self.gripstate = 0
+        session.reply("FIN RELEASE")
+        session.end()
+
+    async def serve(self):
+        '''
+            Serves clients on the running event loop until `stop` is called.
+        '''
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        await self._listen()
+        logger.info("[SERVER] Gripper server listening on %s:%s", self.host, self.port)
+        try:
+            await self._stopping.wait()
+        finally:
+            self.ready.clear()
+            self._server.close()
+            handlers = list(self._clients.values())
+            for writer in list(self._clients):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+
+    async def _listen(self):
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port, backlog=self.backlog, reuse_address=True)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.ready.set()
+
+    def power_cycle(self, off_time=0.0):
+        '''
+            Simulates a power cycle from any thread: every connection is reset, connections are refused
+            for `off_time` seconds (wall clock) and the gripper comes back with its default state but
+            uncalibrated (reported range 0-0 mm). Returns a future that is done once it is back on.
+        '''
+
+        return asyncio.run_coroutine_threadsafe(self._power_cycle(off_time), self._loop)
+
+    async def _power_cycle(self, off_time):
+        self.ready.clear()
+        self._server.close()
+        motion, self._motion = self._motion, None
+        if motion is not None:
+            motion.timer.cancel()
+            if not motion.done.done():
+                motion.done.set_result(False)
+        for writer in list(self._clients):
+            writer.transport.abort()
+        logger.info("[SERVER] Power off.")
+        self.width = 110
+        self.speed = 550
+        self.torque = 5
+        self.gripstate = 0
+        self.min_width = self.max_width = 0.0
+        self.is_calibrated = False
+        await asyncio.sleep(off_time)
+        if not self._stopping.is_set():
+            await self._listen()
+            logger.info("[SERVER] Power on, not calibrated.")
 
     def start(self):
         '''
             Starts the socket server for the mock gripper to enable communication with client.
+            Blocks while serving; all clients are handled by one asyncio event loop.
         '''
         
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            s.bind((self.host, self.port))
-            s.listen()
-            print(f"[SERVER] Gripper server listening on {self.host}:{self.port}")
-            while True:
-                conn, addr = s.accept()
-                threading.Thread(target=self.handle_client, args=(conn, addr), daemon=True).start()
+        asyncio.run(self.serve())
+
+    def stop(self):
+        '''
+            Stops a running server from any thread and closes all client connections.
+        '''
+
+        if self._loop is not None and self._stopping is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
 
 if __name__ == "__main__":
-    server = MockServer()
+    parser = argparse.ArgumentParser(description="Mock gripper server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--speedup", type=float, default=1.0, help="Run simulated motion this many times faster")
+    parser.add_argument("--virtual", action="store_true", help="Complete simulated motion instantly")
+    args = parser.parse_args()
+    setup_logging()
+
+    server = MockServer(args.host, args.port, clock=VirtualClock() if args.virtual else RealClock(args.speedup))
     server.start()
@@ -1,4 +1,19 @@
 import time
+import gcl
+
+# GCL command name -> driver call; commands with arguments receive the parsed gcl.Command
+CLI_COMMANDS = {
+    "MOVE": lambda driver, command: driver.move_to(command),
+    "GRIP": lambda driver, command: driver.grip(command),
+    "RELEASE": lambda driver, command: driver.release(command),
+    "CALIBRATE": lambda driver, command: driver.calibrate(),
+    "POS?": lambda driver, command: driver.get_pos(),
+    "SPEED?": lambda driver, command: driver.get_speed(),
+    "FORCE?": lambda driver, command: driver.get_force(),
+    "GRIPSTATE?": lambda driver, command: driver.get_gripstate(),
+    "BYE": lambda driver, command: driver.disconnect(),
+    "STOP": lambda driver, command: driver.stop(),
+}
 
 
 def run_cli_ui(driver):
@@ -12,37 +27,7 @@ def run_cli_ui(driver):
     while True:
         command = input("> ").strip().lower()
 
-        if command.startswith("move"):
-            driver.move_to(command)
-            
-        elif command == "calibrate":
-            driver.calibrate()
-
-        elif command == "pos?":
-            driver.get_pos()
-        
-        elif command == "speed?":
-            driver.get_speed()
-        
-        elif command == "force?":
-            driver.get_force()
-        
-        elif command == "gripstate?":
-            driver.get_gripstate()
-        
-        elif command.startswith("grip"):
-            driver.grip(command)
-
-        elif command.startswith("release"):
-            driver.release(command)
-        
-        elif command == "bye":
-            driver.disconnect()
-        
-        elif command == "stop":
-            driver.stop()
-            
-        elif command == "help":
+        if command == "help":
             print("Available commands:")
             print("move(<WIDTH>, <SPEED>) or move(<WIDTH>)                                                      - Move gripper to position.")
             print("calibrate                                                                                    - Calibrate the gripper with default min and max width")           
@@ -61,4 +46,16 @@ def run_cli_ui(driver):
             break
 
         else:
-            print("[E_CMD_UNKNOWN] Unknown command. Type 'help' for available commands.")
+            try:
+                parsed = gcl.parse(command)
+            except gcl.GclError as e:
+                if e.name is None:
+                    print("[E_CMD_UNKNOWN] Unknown command. Type 'help' for available commands.")
+                else:
+                    print(f"[E_NOT_ENOUGH_PARAMS] Invalid {e.name.lower()} command. Run help to know usage.")
+                continue
+            action = CLI_COMMANDS.get(parsed.name)
+            if action is None:
+                print("[E_CMD_UNKNOWN] Unknown command. Type 'help' for available commands.")
+            else:
+                action(driver, parsed)
@@ -0,0 +1,163 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger("gripper.reconnect")
+
+
+class Backoff:
+    '''
+        Exponential backoff with jitter.
+
+        Delays start at `initial` seconds and are multiplied by `multiplier` after every failed
+        attempt up to `maximum`. Each delay is spread by +/- `jitter` (a fraction of the delay) so
+        that many drivers losing the same gripper do not retry in lockstep.
+    '''
+
+    def __init__(self, initial=0.01, maximum=1.0, multiplier=2.0, jitter=0.2):
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._next = initial
+
+    def reset(self):
+        '''
+            Starts over at the initial delay.
+        '''
+
+        self._next = self.initial
+
+    def next_delay(self):
+        '''
+            Returns the next delay in seconds and advances the backoff.
+        '''
+
+        delay = self._next
+        self._next = min(self.maximum, delay * self.multiplier)
+        return delay * (1.0 + self.jitter * (2.0 * random.random() - 1.0))
+
+
+class Reconnector:
+    '''
+        Runs reconnection attempts on a background thread.
+
+        `connect` is called until it returns True, waiting `backoff.next_delay()` between attempts,
+        the first attempt is made immediately. With a `budget` (seconds) the reconnector gives up
+        once the budget is spent; without one it keeps trying until `stop` is called. Callers that
+        need the link can block on `wait` while the attempts run in the background.
+
+        Attributes:
+            - backoff (Backoff): Delay policy between attempts
+            - budget (float): Seconds to keep trying per outage, or None for no limit
+            - attempts (int): Attempts made during the last outage
+            - last_recovery_time (float): Seconds the last successful reconnection took
+    '''
+
+    def __init__(self, connect, backoff=None, budget=None, name="gripper-reconnect"):
+        self._connect = connect
+        self.backoff = backoff if backoff is not None else Backoff()
+        self.budget = budget
+        self.name = name
+        self.attempts = 0
+        self.last_recovery_time = None
+        self.gave_up = False
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self._finished = threading.Event()
+        self._stopped = threading.Event()
+
+    @property
+    def running(self):
+        return self._running
+
+    def on_reconnect_thread(self):
+        '''
+            Returns True when called by a reconnection attempt, i.e. from the background thread.
+        '''
+
+        return self._thread is threading.current_thread()
+
+    def start(self):
+        '''
+            Starts reconnecting in the background unless an attempt is already running.
+        '''
+
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self.gave_up = False
+            self._finished.clear()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        '''
+            Waits up to `timeout` seconds for the running reconnection to finish.
+            Returns True if the link was restored.
+        '''
+
+        return self._finished.wait(timeout) and not self.gave_up and not self._stopped.is_set()
+
+    def stop(self):
+        '''
+            Stops reconnecting and waits for the background thread to exit.
+        '''
+
+        self._stopped.set()
+        thread = self._thread
+        # a thread that is not started yet sees the stop flag on its first check
+        if thread is not None and thread is not threading.current_thread() and thread.ident is not None:
+            thread.join()
+
+    def _run(self):
+        start = time.monotonic()
+        self.backoff.reset()
+        self.attempts = 0
+        connected = False
+        while not self._stopped.is_set():
+            self.attempts += 1
+            try:
+                connected = self._connect()
+            except Exception as e:
+                logger.warning("[WARNING] Reconnection attempt failed: %s", e)
+                connected = False
+            if connected:
+                self.last_recovery_time = time.monotonic() - start
+                logger.info("[E_SUCCESS] Reconnected after %d attempts in %.3f s.", self.attempts, self.last_recovery_time)
+                break
+            if self.budget is not None and time.monotonic() - start >= self.budget:
+                self.gave_up = True
+                logger.error("[E_NOT_INITIALIZED] Gave up reconnecting after %d attempts.", self.attempts)
+                break
+            self._stopped.wait(self.backoff.next_delay())
+        with self._lock:
+            self._running = False
+            self._finished.set()
@@ -0,0 +1,215 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Append-only binary recording of a driver session.
+#
+# A recording file is a 64-byte header followed by fixed-width 128-byte records:
+#
+#     offset  type   field
+#     0       f8     t          monotonic time (s)
+#     8       u4     command    number of the command the record belongs to
+#     12      u1     kind       COMMAND, RESPONSE or STATE
+#     13      i1     gripstate  driver's view of the gripper state
+#     16      f4     width      cached width (mm)
+#     20      f4     speed      cached speed (mm/s)
+#     24      f4     torque     cached torque (N)
+#     28      S100   text       GCL command or response line, UTF-8, NUL padded (truncated)
+#
+# All values are little-endian, so the records map directly onto RECORD_DTYPE: `load` returns a
+# NumPy array (memory-mapped by default) without parsing. `read` needs only the standard library.
+
+import itertools
+import os
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: only `load` needs it
+    np = None
+
+MAGIC = b"GRIPREC1"
+HEADER_SIZE = 64
+RECORD = struct.Struct("<dIBb2xfff100s")
+TEXT_SIZE = 100
+
+COMMAND, RESPONSE, STATE = 0, 1, 2
+KINDS = ("COMMAND", "RESPONSE", "STATE")
+
+# NumPy description of one record, see `load`
+RECORD_FIELDS = [
+    ("t", "<f8"), ("command", "<u4"), ("kind", "u1"), ("gripstate", "i1"), ("pad", "V2"),
+    ("width", "<f4"), ("speed", "<f4"), ("torque", "<f4"), ("text", f"S{TEXT_SIZE}"),
+]
+
+Record = namedtuple("Record", ["t", "command", "kind", "gripstate", "width", "speed", "torque", "text"])
+
+
+class Recorder:
+    '''
+        Records the commands, response lines and state snapshots of GripperDriver sessions.
+
+        `attach(driver)` registers command hooks: the command is recorded with its send time and
+        the GripperState values before it is sent, its response lines (stamped with the ACK and
+        completion times) and a snapshot of the GripperState when the caller claims the response.
+        The hooks only collect these values; a background thread packs the records and writes them
+        every `flush_interval` seconds. A command's records are written once its response is claimed.
+
+        Attributes:
+            - path (str): Recording file; new records are appended to an existing recording
+            - flush_interval (float): Seconds between background writes
+    '''
+
+    def __init__(self, path, flush_interval=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "ab")
+        if new:
+            self._file.write(MAGIC.ljust(HEADER_SIZE, b"\0"))
+        self._records = []
+        self._claimed = deque()  # (command, sent, lines, ack_at, done_at, claimed) per claimed command
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._numbers = itertools.count(1)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gripper-recorder", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def attach(self, driver):
+        '''
+            Records every command of `driver` from now on.
+        '''
+
+        state = driver.state
+
+        def before(pending):
+            # itertools.count is atomic under the GIL
+            pending.record_sent = (next(self._numbers), state.gripstate, state.width_mm, state.speed, state.torque)
+
+        def after(pending, response):
+            # Keep plain values only: holding on to the PendingResponse until the next flush costs more
+            # than recording it
+            claimed = (time.monotonic(), state.gripstate, state.width_mm, state.speed, state.torque)
+            self._claimed.append((pending.cmd, getattr(pending, "record_sent", None), pending.sent_at,
+                                  pending.lines, pending.ack_at, pending.done_at, claimed))
+
+        driver.add_command_hook(pre=before, post=after)
+
+    def record(self, kind, command, text, state, t=None):
+        '''
+            Appends one record; `state` is a GripperState whose cached values are stored with it.
+        '''
+
+        data = RECORD.pack(time.monotonic() if t is None else t, command, kind, state.gripstate,
+                           state.width_mm, state.speed, state.torque, text.encode()[:TEXT_SIZE])
+        with self._lock:
+            self._records.append(data)
+
+    def flush(self):
+        '''
+            Writes the records packed so far to the file.
+        '''
+
+        with self._lock:
+            records, self._records = self._records, []
+        records.extend(self._pack_claimed())
+        with self._write_lock:
+            if records and not self._file.closed:
+                self._file.write(b"".join(records))
+                self._file.flush()
+
+    def _pack_claimed(self):
+        '''
+            Packs the COMMAND, RESPONSE and STATE records of the commands claimed so far.
+        '''
+
+        pack = RECORD.pack
+        while self._claimed:
+            cmd, sent, sent_at, lines, ack_at, done_at, claimed = self._claimed.popleft()
+            number = sent[0] if sent is not None else 0
+            yield pack(sent_at if sent_at is not None else claimed[0], number, COMMAND,
+                       *(sent or claimed)[1:], cmd.encode()[:TEXT_SIZE])
+            for i, line in enumerate(lines):
+                t = ack_at if i == 0 and ack_at is not None else done_at
+                yield pack(t if t is not None else claimed[0], number, RESPONSE, *claimed[1:], line.encode()[:TEXT_SIZE])
+            yield pack(claimed[0], number, STATE, *claimed[1:], b"")
+
+    def close(self):
+        '''
+            Stops the background writer and writes the remaining records.
+        '''
+
+        self._closed.set()
+        self._thread.join()
+        self.flush()
+        self._file.close()
+
+    def _run(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+
+def read(path):
+    '''
+        Returns the records of a recording as a list of Record tuples with decoded text.
+    '''
+
+    with open(path, "rb") as f:
+        data = f.read()
+    _check_header(data[:HEADER_SIZE], path)
+    end = HEADER_SIZE + (len(data) - HEADER_SIZE) // RECORD.size * RECORD.size
+    return [Record(*values[:7], values[7].rstrip(b"\0").decode(errors="replace"))
+            for values in RECORD.iter_unpack(memoryview(data)[HEADER_SIZE:end])]
+
+
+def load(path, mmap=True):
+    '''
+        Returns the records of a recording as a NumPy structured array (see RECORD_FIELDS),
+        memory-mapped read-only unless `mmap` is False. Requires NumPy.
+    '''
+
+    if np is None:
+        raise ImportError("Loading recordings as arrays requires numpy")
+    with open(path, "rb") as f:
+        _check_header(f.read(HEADER_SIZE), path)
+    dtype = np.dtype(RECORD_FIELDS)
+    count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+    if not mmap:
+        return np.fromfile(path, dtype=dtype, count=count, offset=HEADER_SIZE)
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+def _check_header(header, path):
+    if header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a gripper recording")
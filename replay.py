@@ -0,0 +1,103 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Replays a session recorded with recorder.Recorder through a MockServer.
+#
+# The recorded commands are sent in their original order and at their original relative times
+# divided by `speedup` (simulated motion is accelerated by the same factor), and every replayed
+# response is compared with the recorded one. Without a speedup (`speedup=None`) commands are sent
+# back-to-back and motion completes instantly on a VirtualClock.
+#
+#     python replay.py session.grec [--speedup 10 | --virtual]
+
+import argparse
+import threading
+import time
+from collections import namedtuple
+
+import recorder
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, RealClock, VirtualClock
+
+ReplayResult = namedtuple("ReplayResult", ["t", "command", "recorded", "replayed"])
+
+
+def recorded_commands(records):
+    '''
+        Groups the records of a recording into (t, command, response lines) per recorded command,
+        in the order the commands were sent.
+    '''
+
+    commands, responses = [], {}
+    for record in records:
+        if record.kind == recorder.COMMAND:
+            commands.append((record.t, record.command, record.text))
+            responses[record.command] = []
+        elif record.kind == recorder.RESPONSE and record.command in responses:
+            responses[record.command].append(record.text)
+    commands.sort()  # records are written when a response is claimed, not when its command is sent
+    return [(t, text, responses[number]) for t, number, text in commands]
+
+
+def replay(path, speedup=1.0):
+    '''
+        Replays the recording at `path` through a fresh MockServer and returns one ReplayResult
+        per command. A result matches when `recorded == replayed`.
+    '''
+
+    commands = recorded_commands(recorder.read(path))
+    server = MockServer(port=0, clock=VirtualClock() if speedup is None else RealClock(speedup))
+    threading.Thread(target=server.start, daemon=True).start()
+    server.ready.wait(5)
+    driver = GripperDriver(port=server.port, calibration_cache=False)
+    results = []
+    try:
+        start = time.monotonic()
+        for t, command, recorded in commands:
+            if speedup is not None:
+                delay = start + (t - commands[0][0]) / speedup - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            response = driver.pipeline([command])[0] or []
+            replayed = [line.encode()[:recorder.TEXT_SIZE].decode(errors="replace") for line in response]
+            results.append(ReplayResult(t - commands[0][0], command, recorded, replayed))
+    finally:
+        driver.close()
+        server.stop()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded gripper session through MockServer.")
+    parser.add_argument("path", help="Recording written by recorder.Recorder")
+    parser.add_argument("--speedup", type=float, default=1.0, help="Replay this many times faster than recorded")
+    parser.add_argument("--virtual", action="store_true", help="Send commands back-to-back with instant motion")
+    args = parser.parse_args()
+
+    results = replay(args.path, None if args.virtual else args.speedup)
+    differences = [result for result in results if result.recorded != result.replayed]
+    for result in differences:
+        print(f"{result.t:10.3f}s {result.command}")
+        print(f"{'':12}recorded: {' | '.join(result.recorded)}")
+        print(f"{'':12}replayed: {' | '.join(result.replayed)}")
+    print(f"{len(results)} commands replayed, {len(differences)} with different responses")
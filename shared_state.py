@@ -0,0 +1,190 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# GripperState snapshot in shared memory, readable by other processes without touching the link.
+#
+# The block is one fixed 64-byte struct (little-endian):
+#
+#     offset  type  field
+#     0       u64   seq        even: stable, odd: being written
+#     8       f64   t          monotonic time of the update (CLOCK_MONOTONIC is system-wide)
+#     16      f64   width_mm
+#     24      f64   speed
+#     32      f64   torque
+#     40      f64   min_width
+#     48      f64   max_width
+#     56      i64   gripstate
+#
+# Seqlock: the single writer increments `seq` to an odd value, writes the fields and increments
+# it to even again. A reader copies the fields between two reads of `seq` and retries if the two
+# differ or are odd, so readers never block the writer and never take a lock.
+
+import struct
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+SEQ = struct.Struct("<Q")
+FIELDS = struct.Struct("<6dq")
+SIZE = SEQ.size + FIELDS.size
+_INDEX = {"width_mm": 1, "speed": 2, "torque": 3, "min_width": 4, "max_width": 5, "gripstate": 6}
+
+StateSnapshot = namedtuple("StateSnapshot", ["seq", "t", "width_mm", "speed", "torque", "min_width", "max_width", "gripstate"])
+
+
+class SharedStatePublisher:
+    '''
+        Publishes GripperState values into a named shared memory block.
+
+        Writes from several threads of the owning process are serialized; readers in any process
+        use SharedStateReader. The block is created on construction (an existing block of the
+        same name is reused) and removed by `close`.
+
+        Attributes:
+            - name (str): Name of the shared memory block
+    '''
+
+    def __init__(self, name):
+        self.name = name
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=SIZE)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._buf = self._shm.buf
+        self._seq = SEQ.unpack_from(self._buf)[0] & ~1
+        self._values = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0]
+        self._lock = threading.Lock()
+
+    def publish(self, state):
+        '''
+            Publishes the current values of a GripperState.
+        '''
+
+        self._write(width_mm=state.width_mm, speed=state.speed, torque=state.torque, min_width=state.min_width,
+                    max_width=state.max_width, gripstate=int(state.gripstate))
+
+    def publish_telemetry(self, t, width, speed, force):
+        '''
+            Publishes an AUTOSEND telemetry sample, keeping the other fields.
+        '''
+
+        self._write(t, width_mm=width, speed=speed, torque=force)
+
+    def close(self):
+        '''
+            Stops publishing and removes the shared memory block.
+        '''
+
+        with self._lock:
+            if self._buf is None:
+                return
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write(self, t=None, **fields):
+        with self._lock:
+            if self._buf is None:
+                return
+            values = self._values
+            values[0] = time.monotonic() if t is None else t
+            for field, value in fields.items():
+                values[_INDEX[field]] = value
+            self._seq += 1
+            SEQ.pack_into(self._buf, 0, self._seq)
+            FIELDS.pack_into(self._buf, SEQ.size, *values)
+            self._seq += 1
+            SEQ.pack_into(self._buf, 0, self._seq)
+
+
+class SharedStateReader:
+    '''
+        Reads consistent GripperState snapshots published by another process, without locks or sockets.
+
+        A writer that died between the two `seq` updates leaves the block odd for good, so `read`
+        retries for at most `timeout` seconds and then falls back to the last stable snapshot it
+        returned, or raises TimeoutError if there is none.
+
+        Attributes:
+            - name (str): Name of the shared memory block
+            - timeout (float): Seconds `read` retries an inconsistent block
+    '''
+
+    def __init__(self, name, timeout=0.1):
+        self.name = name
+        self.timeout = timeout
+        self._last = None
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers attached blocks with the resource tracker, which would
+            # remove the publisher's block when the reading process exits
+            register, resource_tracker.register = resource_tracker.register, lambda *args: None
+            try:
+                self._shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        self._buf = self._shm.buf
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def read(self):
+        '''
+            Returns the latest StateSnapshot; `seq` is 0 if nothing was published yet.
+        '''
+
+        buf = self._buf
+        deadline = None
+        while True:
+            before = SEQ.unpack_from(buf)[0]
+            if not before & 1:
+                values = FIELDS.unpack_from(buf, SEQ.size)
+                if SEQ.unpack_from(buf)[0] == before:
+                    self._last = StateSnapshot(before, *values)
+                    return self._last
+            # Only a read that raced a write gets here, so the fast path never looks at the clock
+            if deadline is None:
+                deadline = time.monotonic() + self.timeout
+            elif time.monotonic() > deadline:
+                if self._last is not None:
+                    return self._last
+                raise TimeoutError(f"Shared state {self.name!r} stayed inconsistent for {self.timeout} s")
+
+    def close(self):
+        '''
+            Detaches from the shared memory block.
+        '''
+
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
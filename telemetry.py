@@ -0,0 +1,132 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import threading
+from array import array
+from collections import namedtuple
+
+TelemetrySample = namedtuple("TelemetrySample", ["t", "width", "speed", "force"])
+
+
+def parse_telemetry_line(line):
+    '''
+        Parses an AUTOSEND line 'TELEMETRY <width>,<speed>,<force>' into a tuple of floats.
+    '''
+
+    width, speed, force = line[len("TELEMETRY "):].split(",")
+    return float(width), float(speed), float(force)
+
+
+class TelemetryBuffer:
+    '''
+        Fixed-size ring buffer of timestamped gripper telemetry samples.
+
+        Samples are stored column-wise in preallocated `array('d')` blocks, so appending never
+        allocates and the oldest samples are overwritten once `capacity` is reached. A single
+        writer (the driver's reader thread) appends; any number of threads can read the latest
+        sample or a time window without touching the socket.
+
+        Attributes:
+            - capacity (int): Maximum number of samples kept
+    '''
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self._t = array("d", bytes(8 * capacity))
+        self._width = array("d", bytes(8 * capacity))
+        self._speed = array("d", bytes(8 * capacity))
+        self._force = array("d", bytes(8 * capacity))
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, t, width, speed, force):
+        '''
+            Stores one sample taken at monotonic time `t`.
+        '''
+
+        with self._lock:
+            i = self._count % self.capacity
+            self._t[i] = t
+            self._width[i] = width
+            self._speed[i] = speed
+            self._force[i] = force
+            self._count += 1
+
+    def clear(self):
+        '''
+            Drops all samples.
+        '''
+
+        with self._lock:
+            self._count = 0
+
+    def latest(self):
+        '''
+            Returns the most recent TelemetrySample, or None if nothing was received yet.
+        '''
+
+        with self._lock:
+            if self._count == 0:
+                return None
+            return self._sample((self._count - 1) % self.capacity)
+
+    def last(self, n):
+        '''
+            Returns up to `n` most recent samples, oldest first.
+        '''
+
+        with self._lock:
+            n = min(n, self._count, self.capacity)
+            return [self._sample(i % self.capacity) for i in range(self._count - n, self._count)]
+
+    def window(self, start, end=None):
+        '''
+            Returns the samples whose timestamp lies within [start, end], oldest first.
+        '''
+
+        with self._lock:
+            first = max(0, self._count - self.capacity)
+            lo = self._search(first, start, right=False)
+            hi = self._count if end is None else self._search(first, end, right=True)
+            return [self._sample(i % self.capacity) for i in range(lo, hi)]
+
+    def _search(self, first, t, right):
+        '''
+            Binary search over the logical sample indices [first, count) by timestamp.
+        '''
+
+        lo, hi = first, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._t[mid % self.capacity]
+            if value < t or (right and value == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _sample(self, i):
+        return TelemetrySample(self._t[i], self._width[i], self._speed[i], self._force[i])
@@ -0,0 +1,78 @@
+# Unit Tests for lazy connection and the calibration cache
+
+import os
+import threading
+from calibration_cache import CalibrationCache
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+def start_server():
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    return server
+
+def sent_commands(driver):
+    return driver.metrics.snapshot()["counters"]["commands"]
+
+def test_cache_validity(tmp_path):
+    cache = CalibrationCache(str(tmp_path / "calibration.json"))
+    assert not cache.is_valid("10.0.0.11:8000", 0.0, 110.0)
+    cache.store("10.0.0.11:8000", 0.0, 110.0)
+    assert CalibrationCache(cache.path).is_valid("10.0.0.11:8000", 0.0, 110.0)
+    assert not cache.is_valid("10.0.0.11:8000", 0.0, 100.0)
+    assert not cache.is_valid("10.0.0.12:8000", 0.0, 110.0)
+    cache.invalidate("10.0.0.11:8000")
+    assert not cache.is_valid("10.0.0.11:8000", 0.0, 110.0)
+
+def test_cache_keeps_most_recent_entries(tmp_path):
+    cache = CalibrationCache(str(tmp_path / "calibration.json"), max_entries=3)
+    for port in range(5):
+        cache.store(f"127.0.0.1:{port}", 0.0, 110.0)
+    assert sorted(cache.load()) == ["127.0.0.1:2", "127.0.0.1:3", "127.0.0.1:4"]
+
+def test_failed_write_removes_temporary_file(tmp_path, monkeypatch):
+    cache = CalibrationCache(str(tmp_path / "calibration.json"))
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    cache.store("10.0.0.11:8000", 0.0, 110.0)
+    assert os.listdir(tmp_path) == []
+
+def test_second_start_skips_calibration(tmp_path):
+    server = start_server()
+    cache = CalibrationCache(str(tmp_path / "calibration.json"))
+    first = GripperDriver(port=server.port, calibration_cache=cache)
+    assert sent_commands(first) == 3  # STATUS, CALIBRATE, STATUS
+    first.close()
+    second = GripperDriver(port=server.port, calibration_cache=cache)
+    assert sent_commands(second) == 1  # STATUS only
+    assert second.state.is_calibrated
+    second.close()
+    server.max_width = 100.0  # gripper reports different limits: calibrate again
+    third = GripperDriver(port=server.port, calibration_cache=cache)
+    assert sent_commands(third) == 3
+    third.close()
+    server.stop()
+
+def test_lazy_driver_connects_on_first_command():
+    server = start_server()
+    driver = GripperDriver(port=server.port, lazy=True, calibration_cache=False)
+    assert not driver.connected and not server._clients
+    assert driver.get_pos() == "POS=110"
+    assert driver.connected
+    driver.close()
+    server.stop()
+
+def test_lazy_driver_stop_connects_and_disconnect_only_closes():
+    server = start_server()
+    driver = GripperDriver(port=server.port, lazy=True, calibration_cache=False)
+    assert driver.stop() == ["ACK STOP", "FIN STOP"]
+    assert driver.connected
+    driver.close()
+    idle = GripperDriver(port=server.port, lazy=True, calibration_cache=False)
+    idle.disconnect()  # never connected: nothing to announce
+    assert not idle.connected and not idle._reconnector.running
+    server.stop()
@@ -0,0 +1,120 @@
+# Unit Tests for the per-command deadlines
+
+import asyncio
+import socket
+import threading
+import time
+from async_gripper_driver import AsyncGripperDriver
+from deadlines import DeadlineEstimator
+from gripper_driver import GripperDriver, GripperState, parse_query_response
+from gripper_errors import GripperTimeoutError
+from gripper_sim import MockServer, RealClock
+
+def make_state(width=110.0, speed=100.0):
+    state = GripperState()
+    state.update(width_mm=width, speed=speed, min_width=0.0, max_width=110.0)
+    return state
+
+def test_queries_start_short_and_learn_the_round_trip():
+    estimator = DeadlineEstimator(query_timeout=1.0, minimum=0.01)
+    state = make_state()
+    assert estimator.estimate("POS?", state).timeout == 1.0
+    for _ in range(5):
+        estimator.observe(estimator.estimate("POS?", state), 0.002)
+    assert estimator.estimate("POS?", state).timeout < 0.05
+    assert estimator.estimate("GRIPSTATE?", state).timeout == 1.0
+
+def test_motion_deadline_scales_with_distance():
+    estimator = DeadlineEstimator(default_timeout=10.0, minimum=0.01)
+    state = make_state(width=110.0, speed=100.0)
+    deadline = estimator.estimate("MOVE(10.0)", state)
+    assert deadline.expected == 1.0 and deadline.timeout == 10.0
+    for _ in range(5):
+        estimator.observe(deadline, 2.0)  # the gripper takes twice the kinematic time
+    long_move = estimator.estimate("MOVE(10.0)", state).timeout
+    short_move = estimator.estimate("MOVE(100.0)", state).timeout
+    assert 2.0 <= long_move < 10.0
+    assert 0.2 <= short_move < long_move
+
+def test_unknown_width_keeps_default_deadline():
+    estimator = DeadlineEstimator(default_timeout=10.0)
+    state = make_state()
+    state.invalidate("width_mm")
+    deadline = estimator.estimate("MOVE(10.0)", state)
+    assert deadline.timeout == 10.0 and not deadline.learn
+    assert estimator.estimate("SEQ MOVE(10.0);GRIP", state).timeout == 20.0
+
+def test_stuck_query_times_out_quickly():
+    listener = socket.create_server(("127.0.0.1", 0))
+    def gripper():
+        conn, _ = listener.accept()
+        conn.recv(1024)
+        conn.sendall(b"110,550,5,0,110,0\nEND\n")  # answers STATUS, then goes silent
+        time.sleep(2)
+        conn.close()
+    threading.Thread(target=gripper, daemon=True).start()
+    driver = GripperDriver(port=listener.getsockname()[1], deadlines=DeadlineEstimator(query_timeout=0.2, default_timeout=0.2))
+    pending = driver._send_command("POS?")
+    start = time.monotonic()
+    assert driver._receive_response() is None
+    assert time.monotonic() - start < 1
+    assert isinstance(pending.error, GripperTimeoutError)
+    driver.close()
+    listener.close()
+
+def test_query_queued_behind_move_gets_its_full_deadline():
+    server = MockServer(port=0, clock=RealClock(speedup=10))
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port, deadlines=DeadlineEstimator(query_timeout=0.3), calibration_cache=False)
+    mover = threading.Thread(target=driver.move_to, args=("move(10, 40)",))  # about 1 s
+    mover.start()
+    time.sleep(0.1)
+    start = time.monotonic()
+    # The gripper answers POS? only after the move; the query's deadline starts then
+    assert parse_query_response(driver.get_pos()) == 10.0
+    assert time.monotonic() - start > 0.5
+    mover.join()
+    driver.close()
+    server.stop()
+
+def test_missed_deadline_is_reported_through_last_error():
+    listener = socket.create_server(("127.0.0.1", 0))
+    def gripper():
+        conn, _ = listener.accept()
+        conn.recv(1024)
+        conn.sendall(b"110,550,5,0,110,0\nEND\n")
+        time.sleep(2)
+        conn.close()
+    threading.Thread(target=gripper, daemon=True).start()
+    driver = GripperDriver(port=listener.getsockname()[1], deadlines=DeadlineEstimator(query_timeout=0.2, default_timeout=0.2),
+                           calibration_cache=False)
+    assert driver.get_pos() is None
+    assert isinstance(driver.last_error, GripperTimeoutError)
+    assert driver.get_pos(max_age=5) is not None and driver.last_error is None  # served from the cache
+    driver.close()
+    listener.close()
+
+def test_async_query_pipelined_behind_move_gets_its_full_deadline():
+    server = MockServer(port=0, clock=RealClock(speedup=10))
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+
+    async def run():
+        driver = AsyncGripperDriver(port=server.port, deadlines=DeadlineEstimator(query_timeout=0.3), calibration_cache=False)
+        try:
+            await driver.connect()
+            # about 1 s of motion; the POS? behind it is only answered afterwards
+            moved, position = await asyncio.gather(driver.move_to("move(10, 40)"), driver.get_pos())
+            learn = driver.deadlines.estimate("MOVE(50.0)", driver.state).learn
+            return moved, position, learn
+        finally:
+            await driver.close()
+
+    try:
+        moved, position, learn = asyncio.run(run())
+    finally:
+        server.stop()
+    assert moved[-1] == "FIN MOVE"
+    assert parse_query_response(position) == 10.0
+    assert learn  # FIN MOVE stored the target width
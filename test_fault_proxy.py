@@ -0,0 +1,64 @@
+# Unit Tests for the fault-injecting proxy and the recovery path
+
+import socket
+import threading
+import time
+import pytest
+from fault_proxy import FaultProxy
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+@pytest.fixture
+def link():
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    proxy = FaultProxy(server.port, seed=0)
+    threading.Thread(target=proxy.start, daemon=True).start()
+    assert proxy.ready.wait(5)
+    driver = GripperDriver(port=proxy.port, watchdog=0.3, calibration_cache=False)
+    yield server, proxy, driver
+    driver.close()
+    proxy.stop()
+    server.stop()
+
+def test_fragmented_and_delayed_responses(link):
+    server, proxy, driver = link
+    proxy.segment_size = 1
+    proxy.latency, proxy.jitter = 0.002, 0.005
+    assert driver.run_cycle(["move(30, 500)", "grip(5, 25, 500)"])[-1].lines == ["ACK GRIP", "ACK HOLDING", "FIN GRIP"]
+    assert driver.pipeline(["POS?", "GRIPSTATE?"]) == [["POS=30.0"], ["GRIPSTATE=4"]]
+
+def test_recovers_from_reset_and_stall(link):
+    server, proxy, driver = link
+    proxy.reset()
+    time.sleep(0.05)
+    assert driver.get_pos() == "POS=110"
+    proxy.stall()
+    assert driver.get_pos() is None  # misses its deadline
+    time.sleep(0.4)  # the watchdog declares the link down and the driver reconnects
+    assert driver.get_pos() == "POS=110"
+    assert driver.metrics.snapshot()["counters"]["link_losses"] == 1
+
+def test_power_cycle_wipes_calibration(link):
+    server, proxy, driver = link
+    assert driver.move_to("move(40, 500)") == ["ACK MOVE", "FIN MOVE"]
+    server.power_cycle(0.05).result(5)
+    assert not server.is_calibrated
+    assert driver.get_pos() == "POS=110"  # waits for the reconnection, which calibrates again
+    assert server.is_calibrated and driver.state.max_width == 110.0
+    assert driver.move_to("move(40, 500)") == ["ACK MOVE", "FIN MOVE"]
+
+def test_uncalibrated_gripper_rejects_motion():
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    server.power_cycle().result(5)
+    with socket.create_connection(("127.0.0.1", server.port)) as sock:
+        sock.sendall(b"MOVE(20.0)\nCALIBRATE\nMOVE(20.0)\n")
+        response = b""
+        while response.count(b"END") < 3:
+            response += sock.recv(4096)
+    assert response.decode().split("\n")[:2] == ["ERROR: Gripper not calibrated", "END"]
+    assert response.decode().endswith("ACK MOVE\nFIN MOVE\nEND\n")
+    server.stop()
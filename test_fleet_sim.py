@@ -0,0 +1,48 @@
+# Unit Tests for the vectorized fleet simulator
+
+import threading
+import time
+
+from fleet_sim import FleetSimulator
+from gripper_driver import GripperDriver
+from gripper_sim import RealClock, VirtualClock
+
+def start_fleet(count, clock):
+    fleet = FleetSimulator(count, clock=clock)
+    threading.Thread(target=fleet.start, daemon=True).start()
+    assert fleet.ready.wait(5)
+    return fleet
+
+def test_grippers_are_independent():
+    fleet = start_fleet(3, VirtualClock())
+    first = GripperDriver(port=fleet.ports[0], calibration_cache=False)
+    last = GripperDriver(port=fleet.ports[2], calibration_cache=False)
+    try:
+        assert first.move_to("move(20, 500)") == ["ACK MOVE", "FIN MOVE"]
+        last.move_to("move(30, 500)")
+        assert last.grip("grip(5, 25, 500)") is not None
+        assert first.get_pos() == "POS=20.0" and last.get_gripstate() == "GRIPSTATE=4"
+        assert fleet.width[:2].tolist() == [20.0, 110.0]
+        assert fleet.gripstate.tolist() == [0, 0, 4]
+    finally:
+        first.close()
+        last.close()
+        fleet.stop()
+
+def test_motions_advance_together():
+    fleet = start_fleet(20, RealClock(speedup=10))
+    drivers = []
+    try:
+        drivers.extend(GripperDriver(port=port, calibration_cache=False) for port in fleet.ports)
+        handles = [driver.move_async(f"move({10 + i}, 100)") for i, driver in enumerate(drivers)]  # about 10 s simulated
+        time.sleep(0.3)
+        assert fleet.moving.all()
+        assert all(10 < float(driver.get_pos()[4:]) < 110 for driver in drivers)
+        drivers[0].stop()
+        assert handles[0].wait(5) is False and not fleet.moving[0] and fleet.moving[1:].all()
+        assert all(handle.wait(5) for handle in handles[1:])
+        assert fleet.width[1:].tolist() == [10.0 + i for i in range(1, 20)]
+    finally:
+        for driver in drivers:
+            driver.close()
+        fleet.stop()
@@ -0,0 +1,29 @@
+# Unit Tests for the line framer
+
+import socket
+from framing import LineFramer
+
+def test_lines_split_across_chunks():
+    framer = LineFramer(bufsize=16)
+    for chunk in (b"ACK MO", b"VE\nFIN MOVE\nE", b"ND\n"):
+        framer.feed(chunk)
+    assert list(framer.lines()) == ["ACK MOVE", "FIN MOVE", "END"]
+    assert len(framer) == 0
+
+def test_leftover_bytes_are_kept():
+    framer = LineFramer(bufsize=8)
+    framer.feed(b"POS=110.0\nEND\nSPEED=")
+    assert list(framer.lines()) == ["POS=110.0", "END"]
+    framer.feed(b"550.0\nEND\n")
+    assert list(framer.lines()) == ["SPEED=550.0", "END"]
+
+def test_recv_into_socket():
+    left, right = socket.socketpair()
+    with left, right:
+        framer = LineFramer(bufsize=4)
+        right.sendall(b"GRIPSTATE=0\nEND\n")
+        lines = []
+        while len(lines) < 2:
+            framer.recv_into(left)
+            lines.extend(framer.lines())
+    assert lines == ["GRIPSTATE=0", "END"]
@@ -0,0 +1,50 @@
+# Unit Tests for the shared GCL grammar
+
+import pytest
+import gcl
+import wsg_codec
+
+def test_parse_typed_arguments():
+    assert gcl.parse("move(20, 500)") == gcl.Command("MOVE", gcl.Move(20.0, 500.0))
+    assert gcl.parse("MOVE(20)").args.speed is None
+    assert gcl.parse("grip()") == gcl.Command("GRIP", gcl.Grip())
+    assert gcl.parse("Release(10)").args == gcl.Release(10.0, None)
+    assert gcl.parse("pos?") == gcl.Command("POS?", gcl.NoArgs())
+
+def test_canonical_form():
+    assert str(gcl.parse("move( 20 , 500 )")) == "MOVE(20.0,500.0)"
+    assert str(gcl.parse("grip(5, .5)")) == "GRIP(5.0,0.5)"
+    assert str(gcl.command("calibrate")) == "CALIBRATE"
+
+def test_invalid_commands():
+    with pytest.raises(gcl.GclError) as error:
+        gcl.parse("dance(1)")
+    assert error.value.name is None and error.value.status == wsg_codec.E_CMD_UNKNOWN
+    with pytest.raises(gcl.GclError) as error:
+        gcl.parse("move()")
+    assert error.value.name == "MOVE" and error.value.status == wsg_codec.E_NOT_ENOUGH_PARAMS
+    with pytest.raises(gcl.GclError) as error:
+        gcl.parse("move(1.2.3)")
+    assert error.value.name == "MOVE"
+    with pytest.raises(gcl.GclError):
+        gcl.parse("release(1, 2, 3)")
+
+def test_sequence():
+    sequence = gcl.parse("seq move(30, 500); grip(5, 25, 500);RELEASE(10)")
+    assert [step.name for step in sequence.args] == ["MOVE", "GRIP", "RELEASE"]
+    assert str(sequence) == "SEQ MOVE(30.0,500.0);GRIP(5.0,25.0,500.0);RELEASE(10.0)"
+    assert gcl.sequence("move(30)", gcl.command("POS?")) == gcl.parse("SEQ MOVE(30.0);POS?")
+    with pytest.raises(gcl.GclError) as error:
+        gcl.parse("SEQ MOVE(30);BYE")
+    assert error.value.name == "SEQ"
+
+def test_nowait_suffix():
+    command = gcl.parse("move(20, 500) nowait")
+    assert command.nowait and command.args == gcl.Move(20.0, 500.0)
+    assert str(command) == "MOVE(20.0,500.0) NOWAIT"
+    assert gcl.command("move", 20, nowait=True) == gcl.parse("MOVE(20.0) NOWAIT")
+    assert not gcl.parse("MOVE(20)").nowait
+    with pytest.raises(gcl.GclError):
+        gcl.parse("POS? NOWAIT")
+    with pytest.raises(gcl.GclError):
+        gcl.parse("SEQ MOVE(20) NOWAIT;POS?")
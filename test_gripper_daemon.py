@@ -0,0 +1,126 @@
+# Unit Tests for the driver daemon sharing one gripper link
+
+import socket
+import threading
+import time
+import pytest
+from gripper_daemon import GripperDaemon
+from gripper_driver import GripperDriver
+from gripper_errors import GripperError
+from gripper_sim import MockServer, RealClock, VirtualClock
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    daemon = GripperDaemon(str(tmp_path / "gripper.sock"), GripperDriver(port=server.port), max_age=60)
+    threading.Thread(target=daemon.start, daemon=True).start()
+    assert daemon.ready.wait(5)
+    daemon.server = server
+    yield daemon
+    daemon.stop()
+    daemon.driver.close()
+    server.stop()
+
+def test_clients_share_one_gripper_connection(daemon):
+    arm = GripperDriver(unix_path=daemon.path)
+    vision = GripperDriver(unix_path=daemon.path)
+    assert len(daemon.server._clients) == 1
+    assert arm.move_to("move(40, 500)") == ["ACK MOVE", "FIN MOVE"]
+    assert vision.get_pos() == "POS=40.0"
+    sent = daemon.driver.metrics.snapshot()["counters"]["commands"]
+    assert [arm.get_pos() for _ in range(5)] == ["POS=40.0"] * 5
+    assert daemon.driver.metrics.snapshot()["counters"]["commands"] == sent  # answered from the cache
+    arm.disconnect()
+    vision.disconnect()
+    assert daemon.driver.connected
+
+def test_nowait_move_through_daemon(daemon):
+    client = GripperDriver(unix_path=daemon.path)
+    handle = client.move_async("move(20, 500)")
+    assert handle.wait(5) is True and handle.width == 20.0
+    assert client.get_pos() == "POS=20.0"
+    client.close()
+
+def test_invalid_and_protocol_commands_stay_in_the_daemon(daemon):
+    arm = GripperDriver(unix_path=daemon.path)
+    assert arm.command("PROTOCOL(BINARY)") == ["ERROR: The daemon only speaks the text protocol"]
+    assert arm.command("FLY") == ["ERROR: Unknown command"]
+    with socket.socket(socket.AF_UNIX) as raw:
+        raw.connect(daemon.path)
+        raw.sendall(b"\xff\xfe\nPOS?\n")  # not UTF-8, then a valid query
+        response = b""
+        while response.count(b"END\n") < 2:
+            response += raw.recv(1024)
+        assert response == b"ERROR: Unknown command\nEND\nPOS=110\nEND\n"
+    assert arm.get_pos() == "POS=110"
+    binary = GripperDriver(unix_path=daemon.path, protocol="binary", reconnect_budget=0.1)
+    assert not binary.connected
+    binary.close()
+    assert arm.get_pos() == "POS=110" and daemon.driver.connected
+    arm.close()
+
+def test_status_with_zero_max_age(daemon):
+    daemon.max_age = 0
+    client = GripperDriver(unix_path=daemon.path)
+    assert client.refresh().max_width == 110.0
+    assert client.command("STATUS")[0].startswith("110")
+    client.close()
+
+def test_stop_preempts_another_clients_move(tmp_path):
+    server = MockServer(port=0, clock=RealClock(speedup=10))
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    daemon = GripperDaemon(str(tmp_path / "gripper.sock"), GripperDriver(port=server.port, calibration_cache=False))
+    threading.Thread(target=daemon.start, daemon=True).start()
+    assert daemon.ready.wait(5)
+    arm = GripperDriver(unix_path=daemon.path, calibration_cache=False)
+    operator = GripperDriver(unix_path=daemon.path, calibration_cache=False)
+    try:
+        moved = []
+        mover = threading.Thread(target=lambda: moved.append(arm.move_to("move(0, 20)")))  # about 1 s
+        mover.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        assert operator.stop() == ["ACK STOP", "FIN STOP"]
+        assert time.monotonic() - start < 0.5
+        mover.join(5)
+        assert moved == [["ACK MOVE", "ABORT MOVE"]]
+    finally:
+        arm.close()
+        operator.close()
+        daemon.stop()
+        daemon.driver.close()
+        server.stop()
+
+def test_connecting_client_does_not_recalibrate_a_gripping_gripper(daemon):
+    arm = GripperDriver(unix_path=daemon.path, calibration_cache=False)
+    try:
+        arm.move_to("move(30, 500)")
+        arm.grip("grip(5, 25, 500)")
+        assert arm.get_gripstate() == "GRIPSTATE=4"
+        vision = GripperDriver(unix_path=daemon.path, calibration_cache=False)
+        vision.close()
+        assert vision.state.is_calibrated
+        assert arm.get_gripstate() == "GRIPSTATE=4"  # still holding the part
+        assert arm.calibrate() == ["ACK CALIBRATE", "FIN CALIBRATE"]  # the daemon's link is calibrated
+        daemon.driver.state.is_calibrated = False
+        assert arm.calibrate() == ["ACK CALIBRATE", "ERROR: Gripper is busy"]
+        assert arm.get_gripstate() == "GRIPSTATE=4"
+        assert daemon.server.gripstate == 4
+    finally:
+        arm.close()
+
+def test_client_reports_daemon_errors(daemon):
+    client = GripperDriver(unix_path=daemon.path, calibration_cache=False)
+    try:
+        daemon.max_age = 0
+        daemon.driver.RECONNECT_WAIT = 0.1
+        daemon.server.power_cycle(2)  # the daemon's gripper goes away
+        assert client.get_pos() is None
+        assert isinstance(client.last_error, GripperError) and "No response from gripper" in str(client.last_error)
+        assert client.refresh() is None
+        assert isinstance(client.last_error, GripperError)
+    finally:
+        client.close()
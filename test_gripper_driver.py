@@ -1,58 +1,336 @@
 # Unit Tests to test the framework
 
-from gripper_driver import GripperDriver
-from gripper_sim import MockServer 
+from gripper_driver import GripperDriver, GripperState
+from gripper_sim import MockServer, RealClock, VirtualClock
+from async_gripper_driver import AsyncGripperDriver
+from gripper_fleet import GripperFleet
+from gripper_errors import GripperConnectionError
 import threading
 import pytest
 import time
+import asyncio
+import socket
+import logging
 
 @pytest.fixture(scope="session", autouse=True)
 def start_gripper_server():
-    server = MockServer()
+    server = MockServer(clock=VirtualClock())
     thread = threading.Thread(target=server.start, daemon=True)
     thread.start()
 
-    time.sleep(2)  # Wait for the server to initialize
+    assert server.ready.wait(5)  # Wait for the server to initialize
     yield
+    server.stop()
 
-def test_move_to(capsys):
+def test_move_to(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.move_to("move(100, 600)")
-    captured = capsys.readouterr()
-    assert "FIN MOVE" in captured.out
+    assert "FIN MOVE" in caplog.text
 
-def test_get_pos(capsys):
+def test_get_pos(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.get_pos()
-    captured = capsys.readouterr()
-    assert "POS=" in captured.out
+    assert "POS=" in caplog.text
 
-def test_get_stop(capsys):
+def test_get_stop(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.stop()
-    captured = capsys.readouterr()
-    assert "FIN STOP" in captured.out
+    assert "FIN STOP" in caplog.text
 
-def test_get_gripperstate(capsys):
+def test_get_gripperstate(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.get_gripstate()
-    captured = capsys.readouterr()
-    assert "GRIPSTATE=" in captured.out
+    assert "GRIPSTATE=" in caplog.text
 
-def test_get_force(capsys):
+def test_get_force(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.get_force()
-    captured = capsys.readouterr()
-    assert "FORCE=" in captured.out
+    assert "FORCE=" in caplog.text
 
-def test_calibrate(capsys):
+def test_calibrate(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.calibrate()
-    captured = capsys.readouterr()
-    assert "FIN CALIBRATE" in captured.out
+    assert "FIN CALIBRATE" in caplog.text
 
-def test_bye(capsys):
+def test_bye(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
     driver = GripperDriver()
     driver.disconnect()
-    captured = capsys.readouterr()
-    assert "ACK BYE" in captured.out
+    assert "ACK BYE" in caplog.text
+
+def test_async_concurrent_queries():
+    async def run():
+        async with AsyncGripperDriver() as driver:
+            return await asyncio.gather(*(driver.get_pos() for _ in range(20)))
+
+    responses = asyncio.run(run())
+    assert all(response.startswith("POS=") for response in responses)
+
+def test_async_move_to(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
+    async def run():
+        async with AsyncGripperDriver() as driver:
+            await driver.move_to("move(105, 600)")
+
+    asyncio.run(run())
+    assert "FIN MOVE" in caplog.text
+
+def test_async_reader_skips_malformed_telemetry(caplog):
+    async def gripper(reader, writer):
+        while (line := await reader.readline()):
+            command = line.decode().strip()
+            if command == "STATUS":
+                writer.write(b"110,550,5,0,110,0\nEND\n")
+            elif command == "POS?":
+                writer.write(b"TELEMETRY 1,2\nTELEMETRY 50,0,1\nPOS=50\nEND\n")
+            else:
+                writer.write(f"ACK {command}\nEND\n".encode())
+
+    async def run():
+        server = await asyncio.start_server(gripper, "127.0.0.1", 0)
+        async with AsyncGripperDriver(port=server.sockets[0].getsockname()[1], calibration_cache=False) as driver:
+            await driver.start_telemetry(100)
+            responses = [await driver.get_pos(), await driver.get_pos()]
+            samples = len(driver.telemetry)
+        server.close()
+        return responses, samples
+
+    assert asyncio.run(run()) == (["POS=50", "POS=50"], 2)
+    assert "malformed telemetry" in caplog.text
+
+def test_server_answers_pipelined_commands():
+    with socket.create_connection(("127.0.0.1", 8000), timeout=5) as conn:
+        conn.sendall(b"POS?\nSPEED?\nFORCE?\n")
+        received = b""
+        while received.count(b"END\n") < 3:
+            received += conn.recv(1024)
+    lines = received.decode().split()
+    assert [line.split("=")[0] for line in lines if line != "END"] == ["POS", "SPEED", "FORCE"]
+
+def test_pipeline():
+    driver = GripperDriver()
+    responses = driver.pipeline(["POS?", "GRIPSTATE?", "FORCE?"])
+    assert responses[0][0].startswith("POS=")
+    assert responses[1][0].startswith("GRIPSTATE=")
+    assert responses[2][0].startswith("FORCE=")
+
+def test_telemetry_stream():
+    driver = GripperDriver()
+    driver.start_telemetry(200, capacity=16)
+    time.sleep(0.3)
+    driver.stop_telemetry()
+    samples = driver.telemetry.last(16)
+    assert len(samples) == 16
+    assert driver.telemetry.latest() == samples[-1]
+    assert driver.telemetry.window(samples[4].t, samples[9].t) == samples[4:10]
+    assert driver.get_pos().startswith("POS=")
+
+def test_cached_queries_skip_round_trip(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port, calibration_cache=False)
+    wire = [driver.get_pos(), driver.get_gripstate()]
+    driver.refresh()
+    caplog.clear()
+    # cached answers read exactly like the gripper's, e.g. 'POS=110' rather than 'POS=110.0'
+    assert [driver.get_pos(max_age=60), driver.get_gripstate(max_age=60)] == wire
+    assert "[COMMAND] Sent" not in caplog.text
+    driver.close()
+    server.stop()
+
+def test_query_answered_before_a_move_does_not_refresh_the_cache():
+    state = GripperState()
+    since = {"width_mm": state.generation["width_mm"]}  # POS? sent
+    state.invalidate_for("MOVE(10.0)")                  # MOVE sent by another thread
+    state.update(since=since, width_mm=110.0)           # POS? answered with the pre-move width
+    assert not state.is_fresh("width_mm", 60)
+    state.update(since={"width_mm": state.generation["width_mm"]}, width_mm=10.0)
+    assert state.is_fresh("width_mm", 60) and state.width_mm == 10.0
+
+def test_motion_invalidates_cached_position(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
+    driver = GripperDriver()
+    driver.get_pos()
+    driver.move_to("move(104)")
+    caplog.clear()
+    # FIN MOVE leaves the fingers at the target, so the position is known without a query
+    assert driver.get_pos(max_age=60).startswith("POS=104")
+    assert "[COMMAND] Sent: POS?" not in caplog.text
+    assert driver.deadlines.estimate("MOVE(50.0)", driver.state).learn
+    driver.stop()
+    caplog.clear()
+    assert driver.get_pos(max_age=60).startswith("POS=104")
+    assert "[COMMAND] Sent: POS?" in caplog.text
+
+def test_binary_protocol(caplog):
+    caplog.set_level(logging.DEBUG, logger="gripper")
+    driver = GripperDriver(protocol="binary", calibration_cache=False)
+    assert driver.state.max_width == 110.0
+    assert driver.get_pos().startswith("POS=")
+    assert driver.move_to("move(103.5, 600)") == ["ACK MOVE", "FIN MOVE"]
+    assert driver.get_pos() == "POS=103.5"
+    assert driver.state.width_mm == 103.5
+    assert "FIN CALIBRATE" in caplog.text
+
+def test_fleet_gathers_from_all_members():
+    with GripperFleet([("127.0.0.1", 8000)] * 20) as fleet:
+        positions = fleet.get_pos()
+        assert len(positions) == 20
+        assert all(isinstance(width, float) for width in positions.values())
+        assert all(lines[-1] == "FIN CALIBRATE" for lines in fleet.calibrate().values())
+
+def test_fleet_skips_unreachable_member():
+    members = {"up": ("127.0.0.1", 8000), "down": ("127.0.0.1", 1)}
+    with GripperFleet(members, reconnect_interval=0.05) as fleet:
+        start = time.monotonic()
+        gripstates = fleet.get_gripstate()
+        assert time.monotonic() - start < 1
+        assert gripstates["down"] is None
+        assert gripstates["up"] is not None
+
+def test_command_metrics_and_hooks():
+    driver = GripperDriver()
+    calls = []
+    driver.add_command_hook(pre=lambda pending: calls.append(("pre", pending.cmd)),
+                            post=lambda pending, response: calls.append(("post", pending.cmd, response)))
+    driver.move_to("move(50, 500)")
+    driver.move_to("move(110, 500)")
+    assert calls[0] == ("pre", "MOVE(50.0,500.0)")
+    assert calls[1] == ("post", "MOVE(50.0,500.0)", ["ACK MOVE", "FIN MOVE"])
+    snapshot = driver.metrics.snapshot()
+    assert snapshot["latency"]["MOVE"]["total"]["count"] == 2
+    assert snapshot["latency"]["MOVE"]["send_to_ack"]["count"] == 2
+    assert snapshot["latency"]["MOVE"]["ack_to_fin"]["count"] == 2
+    assert snapshot["counters"]["bytes_sent"] > 0
+    assert snapshot["counters"]["bytes_received"] > 0
+
+def test_run_cycle():
+    driver = GripperDriver()
+    results = driver.run_cycle(["move(30, 500)", "grip(5, 25, 500)", "release(10, 500)", "move(110)"])
+    assert [(step.command, step.ok) for step in results] == [("MOVE", True), ("GRIP", True), ("RELEASE", True), ("MOVE", True)]
+    assert results[1].lines[-1] == "FIN GRIP"
+    results = driver.run_cycle(["move(80, 500)", "grip(5, 25, 500)", "release(10, 500)", "move(110)"])
+    assert [(step.command, step.ok) for step in results] == [("MOVE", True), ("GRIP", False)]
+    assert "ACK NO PART" in results[1].lines
+    assert driver.get_pos() == "POS=80.0"
+    driver.stop()
+    driver.move_to("move(110)")
+
+def test_virtual_clock_completes_motion_instantly():
+    driver = GripperDriver()
+    start = time.monotonic()
+    assert driver.move_to("move(10, 10)") == ["ACK MOVE", "FIN MOVE"]
+    assert driver.move_to("move(110, 10)") == ["ACK MOVE", "FIN MOVE"]
+    assert time.monotonic() - start < 1
+    assert driver.get_gripstate() == "GRIPSTATE=0"
+
+
+def test_server_motion_does_not_block_other_clients():
+    server = MockServer(port=0)
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    slow = GripperDriver(port=server.port)
+    fast = GripperDriver(port=server.port)
+    slow._send_command("MOVE(100.0,50.0)")
+    start = time.monotonic()
+    assert fast.get_gripstate() == "GRIPSTATE=6"
+    assert time.monotonic() - start < 1
+    assert slow._receive_response() == ["ACK MOVE", "FIN MOVE"]
+    slow.close()
+    fast.close()
+    server.stop()
+
+def test_move_async_completes():
+    driver = GripperDriver()
+    handle = driver.move_async("move(40, 500)")
+    assert handle.wait(5) is True
+    assert handle.width == 40.0 and handle.progress() == 1.0
+    assert driver.get_pos() == "POS=40.0"
+    assert driver.move_async("move(500)") is None
+    driver.close()
+
+def test_move_async_can_be_stopped_mid_move():
+    server = MockServer(port=0, clock=RealClock(speedup=10))
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port)
+    handle = driver.move_async("move(10, 100)")  # 10 s of simulated motion
+    time.sleep(0.2)
+    assert not handle.done()
+    assert 10 < handle.position() < 110
+    assert 0 < handle.progress() < 1
+    assert handle.cancel() is True
+    assert handle.completed is False and 10 < handle.width < 110
+    assert driver.get_pos() == f"POS={handle.width}"
+
+    other = GripperDriver(port=server.port)
+    first = driver.move_async("move(10, 100)")
+    other._send_command("MOVE(100.0,100.0)")  # preempts the first motion
+    assert first.wait(5) is False
+    assert other._receive_response() == ["ACK MOVE", "FIN MOVE"]
+    other.close()
+    driver.close()
+    server.stop()
+
+def test_reconnects_after_power_blip():
+    server = MockServer(port=0)
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    port = server.port
+    driver = GripperDriver(port=port)
+    pending = driver._send_command("MOVE(10.0,10.0)")
+    start = time.monotonic()
+    server.stop()
+    assert driver._receive_response() is None
+    assert isinstance(pending.error, GripperConnectionError)
+    assert time.monotonic() - start < 1
+
+    server = MockServer(port=port, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    assert driver._reconnector.wait(5)
+    assert driver.state.is_fresh("width_mm", 5)  # resynced with STATUS on reconnect
+    assert driver.get_pos() == "POS=110"
+    assert driver.metrics.snapshot()["counters"]["reconnects"] == 1
+    driver.close()
+    server.stop()
+
+def test_lost_link_is_reported_through_last_error():
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port, reconnect_budget=0.2, calibration_cache=False)
+    assert driver.get_pos() is not None and driver.last_error is None
+    server.stop()
+    assert driver.get_pos() is None
+    assert isinstance(driver.last_error, GripperConnectionError)
+    driver.close()
+
+def test_concurrent_queries_are_coalesced():
+    server = MockServer(port=0, clock=RealClock(speedup=10))
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port)
+    driver._send_command("MOVE(60.0,100.0)")  # queries queue up behind the move
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(driver.get_pos())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert driver._receive_response() == ["ACK MOVE", "FIN MOVE"]
+    for thread in threads:
+        thread.join()
+    assert results == ["POS=60.0"] * 8
+    assert driver.metrics.snapshot()["counters"]["coalesced"] == 7
+    assert driver.get_pos() == "POS=60.0"  # answered query is not joined
+    assert driver.metrics.snapshot()["counters"]["coalesced"] == 7
+    driver.close()
+    server.stop()
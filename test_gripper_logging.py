@@ -0,0 +1,21 @@
+# Unit Tests for the queued logging pipeline
+
+import io
+import json
+import logging
+from gripper_logging import LazyJoin, setup_logging, stop_logging
+
+def test_queued_json_logging():
+    stream = io.StringIO()
+    setup_logging("DEBUG", handler=logging.StreamHandler(stream), json_format=True)
+    try:
+        logging.getLogger("gripper.test").debug("[E_SUCCESS] Received: %s", LazyJoin(["ACK MOVE", "FIN MOVE"]),
+                                                  extra={"command": "MOVE(20.0)", "latency": 0.5, "gripstate": 0})
+    finally:
+        stop_logging()
+    entry = [json.loads(line) for line in stream.getvalue().splitlines() if '"gripper.test"' in line][0]
+    assert entry["message"] == "[E_SUCCESS] Received: ACK MOVE, FIN MOVE"
+    assert entry["command"] == "MOVE(20.0)"
+    assert entry["latency"] == 0.5
+    assert entry["gripstate"] == 0
+    assert logging.getLogger("gripper").propagate
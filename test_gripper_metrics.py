@@ -0,0 +1,31 @@
+# Unit Tests for the driver latency metrics
+
+from types import SimpleNamespace
+
+from gripper_metrics import DriverMetrics, Histogram
+
+def test_histogram_quantiles():
+    histogram = Histogram(bounds=(0.001, 0.01, 0.1))
+    for _ in range(90):
+        histogram.observe(0.0005)
+    for _ in range(10):
+        histogram.observe(0.05)
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) <= 0.001
+    assert 0.01 < histogram.quantile(0.99) <= 0.1
+    assert histogram.snapshot()["buckets"] == {"0.001": 90, "0.01": 90, "0.1": 100, "+Inf": 100}
+
+def test_prometheus_export():
+    metrics = DriverMetrics()
+    metrics.increment("commands", 2)
+    metrics.histogram("MOVE", "total").observe(0.2)
+    text = metrics.to_prometheus()
+    assert "gripper_commands_total 2" in text
+    assert 'gripper_command_latency_seconds_bucket{command="MOVE",phase="total",le="0.25"} 1' in text
+    assert 'gripper_command_latency_seconds_count{command="MOVE",phase="total"} 1' in text
+
+def test_latency_is_filed_by_command_name_and_nowait():
+    metrics = DriverMetrics()
+    for cmd in ("MOVE(20.0,500.0)", "MOVE(30.0,500.0) NOWAIT", "SEQ MOVE(30.0,500.0);GRIP(5.0,25.0,500.0)", "POS?"):
+        metrics.record(SimpleNamespace(cmd=cmd, sent_at=1.0, ack_at=None, done_at=1.1))
+    assert sorted(metrics.snapshot()["latency"]) == ["MOVE", "MOVE NOWAIT", "POS?", "SEQ"]
@@ -0,0 +1,27 @@
+# Unit Tests for the reconnection backoff
+
+import time
+from reconnect import Backoff, Reconnector
+
+def test_backoff_grows_to_maximum_with_jitter():
+    backoff = Backoff(initial=0.01, maximum=0.08, multiplier=2.0, jitter=0.2)
+    delays = [backoff.next_delay() for _ in range(6)]
+    for delay, nominal in zip(delays, [0.01, 0.02, 0.04, 0.08, 0.08, 0.08]):
+        assert 0.8 * nominal <= delay <= 1.2 * nominal
+    backoff.reset()
+    assert backoff.next_delay() <= 0.012
+
+def test_reconnector_retries_until_connected():
+    results = iter([False, False, True])
+    reconnector = Reconnector(lambda: next(results), Backoff(initial=0.001))
+    reconnector.start()
+    assert reconnector.wait(1)
+    assert reconnector.attempts == 3
+
+def test_reconnector_gives_up_after_budget():
+    reconnector = Reconnector(lambda: False, Backoff(initial=0.01), budget=0.05)
+    start = time.monotonic()
+    reconnector.start()
+    assert not reconnector.wait(1)
+    assert reconnector.gave_up
+    assert time.monotonic() - start < 0.5
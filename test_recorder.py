@@ -0,0 +1,47 @@
+# Unit Tests for the session recorder and replay
+
+import threading
+import pytest
+import recorder
+import replay
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, VirtualClock
+
+def record_session(path):
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    driver = GripperDriver(port=server.port)
+    with recorder.Recorder(str(path)) as session:
+        session.attach(driver)
+        driver.move_to("move(30, 500)")
+        driver.grip("grip(5, 25, 500)")
+        driver.get_pos()
+    driver.close()
+    server.stop()
+
+def test_records_commands_responses_and_state(tmp_path):
+    path = tmp_path / "session.grec"
+    record_session(path)
+    assert (path.stat().st_size - recorder.HEADER_SIZE) % recorder.RECORD.size == 0
+    records = recorder.read(str(path))
+    assert [r.text for r in records if r.kind == recorder.COMMAND] == ["MOVE(30.0,500.0)", "GRIP(5.0,25.0,500.0)", "POS?"]
+    assert [r.text for r in records if r.command == 3 and r.kind == recorder.RESPONSE] == ["POS=30.0"]
+    assert sum(r.kind == recorder.STATE for r in records) == 3
+    assert all(a.t <= b.t for a, b in zip(records, records[1:]) if a.command != b.command)
+
+def test_replay_reproduces_responses(tmp_path):
+    path = tmp_path / "session.grec"
+    record_session(path)
+    results = replay.replay(str(path), speedup=None)
+    assert [r.command for r in results] == ["MOVE(30.0,500.0)", "GRIP(5.0,25.0,500.0)", "POS?"]
+    assert all(r.recorded == r.replayed for r in results)
+
+def test_load_as_numpy_array(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "session.grec"
+    record_session(path)
+    records = recorder.load(str(path))
+    assert records.dtype.itemsize == recorder.RECORD.size
+    assert list(records["text"][records["kind"] == recorder.COMMAND]) == [b"MOVE(30.0,500.0)", b"GRIP(5.0,25.0,500.0)", b"POS?"]
+    assert np.all(np.diff(records["t"][records["kind"] == recorder.STATE]) > 0)
@@ -0,0 +1,74 @@
+# Unit Tests for the shared-memory state snapshot
+
+import multiprocessing
+import threading
+import uuid
+import pytest
+from gripper_driver import GripperDriver, GripperState
+from gripper_sim import MockServer, VirtualClock
+from shared_state import SEQ, SharedStatePublisher, SharedStateReader
+
+def read_width(name, results):
+    with SharedStateReader(name) as reader:
+        results.put(reader.read().width_mm)
+
+def test_driver_publishes_state():
+    server = MockServer(port=0, clock=VirtualClock())
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    name = f"gripper-test-{uuid.uuid4().hex[:8]}"
+    driver = GripperDriver(port=server.port, shared_state=name)
+    with SharedStateReader(name) as reader:
+        snapshot = reader.read()
+        assert snapshot.seq > 0 and snapshot.seq % 2 == 0
+        driver.move_to("move(60, 500)")
+        driver.get_pos()
+        assert reader.read().width_mm == 60.0
+        assert reader.read().seq > snapshot.seq
+
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=read_width, args=(name, results))
+        process.start()
+        assert results.get(timeout=10) == 60.0
+        process.join(10)
+    driver.close()
+    server.stop()
+
+def test_reads_are_consistent_while_writing():
+    name = f"gripper-test-{uuid.uuid4().hex[:8]}"
+    publisher = SharedStatePublisher(name)
+    state = GripperState()
+    stop = threading.Event()
+
+    def write():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            state.width_mm = state.speed = state.torque = state.min_width = state.max_width = float(i)
+            state.gripstate = i
+            publisher.publish(state)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    with SharedStateReader(name) as reader:
+        for _ in range(20000):
+            snapshot = reader.read()
+            assert snapshot.width_mm == snapshot.speed == snapshot.torque == snapshot.max_width == snapshot.gripstate
+    stop.set()
+    writer.join()
+    publisher.close()
+
+def test_read_gives_up_on_a_writer_that_died_mid_update():
+    name = f"gripper-test-{uuid.uuid4().hex[:8]}"
+    publisher = SharedStatePublisher(name)
+    state = GripperState()
+    state.width_mm = 42.0
+    publisher.publish(state)
+    with SharedStateReader(name, timeout=0.05) as reader:
+        assert reader.read().width_mm == 42.0
+        SEQ.pack_into(publisher._buf, 0, reader.read().seq + 1)  # odd: write never finished
+        assert reader.read().width_mm == 42.0
+    with SharedStateReader(name, timeout=0.05) as reader:
+        with pytest.raises(TimeoutError):
+            reader.read()
+    publisher.close()
@@ -0,0 +1,22 @@
+# Unit Tests for the telemetry ring buffer
+
+from telemetry import TelemetryBuffer, parse_telemetry_line
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = TelemetryBuffer(capacity=4)
+    for i in range(10):
+        buffer.append(float(i), i * 10.0, 550.0, 5.0)
+    assert len(buffer) == 4
+    assert [sample.t for sample in buffer.last(10)] == [6.0, 7.0, 8.0, 9.0]
+    assert buffer.latest().width == 90.0
+
+def test_window_selects_time_range():
+    buffer = TelemetryBuffer(capacity=8)
+    for i in range(12):
+        buffer.append(float(i), float(i), 0.0, 0.0)
+    assert [sample.t for sample in buffer.window(5.0, 7.0)] == [5.0, 6.0, 7.0]
+    assert [sample.t for sample in buffer.window(10.5)] == [11.0]
+    assert buffer.window(0.0, 3.0) == []
+
+def test_parse_telemetry_line():
+    assert parse_telemetry_line("TELEMETRY 110.0,550.0,5") == (110.0, 550.0, 5.0)
@@ -0,0 +1,45 @@
+# Unit Tests for the link watchdog
+
+import threading
+import time
+from gripper_driver import GripperDriver
+from gripper_sim import MockServer, RealClock
+
+def start_server(clock=None):
+    server = MockServer(port=0, clock=clock)
+    threading.Thread(target=server.start, daemon=True).start()
+    assert server.ready.wait(5)
+    return server
+
+def test_detects_silent_link_within_bound():
+    server = start_server()
+    driver = GripperDriver(port=server.port, watchdog=0.3, calibration_cache=False)
+    assert driver.get_pos() is not None
+    # The gripper stops answering but the connection stays open (e.g. a pulled cable)
+    frozen = time.monotonic()
+    server._loop.call_soon_threadsafe(time.sleep, 1.5)
+    while not driver.watchdog.link_losses and time.monotonic() - frozen < 2:
+        time.sleep(0.005)
+    assert time.monotonic() - frozen < 0.3 + 0.15
+    assert driver.metrics.snapshot()["counters"]["link_losses"] >= 1
+    assert driver._reconnector.wait(5) and driver.get_pos() is not None
+    driver.close()
+    server.stop()
+
+def test_heartbeats_answered_during_long_move():
+    server = start_server(RealClock(speedup=10))
+    driver = GripperDriver(port=server.port, watchdog=0.2, calibration_cache=False)
+    assert driver.move_to("move(10, 100)") is not None  # 1 s without any response to the move
+    assert driver.watchdog.link_losses == 0
+    assert driver.metrics.snapshot()["counters"]["heartbeats"] >= 3
+    driver.close()
+    server.stop()
+
+def test_long_binary_move_keeps_link():
+    server = start_server(RealClock(speedup=10))
+    driver = GripperDriver(port=server.port, protocol="binary", watchdog=0.3, calibration_cache=False)
+    response = driver.move_to("move(10, 40)")  # about 1 s without any frame from the gripper
+    assert response is not None and response[-1].startswith("FIN MOVE")
+    assert driver.watchdog.link_losses == 0 and driver.connected
+    driver.close()
+    server.stop()
@@ -0,0 +1,26 @@
+# Unit Tests for the binary WSG codec
+
+import math
+import wsg_codec
+
+def test_crc16_ccitt():
+    assert wsg_codec.crc16(b"123456789") == 0x29B1
+
+def test_command_round_trip():
+    frame = wsg_codec.encode_gcl("GRIP(5.0,25.0)")
+    frames = wsg_codec.FrameDecoder().feed(frame)
+    assert len(frames) == 1
+    assert wsg_codec.decode_args(*frames[0]) == ("GRIP", (5.0, 25.0, None))
+
+def test_decoder_resyncs_after_corruption():
+    good = wsg_codec.encode_result("POS", 42.0)
+    corrupt = bytearray(wsg_codec.encode_gcl("POS?"))
+    corrupt[-1] ^= 0xFF
+    decoder = wsg_codec.FrameDecoder()
+    frames = decoder.feed(b"noise" + bytes(corrupt) + good[:4]) + decoder.feed(good[4:])
+    assert decoder.crc_errors == 1
+    assert [wsg_codec.decode_response(*frame) for frame in frames] == [(wsg_codec.E_SUCCESS, 42.0)]
+
+def test_missing_arguments_are_nan():
+    _, payload = wsg_codec.FrameDecoder().feed(wsg_codec.encode_command("MOVE", [20.0]))[0]
+    assert math.isnan(wsg_codec.COMMANDS["MOVE"][1].unpack(payload)[1])
@@ -0,0 +1,135 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+import logging
+import socket
+import threading
+import time
+
+logger = logging.getLogger("gripper.watchdog")
+
+
+class Watchdog:
+    '''
+        Detects a dead link to the gripper within `bound` seconds and starts the recovery early.
+
+        A half-open TCP connection (cable pulled, gripper powered off) otherwise goes unnoticed until
+        a command misses its deadline. The watchdog watches the time since the driver last received
+        any data: after `interval` seconds of silence it sends a 'HEARTBEAT', which the gripper answers
+        out of band even during a long MOVE; after `bound` seconds of silence the link is declared down
+        and the socket is closed, so the driver fails the commands in flight and reconnects at once.
+        While responses or telemetry are flowing the silence never reaches `interval` and no heartbeat
+        is sent. TCP keepalive and TCP_USER_TIMEOUT are set to the same bound where the OS supports them.
+        The binary protocol has no heartbeat command, so a long command is indistinguishable from a
+        silent link; binary links rely on TCP keepalive and TCP_USER_TIMEOUT alone and the silence
+        bound is not applied to them.
+
+        Attributes:
+            - driver (GripperDriver): Driver whose link is watched
+            - bound (float): Seconds of silence after which the link is declared down
+            - interval (float): Seconds of silence after which a heartbeat is sent
+            - link_losses (int): Links declared down so far
+    '''
+
+    def __init__(self, driver, bound=0.5, interval=None):
+        self.driver = driver
+        self.bound = bound
+        self.interval = interval if interval is not None else bound / 3
+        self.link_losses = 0
+        self._lost_socket = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def configure(self, sock):
+        '''
+            Enables TCP keepalive on a freshly connected socket, probing after `interval` seconds of
+            idleness and giving up within `bound`. Unix domain sockets are left unchanged.
+        '''
+
+        if sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        idle = max(1, round(self.interval))  # the keepalive options take whole seconds
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", idle), ("TCP_KEEPCNT", 2),
+                              ("TCP_USER_TIMEOUT", max(1, int(self.bound * 1000)))):
+            if hasattr(socket, option):
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+                except OSError as e:
+                    logger.debug("[WARNING] Cannot set %s: %s", option, e)
+
+    def start(self):
+        '''
+            Starts watching the link on a background thread.
+        '''
+
+        if self.driver.binary or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="gripper-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        '''
+            Stops watching and waits for the background thread to exit.
+        '''
+
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        driver = self.driver
+        last_heartbeat = 0.0
+        delay = self.interval
+        while not self._stopped.wait(delay):
+            delay = self.interval
+            sock = driver.socket
+            if not driver.connected or sock is None:
+                continue
+            now = time.monotonic()
+            silence = now - driver.last_received
+            if silence >= self.bound:
+                self._link_lost(sock, silence)
+                continue
+            if silence >= self.interval and now - last_heartbeat >= self.interval:
+                driver._send_heartbeat()
+                last_heartbeat = now
+            # wake up when the next heartbeat is due or the link would exceed its bound
+            heartbeat_due = max(driver.last_received, last_heartbeat) + self.interval
+            delay = max(0.001, min(heartbeat_due, driver.last_received + self.bound) - now)
+
+    def _link_lost(self, sock, silence):
+        '''
+            Declares the link down: closing the socket wakes the driver's reader thread, which fails
+            the commands in flight and starts the reconnection.
+        '''
+
+        if sock is not self.driver.socket or sock is self._lost_socket:
+            return
+        self._lost_socket = sock
+        self.link_losses += 1
+        self.driver.metrics.increment("link_losses")
+        logger.error("[E_TIMEOUT] No data from gripper for %.3f s, link considered down.", silence)
+        self.driver._close_socket(sock)
@@ -0,0 +1,232 @@
+'''
+
+    Copyright (c) 2025 Ashwin Murali <ashwin.murali99@gmail.com>
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+
+'''
+
+# Binary command codec modeled on the WSG binary protocol, shared by GripperDriver and MockServer.
+#
+# Frame layout (little endian):
+#     preamble (3 x 0xAA) | command id (u8) | payload length (u16) | payload | CRC16 (u16)
+#
+# The CRC is CRC-16/CCITT (polynomial 0x1021, initial value 0xFFFF) over everything before it.
+# Command payloads are packed floats; NaN stands for "use the gripper default".
+# Response payloads start with a u16 status code. Intermediate responses (e.g. 'ACK MOVE')
+# carry E_CMD_PENDING and their text; the final response of a command carries E_SUCCESS or
+# an error code followed by the packed result of queries.
+
+import binascii
+import math
+import struct
+
+PREAMBLE = b"\xAA\xAA\xAA"
+HEADER = struct.Struct("<3sBH")
+CRC = struct.Struct("<H")
+STATUS_CODE = struct.Struct("<H")
+
+# Status codes of the WSG protocol
+E_SUCCESS = 0
+E_NOT_AVAILABLE = 1
+E_NOT_INITIALIZED = 3
+E_FEATURE_NOT_SUPPORTED = 5
+E_TIMEOUT = 7
+E_CHECKSUM_ERROR = 11
+E_NOT_ENOUGH_PARAMS = 13
+E_CMD_UNKNOWN = 14
+E_CMD_FORMAT_ERROR = 15
+E_CMD_FAILED = 18
+E_CMD_ABORTED = 19
+E_CMD_PENDING = 26
+E_RANGE_ERROR = 28
+
+# GCL command name -> (command id, argument struct)
+COMMANDS = {
+    "BYE": (0x06, None),
+    "CALIBRATE": (0x20, None),
+    "MOVE": (0x21, struct.Struct("<ff")),
+    "STOP": (0x22, None),
+    "GRIP": (0x25, struct.Struct("<fff")),
+    "RELEASE": (0x26, struct.Struct("<ff")),
+    "STATUS": (0x40, None),
+    "GRIPSTATE?": (0x41, None),
+    "POS?": (0x43, None),
+    "SPEED?": (0x44, None),
+    "FORCE?": (0x45, None),
+}
+COMMAND_NAMES = {command_id: name for name, (command_id, _) in COMMANDS.items()}
+
+# Result of a query command: (value key, result struct)
+RESULTS = {
+    0x40: ("STATUS", struct.Struct("<fffffB")),
+    0x41: ("GRIPSTATE", struct.Struct("<B")),
+    0x43: ("POS", struct.Struct("<f")),
+    0x44: ("SPEED", struct.Struct("<f")),
+    0x45: ("FORCE", struct.Struct("<f")),
+}
+RESULT_IDS = {key: command_id for command_id, (key, _) in RESULTS.items()}
+
+
+def crc16(data, crc=0xFFFF):
+    '''
+        CRC-16/CCITT of `data`.
+    '''
+
+    return binascii.crc_hqx(data, crc)
+
+
+class ProtocolError(ValueError):
+    '''
+        Raised for frames or commands that cannot be encoded or decoded.
+    '''
+
+
+def encode_frame(command_id, payload=b""):
+    '''
+        Builds a complete frame for `command_id` carrying `payload`.
+    '''
+
+    frame = HEADER.pack(PREAMBLE, command_id, len(payload)) + payload
+    return frame + CRC.pack(crc16(frame))
+
+
+def encode_command(name, args=()):
+    '''
+        Encodes the GCL command `name` with float arguments `args`; missing arguments become NaN.
+    '''
+
+    try:
+        command_id, arg_struct = COMMANDS[name]
+    except KeyError:
+        raise ProtocolError(f"Command {name} has no binary encoding") from None
+    if arg_struct is None:
+        return _PLAIN_FRAMES[name]
+    missing = arg_struct.size // 4 - len(args)
+    return encode_frame(command_id, arg_struct.pack(*args, *_NAN_PADDING[:missing]))
+
+
+def encode_gcl(cmd):
+    '''
+        Encodes a GCL string as formatted by the driver, e.g. 'POS?' or 'MOVE(20.0,500.0)'.
+    '''
+
+    name, _, rest = cmd.partition("(")
+    rest = rest.rstrip(")")
+    args = [float(v) for v in rest.split(",")] if rest else []
+    return encode_command(name, args)
+
+
+def decode_args(command_id, payload):
+    '''
+        Unpacks the arguments of a command frame; NaN arguments are returned as None.
+    '''
+
+    try:
+        name, arg_struct = _DECODE[command_id]
+    except KeyError:
+        raise ProtocolError(f"Unknown command id 0x{command_id:02X}") from None
+    if arg_struct is None:
+        return name, ()
+    if len(payload) != arg_struct.size:
+        raise ProtocolError(f"Invalid payload length for {name}")
+    return name, tuple(v if v == v else None for v in arg_struct.unpack(payload))
+
+
+def encode_response(command_id, status, data=b""):
+    '''
+        Builds a response frame with a status code and optional data.
+    '''
+
+    return encode_frame(command_id, STATUS_CODE.pack(status) + data)
+
+
+def encode_result(key, value):
+    '''
+        Builds the final E_SUCCESS response carrying the result of a query, e.g. ('POS', 110.0).
+    '''
+
+    command_id = RESULT_IDS[key]
+    result_struct = RESULTS[command_id][1]
+    values = value if isinstance(value, tuple) else (value,)
+    return encode_response(command_id, E_SUCCESS, result_struct.pack(*values))
+
+
+def decode_response(command_id, payload):
+    '''
+        Splits a response payload into (status, value). The value is the unpacked query result
+        for successful queries, the decoded text for other responses, or None.
+    '''
+
+    status, = STATUS_CODE.unpack_from(payload)
+    data = payload[STATUS_CODE.size:]
+    if status == E_SUCCESS and command_id in RESULTS and data:
+        values = RESULTS[command_id][1].unpack(data)
+        return status, values if len(values) > 1 else values[0]
+    return status, data.decode("utf-8", "replace") if data else None
+
+
+_NAN_PADDING = (math.nan,) * 3
+_PLAIN_FRAMES = {name: encode_frame(command_id) for name, (command_id, arg_struct) in COMMANDS.items() if arg_struct is None}
+_DECODE = {command_id: (name, arg_struct) for name, (command_id, arg_struct) in COMMANDS.items()}
+
+
+class FrameDecoder:
+    '''
+        Incremental decoder that turns a byte stream into (command id, payload) tuples.
+
+        Bytes before a preamble are skipped; frames with a bad CRC are dropped and counted
+        in `crc_errors`, after which decoding resynchronizes on the next preamble.
+    '''
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.crc_errors = 0
+
+    def feed(self, data):
+        '''
+            Adds received bytes and returns the list of complete frames.
+        '''
+
+        if self._buffer:
+            self._buffer += data
+            data = self._buffer
+        frames = []
+        pos, size = 0, len(data)
+        while True:
+            if data[pos:pos + 3] != PREAMBLE:
+                start = data.find(PREAMBLE, pos)
+                if start == -1:
+                    pos = max(pos, size - len(PREAMBLE) + 1)
+                    break
+                pos = start
+            if size - pos < HEADER.size:
+                break
+            _, command_id, length = HEADER.unpack_from(data, pos)
+            end = pos + HEADER.size + length
+            if size < end + CRC.size:
+                break
+            crc, = CRC.unpack_from(data, end)
+            if crc != crc16(data[pos:end]):
+                self.crc_errors += 1
+                pos += 1
+                continue
+            frames.append((command_id, bytes(data[pos + HEADER.size:end])))
+            pos = end + CRC.size
+        self._buffer = bytearray(data[pos:]) if pos < size else bytearray()
+        return frames